@@ -0,0 +1,65 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Compares the memory use and iteration speed of the data read by read_table_data into a
+DataSet of Row objects, a DataSet of CompactRow objects and a ColumnarDataSet.
+
+Usage: python benchmarks/dataset_backends.py [num_rows] [num_columns]
+
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from campbellsciparser import cr
+
+
+def write_table_file(path, num_rows, num_columns):
+    with open(path, 'w') as f:
+        f.write(','.join('Label_' + str(i) for i in range(num_columns)) + '\n')
+        for i in range(num_rows):
+            f.write(','.join(str(i + j / 10) for j in range(num_columns)) + '\n')
+
+
+def measure(path, **read_options):
+    tracemalloc.start()
+    data = cr.read_table_data(path, header_row=0, **read_options)
+    memory, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    start = time.perf_counter()
+    for row in data:
+        for name, value in row.items():
+            pass
+    iteration_time = time.perf_counter() - start
+
+    return memory, iteration_time
+
+
+def main():
+    num_rows = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    num_columns = int(sys.argv[2]) if len(sys.argv) > 2 else 30
+
+    temp_dir = tempfile.mkdtemp()
+    try:
+        path = os.path.join(temp_dir, 'table_data.dat')
+        write_table_file(path, num_rows, num_columns)
+
+        print("{0} rows x {1} columns".format(num_rows, num_columns))
+        for name, read_options in (('DataSet', {}),
+                                   ('DataSet (CompactRow)', {'compact_rows': True}),
+                                   ('ColumnarDataSet', {'columnar': True})):
+            memory, iteration_time = measure(path, **read_options)
+            print("{name:<24} {memory:>8.1f} MB {time:>8.3f} s".format(
+                name=name, memory=memory / 2 ** 20, time=iteration_time))
+    finally:
+        shutil.rmtree(temp_dir)
+
+
+if __name__ == '__main__':
+    main()
@@ -9,17 +9,175 @@ CR-type dataloggers.
 
 """
 
+import abc
+import bisect
+import bz2
 import csv
+import functools
+import glob
+import gzip
+import hashlib
+import io
+import itertools
+import json
+import locale
 import os
+import struct
+import tempfile
+import time
 
-from collections import defaultdict, namedtuple
-from datetime import datetime
+from collections import OrderedDict, defaultdict, deque, namedtuple
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from datetime import datetime, timedelta
 
+from campbellsciparser.dataset import ColumnarDataSet
+from campbellsciparser.dataset import CompactRow
 from campbellsciparser.dataset import DataSet
 from campbellsciparser.dataset import Row
+from campbellsciparser.dataset import RowHeader
 
 import pytz
 
+try:
+    import lzma
+except ImportError:  # Python built without xz support
+    lzma = None
+
+# Number of bytes at the head of a file, and right before a resume cursor's offset, used to
+# fingerprint the file the cursor was taken from.
+CURSOR_CHECK_SIZE = 512
+
+ReadCursor = namedtuple(
+    'ReadCursor', ['byte_offset', 'line_num', 'device', 'inode', 'digest'])
+ReadCursor.__doc__ = """Opaque position in an input file to resume reading from.
+
+Holds the byte offset and (zero-based) line number of the next unread line, along with the
+file's identity (device, inode and a digest of its head and of the bytes preceding the
+offset). Being a plain tuple of numbers and strings, a cursor can be stored between runs,
+e.g. as JSON, and restored with ReadCursor(*values).
+
+"""
+
+ReadResult = namedtuple('ReadResult', ['data', 'cursor'])
+
+# Results of reading a batch of files: one FileReadResult per file, holding either the file's
+# data or the error raised while reading it.
+FileReadResult = namedtuple('FileReadResult', ['infile_path', 'data', 'error'])
+FilesReadResult = namedtuple('FilesReadResult', ['data', 'errors'])
+
+# Default number of lines between two entries of a line index, and the suffix appended to an
+# input file's path to get the path of its line index sidecar file.
+LINE_INDEX_INTERVAL = 1000
+LINE_INDEX_SUFFIX = '.idx'
+
+# Campbell Scientific binary time stamps count seconds (and nanoseconds) since this epoch.
+CAMPBELL_EPOCH = datetime(1990, 1, 1)
+
+# Proleptic Gregorian ordinal of the Unix epoch's date, 1970-01-01.
+_EPOCH_ORDINAL = datetime(1970, 1, 1).toordinal()
+
+# Number of ASCII header lines preceding the binary records of a TOB1 file.
+TOB1_HEADER_LINES = 5
+
+# Number of ASCII header lines preceding the data frames of a TOB3 file.
+TOB3_HEADER_LINES = 6
+
+# Size in bytes of the header (time stamp and first record number) and of the footer (flags
+# and validation stamp) of a TOB3 data frame.
+TOB3_FRAME_HEADER_SIZE = 12
+TOB3_FRAME_FOOTER_SIZE = 4
+
+# Number of binary records read from a file at a time.
+BINARY_READ_RECORDS = 4096
+
+# Number of rows whose time columns are parsed together when parsing time in batches.
+TIME_PARSING_BATCH_ROWS = 10000
+
+# Approximate size in bytes of the chunks of whole lines a file is split into when read in
+# several processes, and of the blocks read when counting the chunks' lines.
+PARALLEL_READ_CHUNK_SIZE = 4 * 1024 * 1024
+PARALLEL_READ_BLOCK_SIZE = 1024 * 1024
+
+# Default maximum number of output files kept open at a time when exporting array ids, and
+# the size in bytes of each output file's write buffer when exporting.
+EXPORT_MAX_OPEN_FILES = 64
+EXPORT_BUFFER_SIZE = 64 * 1024
+
+# Default number of seconds between two checks for new lines when following a file.
+FOLLOW_POLL_INTERVAL = 0.25
+
+TOB1Header = namedtuple(
+    'TOB1Header', ['file_info', 'names', 'units', 'processing', 'data_types'])
+
+TOB3Header = namedtuple(
+    'TOB3Header', ['file_info', 'table_info', 'names', 'units', 'processing', 'data_types'])
+
+TOB3Frame = namedtuple('TOB3Frame', ['byte_offset', 'time_stamp', 'record_num', 'num_records'])
+TOB3Frame.__doc__ = """Valid data frame (or minor frame) of a TOB3 file.
+
+Holds the byte offset of the frame's header, the time stamp and record number of its first
+record, and its number of records.
+
+"""
+
+# Struct format characters of the fixed size binary data types, in little-endian byte order.
+# FP2 values are big-endian and byte swapped when decoded.
+_BINARY_DATA_TYPE_FORMATS = {
+    'IEEE4': 'f', 'IEEE4L': 'f', 'IEEE8': 'd', 'IEEE8L': 'd',
+    'IEEE4B': '4s', 'IEEE8B': '8s',
+    'FP2': 'H',
+    'ULONG': 'I', 'UINT4': 'I', 'LONG': 'i', 'INT4': 'i', 'UINT2': 'H', 'INT2': 'h',
+    'BOOL': '?', 'BOOL2': 'H', 'BOOL4': 'I',
+    'SECNANO': 'II'
+}
+
+# Nanoseconds per unit of the TOB3 frame time resolutions, and of the record interval units.
+_TOB3_FRAME_TIME_RESOLUTIONS = {
+    'SECNSEC': 1, 'SECUSEC': 1000, 'SEC10USEC': 10000, 'SEC100USEC': 100000,
+    'SECMSEC': 1000000, 'SEC10MSEC': 10000000
+}
+_TIME_UNIT_NANOSECONDS = {
+    'NSEC': 1, 'USEC': 1000, 'MSEC': 1000000, 'SEC': 1000000000, 'MIN': 60000000000,
+    'HR': 3600000000000, 'HOUR': 3600000000000, 'DAY': 86400000000000
+}
+
+# TOB3 frame footer flags. The footer's lower bits hold the size of a minor frame, and its
+# upper 16 bits the frame's validation stamp.
+_TOB3_EMPTY_FRAME = 0x2000
+_TOB3_MINOR_FRAME = 0x4000
+_TOB3_MINOR_FRAME_SIZE_MASK = 0x7FF
+
+# Part (date or time of day) of the time each time format holds, and the value standing in
+# for it when parsing the other part on its own. ISO 8601 time stamps hold both parts, split
+# after the date, and are stood in for by their time of day.
+_TIME_FORMAT_PARTS = {
+    '%Y': ('date', '1900'), '%y': ('date', '00'), '%j': ('date', '1'), '%m': ('date', '1'),
+    '%d': ('date', '1'),
+    '%H': ('time', '0'), '%M': ('time', '0'), '%S': ('time', '0'), '%H%M': ('time', '0'),
+    '%Y-%m-%d %H:%M:%S': ('date_time', ' 00:00:00'),
+    '%Y-%m-%d %H:%M:%S.%f': ('date_time', ' 00:00:00.0')
+}
+
+_FP2_VALUES = []  # Decoded FP2 values, by byte swapped raw value. Filled when first needed.
+
+# Two digit strings of the seconds of a minute, used when formatting datetimes.
+_SECOND_STRINGS = tuple('{0:02d}'.format(second) for second in range(60))
+
+_HOUR_MINUTE_VALUES = {}  # (Hour, minute) of valid Hour/Minute strings. Filled when first needed.
+
+# Openers of compressed input files, by the magic bytes starting them, and the types of the
+# file objects they return. Compressed input is decompressed as it is read.
+_COMPRESSED_FILE_OPENERS = [(b'\x1f\x8b', gzip.open), (b'BZh', bz2.open)]
+_COMPRESSED_FILE_TYPES = (gzip.GzipFile, bz2.BZ2File)
+if lzma is not None:
+    _COMPRESSED_FILE_OPENERS.append((b'\xfd7zXZ\x00', lzma.open))
+    _COMPRESSED_FILE_TYPES += (lzma.LZMAFile, )
+
+# How to keep following a file past its end (see _follow_records).
+_FollowOptions = namedtuple('_FollowOptions', ['poll_interval', 'idle_timeout'])
+
+_TIME_ZONE_LOCALIZERS = {}  # _TimeZoneLocalizer by pytz time zone. Filled when first needed.
+
 
 class ArrayIdsInfoValueError(Exception):
     """Raised whenever provided array ids info is insufficient. """
@@ -36,6 +194,16 @@ class DataSetTypeError(Exception):
     pass
 
 
+class FileFormatError(Exception):
+    """Raised whenever an input file's format is not recognized or not supported. """
+    pass
+
+
+class HeaderMismatchError(Exception):
+    """Raised whenever an output file's header does not match the columns exported to it. """
+    pass
+
+
 class TimeColumnValueError(Exception):
     """Raised whenever there are problems parsing specific time columns. """
     pass
@@ -55,6 +223,663 @@ class UnknownPytzTimeZoneError(Exception):
     pass
 
 
+class _ReadPosition(object):
+    """Byte offset and line number of the next line to read from an input file.
+
+    Updated in place by the row iterators, so that a resume cursor can be made once
+    iteration is done.
+
+    Parameters
+    ----------
+    byte_offset : int, optional
+        Offset of the next line to read.
+    line_num : int, optional
+        Zero-based number of the next line to read.
+    device : int, optional
+        Device of the file read.
+    inode : int, optional
+        Inode of the file read.
+    digest : str, optional
+        Fingerprint of the file read, up to the byte offset (see _file_digest).
+
+    """
+    def __init__(self, byte_offset=0, line_num=0, device=None, inode=None, digest=None):
+        self.byte_offset = byte_offset
+        self.line_num = line_num
+        self.device = device
+        self.inode = inode
+        self.digest = digest
+
+
+class _RawRecord(list):
+    """CSV record values, holding the raw line(s) they were read from.
+
+    Attributes
+    ----------
+    raw_line : str
+        Line (or lines, for a record spanning several) the record was read from.
+
+    """
+    __slots__ = ('raw_line', )
+
+
+class _TimeZoneLocalizer(object):
+    """Localizes and converts datetime objects to a pytz time zone, arithmetically.
+
+    The time zone's UTC offset transitions are read once, splitting time into intervals
+    of constant UTC offset. A datetime is then localized (or converted) by looking up its
+    interval, starting with the interval of the previous lookup, and applying the
+    interval's offset. Consecutive time stamps mostly fall into the same interval.
+
+    Local times are localized like pytz's localize with is_dst=False. Times that do not
+    exist (skipped when clocks are set forward) are given the offset in effect before
+    the transition. Ambiguous times (repeated when clocks are set back) are given the
+    standard time offset or, if neither or both candidates are standard time, the lower
+    offset (i.e. the later of the two moments).
+
+    The transitions are read from pytz's (private) attributes of time zones with daylight
+    saving time. Time zones without them, e.g. UTC and fixed offset time zones, or any time
+    zone if they change, are handled by pytz itself instead (localize with is_dst=False,
+    and astimezone).
+
+    Parameters
+    ----------
+    pytz_time_zone : pytz time zone
+        Time zone to localize and convert to.
+
+    Attributes
+    ----------
+    arithmetic : bool
+        Whether the time zone's transitions were read, to localize and convert datetimes
+        arithmetically.
+
+    """
+    def __init__(self, pytz_time_zone):
+        self.time_zone = pytz_time_zone
+        self.arithmetic = all(
+            hasattr(pytz_time_zone, name)
+            for name in ('_utc_transition_times', '_transition_info', '_tzinfos'))
+        if not self.arithmetic:
+            return
+
+        transition_times = pytz_time_zone._utc_transition_times
+        transition_info = pytz_time_zone._transition_info
+        self.utc_starts = [datetime.min] + list(transition_times[1:])
+        self.offsets = [offset for offset, dst, tzname in transition_info]
+        self.is_dst = [bool(dst) for offset, dst, tzname in transition_info]
+        self.tzinfos = [pytz_time_zone._tzinfos[info] for info in transition_info]
+        self.utc_ends = self.utc_starts[1:] + [datetime.max]
+
+        # Local time spans of the intervals. The parts of a span overlapping its neighbours'
+        # spans are ambiguous, and the gaps between spans do not exist. What remains of a
+        # span is where its offset applies unambiguously.
+        self.local_starts = [self._shift(utc_start, offset)
+                             for utc_start, offset in zip(self.utc_starts, self.offsets)]
+        self.local_ends = [self._shift(utc_end, offset)
+                           for utc_end, offset in zip(self.utc_ends, self.offsets)]
+        self.unambiguous_starts = [
+            max(local_start, previous_end) for local_start, previous_end
+            in zip(self.local_starts, [datetime.min] + self.local_ends)]
+        self.unambiguous_ends = [
+            min(local_end, next_start) for local_end, next_start
+            in zip(self.local_ends, self.local_starts[1:] + [datetime.max])]
+
+        self._last_local = (datetime.max, datetime.max, None, None)
+        self._last_utc = (self.utc_starts[0], self.utc_ends[0], self.tzinfos[0], self.offsets[0])
+
+    @staticmethod
+    def _shift(dt, offset):
+        if dt in (datetime.min, datetime.max):
+            return dt
+        return dt + offset
+
+    def _interval(self, i):
+        return self.tzinfos[i], self.offsets[i]
+
+    def _find_local(self, dt):
+        i = max(bisect.bisect_right(self.local_starts, dt) - 1, 0)
+        if self.unambiguous_starts[i] <= dt < self.unambiguous_ends[i]:
+            self._last_local = (
+                self.unambiguous_starts[i], self.unambiguous_ends[i], self.tzinfos[i],
+                self.offsets[i])
+            return self._interval(i)
+
+        candidates = [j for j in range(max(i - 1, 0), min(i + 2, len(self.local_starts)))
+                      if self.local_starts[j] <= dt < self.local_ends[j]]
+        if not candidates:  # Non-existent time, use the offset before the transition.
+            return self._interval(i)
+
+        # Ambiguous time
+        candidates = [j for j in candidates if not self.is_dst[j]] or candidates
+        return self._interval(min(candidates, key=self.offsets.__getitem__))
+
+    def localize(self, dt, to_utc=False):
+        """Localizes a naive datetime object.
+
+        Parameters
+        ----------
+        dt : datetime
+            Naive datetime to localize.
+        to_utc : bool, optional
+            Return the localized datetime converted to UTC.
+
+        Returns
+        -------
+        datetime
+            Localized datetime.
+
+        Raises
+        ------
+        ValueError: If the datetime is not naive.
+
+        """
+        if dt.tzinfo is not None:
+            raise ValueError("Not naive datetime (tzinfo is already set)")
+
+        if not self.arithmetic:
+            local_dt = self.time_zone.localize(dt, is_dst=False)
+            return local_dt.astimezone(pytz.utc) if to_utc else local_dt
+
+        start, end, tzinfo, offset = self._last_local
+        if not start <= dt < end:
+            tzinfo, offset = self._find_local(dt)
+
+        if to_utc:
+            return (dt - offset).replace(tzinfo=pytz.utc)
+
+        return dt.replace(tzinfo=tzinfo)
+
+    def from_datetime(self, dt):
+        """Converts a time zone aware datetime object to the time zone.
+
+        Parameters
+        ----------
+        dt : datetime
+            Time zone aware datetime to convert.
+
+        Returns
+        -------
+        datetime
+            Converted datetime.
+
+        """
+        if dt.tzinfo is self.time_zone:  # Like datetime.astimezone
+            return dt
+        if not self.arithmetic:
+            return dt.astimezone(self.time_zone)
+
+        utc_dt = dt.replace(tzinfo=None) - dt.utcoffset()
+        start, end, tzinfo, offset = self._last_utc
+        if not start <= utc_dt < end:
+            i = max(bisect.bisect_right(self.utc_starts, utc_dt) - 1, 0)
+            start, end, tzinfo, offset = self._last_utc = (
+                self.utc_starts[i], self.utc_ends[i], self.tzinfos[i], self.offsets[i])
+
+        return (utc_dt + offset).replace(tzinfo=tzinfo)
+
+
+class _DatetimeFormatter(object):
+    """Formats datetime objects as strings, arithmetically.
+
+    The strings of each date and UTC offset are formatted once and cached, and those of
+    the times of day assembled from cached hour and minute strings, instead of calling
+    strftime for each datetime. Logged time stamps mostly share their dates and offsets.
+
+    Parameters
+    ----------
+    time_format : str, optional
+        Output format: 'default' ('2016-05-02 12:34:15', as _datetime_to_string, the default),
+        'iso' (ISO 8601, '2016-05-02T12:34:15', with microseconds if not zero) or 'epoch'
+        (seconds since 1970-01-01 00:00:00 UTC, naive datetimes taken to be in UTC, with
+        microseconds if not zero).
+    include_time_zone : bool, optional
+        Append the UTC offset of time zone aware datetimes ('+0200', or '+02:00' if ISO 8601).
+        Ignored for epoch seconds.
+
+    Raises
+    ------
+    ValueError: If the output format is not one of the named formats.
+
+    """
+    def __init__(self, time_format=None, include_time_zone=False):
+        if time_format not in (None, 'default', 'iso', 'epoch'):
+            raise ValueError("Unknown time format {0}".format(time_format))
+
+        self.time_format = time_format or 'default'
+        self.include_time_zone = include_time_zone
+        self._date_strings = {}  # Date strings (ending with the date/time separator), by date
+        self._minute_strings = {}  # 'HH:MM:' strings, by minute of the day
+        self._offset_strings = {}  # UTC offset strings, by offset
+        self._epoch_day_seconds = {}  # Seconds since the epoch of the start of each date
+        self._offset_seconds = {}  # Seconds of each UTC offset
+
+        if self.time_format == 'epoch':
+            self.format = self._format_epoch
+        else:
+            self.format = self._format_date_time
+
+    def _format_date_time(self, dt):
+        """Formats a datetime in the default or ISO 8601 format."""
+        date = dt.date()
+        try:
+            date_string = self._date_strings[date]
+        except KeyError:
+            separator = 'T' if self.time_format == 'iso' else ' '
+            date_string = self._date_strings[date] = '{0:04d}-{1:02d}-{2:02d}{3}'.format(
+                dt.year, dt.month, dt.day, separator)
+
+        minute = dt.hour * 60 + dt.minute
+        try:
+            minute_string = self._minute_strings[minute]
+        except KeyError:
+            minute_string = self._minute_strings[minute] = '{0:02d}:{1:02d}:'.format(
+                dt.hour, dt.minute)
+
+        dt_string = date_string + minute_string + _SECOND_STRINGS[dt.second]
+        if dt.microsecond and self.time_format == 'iso':
+            dt_string += '.{0:06d}'.format(dt.microsecond)
+
+        if self.include_time_zone:
+            offset = dt.utcoffset()
+            if offset is not None:
+                try:
+                    dt_string += self._offset_strings[offset]
+                except KeyError:
+                    offset_string = self._offset_strings[offset] = self._format_offset(offset)
+                    dt_string += offset_string
+
+        return dt_string
+
+    def _format_epoch(self, dt):
+        """Formats a datetime as seconds since the epoch."""
+        date = dt.date()
+        try:
+            day_seconds = self._epoch_day_seconds[date]
+        except KeyError:
+            day_seconds = self._epoch_day_seconds[date] = (
+                (date.toordinal() - _EPOCH_ORDINAL) * 86400)
+
+        offset = dt.utcoffset()
+        try:
+            offset_seconds = self._offset_seconds[offset]
+        except KeyError:
+            offset_seconds = self._offset_seconds[offset] = (
+                0 if offset is None else int(offset.total_seconds()))
+
+        seconds = day_seconds + dt.hour * 3600 + dt.minute * 60 + dt.second - offset_seconds
+        if dt.microsecond:
+            return '{0:.6f}'.format(seconds + dt.microsecond / 1000000)
+
+        return str(seconds)
+
+    def _format_offset(self, offset):
+        """Formats a UTC offset, like strftime's %z (or with colons if ISO 8601)."""
+        offset_seconds = int(offset.total_seconds())
+        sign = '-' if offset_seconds < 0 else '+'
+        hours, seconds = divmod(abs(offset_seconds), 3600)
+        minutes, seconds = divmod(seconds, 60)
+        parts = ['{0:02d}'.format(hours), '{0:02d}'.format(minutes)]
+        if seconds:
+            parts.append('{0:02d}'.format(seconds))
+
+        return sign + (':' if self.time_format == 'iso' else '').join(parts)
+
+
+class _OutputFiles(object):
+    """
+    CSV writers of output files opened for writing, by path, of which at most a given number
+    are kept open. Opening another file closes the least recently written to file first. A
+    file closed this way is reopened for appending when written to again.
+
+    Parameters
+    ----------
+    mode : str, optional
+        Mode to first open each output file in.
+    max_open_files : int, optional
+        Maximum number of files kept open at a time. Defaults to EXPORT_MAX_OPEN_FILES.
+    buffer_size : int, optional
+        Size in bytes of each open file's write buffer. Defaults to EXPORT_BUFFER_SIZE.
+    dialect : csv.Dialect or str, optional
+        Dialect of the CSV writers (see _csv_writer).
+    newline : str, optional
+        Newline translation of the output files (see open).
+
+    """
+    def __init__(self, mode='a+', max_open_files=None, buffer_size=None, dialect=None,
+                 newline=None):
+        self.mode = mode
+        self.max_open_files = max(max_open_files or EXPORT_MAX_OPEN_FILES, 1)
+        self.buffer_size = buffer_size or EXPORT_BUFFER_SIZE
+        self.dialect = dialect
+        self.newline = newline
+        self._open_files = OrderedDict()  # File objects and writers by path, LRU first
+        self._line_terminators = {}  # Line terminators of the writers, by path
+        self._opened_paths = set()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """Closes all open output files."""
+        while self._open_files:
+            self._open_files.popitem(last=False)[1][0].close()
+
+    def get(self, outfile_path, line_terminator=None):
+        """Returns an open output file and its CSV writer, opening the file if needed.
+
+        Parameters
+        ----------
+        outfile_path : str
+            Output file's absolute path.
+        line_terminator : str, optional
+            Line terminator of the file's writer, if no dialect is given (see _csv_writer).
+            Kept for the file when it is reopened. Defaults to a newline.
+
+        Returns
+        -------
+        tuple of file object and csv writer
+            The open file, and its writer.
+
+        """
+        if line_terminator is not None:
+            self._line_terminators[outfile_path] = line_terminator
+        try:
+            self._open_files.move_to_end(outfile_path)
+            return self._open_files[outfile_path]
+        except KeyError:
+            pass
+
+        if len(self._open_files) >= self.max_open_files:
+            self._open_files.popitem(last=False)[1][0].close()
+
+        if outfile_path not in self._opened_paths:
+            outfile_dir = os.path.dirname(outfile_path)
+            if outfile_dir:
+                os.makedirs(outfile_dir, exist_ok=True)
+            self._opened_paths.add(outfile_path)
+            f_out = open(outfile_path, self.mode, buffering=self.buffer_size,
+                         newline=self.newline)
+        else:
+            f_out = open(outfile_path, 'a', buffering=self.buffer_size, newline=self.newline)
+        writer = _csv_writer(
+            f_out, self.dialect, self._line_terminators.get(outfile_path, '\n'))
+        self._open_files[outfile_path] = f_out, writer
+
+        return f_out, writer
+
+
+class _PushParser(metaclass=abc.ABCMeta):
+    """Base of the push parsers, splitting the chunks of data fed into complete records.
+
+    Parameters
+    ----------
+    first_line_num : int, optional
+        First line number to parse. NOTE: Zero-based numbering.
+    encoding : str, optional
+        Encoding of the chunks fed as bytes. Defaults to the preferred encoding, like the
+        file readers.
+
+    """
+    def __init__(self, first_line_num=0, encoding=None):
+        self.first_line_num = first_line_num
+        self.encoding = encoding or locale.getpreferredencoding(False)
+        self.line_num = 0
+        self._pending = None  # Data fed past the last complete record
+        self._chunk_type = None  # Type of the chunks fed, bytes or str
+
+    def _iter_records(self, lines):
+        """Iterate over the CSV records of lines, numbering the lines parsed."""
+        def count_lines():
+            for line in lines:
+                self.line_num += 1
+                yield line
+
+        for record in csv.reader(count_lines()):
+            yield self.line_num - 1, record
+
+    @abc.abstractmethod
+    def _make_rows(self, records):
+        """Makes the rows of the records parsed."""
+
+    def close(self):
+        """Parses the data fed past the last complete record, if any, as a last record.
+
+        Returns
+        -------
+        list of Row
+            The rows of the last record, if complete and within the line range.
+
+        """
+        pending, self._pending = self._pending, None
+        if not pending:
+            return []
+        if isinstance(pending, bytes):
+            pending = pending.decode(self.encoding)
+
+        return self._make_rows(self._iter_records(pending.splitlines(True)))
+
+    def feed(self, chunk):
+        """Parses a chunk of data, e.g. as received from a socket or message queue.
+
+        Parameters
+        ----------
+        chunk : bytes or str
+            Data to parse. Records may be split across chunks anywhere: the data past the
+            chunk's last complete record (its last newline outside of a quoted value) is
+            held back until the rest of the record is fed. All chunks fed must be of the
+            same type.
+
+        Returns
+        -------
+        list of Row
+            The rows of the records completed by the chunk.
+
+        Raises
+        ------
+        TypeError: If the chunk is bytes and str chunks were fed before, or vice versa.
+
+        """
+        if self._chunk_type is None:
+            self._chunk_type = type(chunk)
+        elif not isinstance(chunk, self._chunk_type):
+            raise TypeError("Cannot feed {0} after {1} chunks".format(
+                type(chunk).__name__, self._chunk_type.__name__))
+
+        if self._pending:
+            chunk = self._pending + chunk
+        newline, quote = (b'\n', b'"') if isinstance(chunk, bytes) else ('\n', '"')
+        end = chunk.rfind(newline) + 1
+        # Hold back the lines of a record whose quoted value is not closed yet.
+        open_quote = chunk.count(quote, 0, end) % 2
+        while end and open_quote:
+            line_start = chunk.rfind(newline, 0, end - 1) + 1
+            open_quote ^= chunk.count(quote, line_start, end) % 2
+            end = line_start
+        self._pending = chunk[end:]
+        if not end:
+            return []
+
+        lines = chunk[:end]
+        if isinstance(lines, bytes):
+            lines = lines.decode(self.encoding)
+
+        return self._make_rows(self._iter_records(lines.splitlines(True)))
+
+
+class MixedArrayDataParser(_PushParser):
+    """
+    Parses mixed array data pushed in chunks (e.g. from a socket, serial bridge or message
+    queue), instead of read from a file. See read_mixed_array_data.
+
+    Parameters
+    ----------
+    first_line_num : int, optional
+        First line number to parse. NOTE: Zero-based numbering.
+    fix_floats : bool
+        Correct leading zeros for floating points values since many older CR-type
+        dataloggers strips leading zeros.
+    compact_rows : bool, optional
+        Make CompactRow objects instead of Row objects.
+    columns : iterable of int, optional
+        Only parse these columns (indices).
+    filters : dict, optional
+        Only parse the rows matching these filters by column index (see
+        read_mixed_array_data).
+    encoding : str, optional
+        Encoding of the chunks fed as bytes. Defaults to the preferred encoding.
+
+    Examples
+    --------
+    >>> parser = MixedArrayDataParser()
+    >>> parser.feed(b'100,2016,123,.5\\n101,20')
+    [Row([(0, '100'), (1, '2016'), (2, '123'), (3, '0.5')])]
+    >>> parser.feed(b'16,123\\n')
+    [Row([(0, '101'), (1, '2016'), (2, '123')])]
+
+    """
+    def __init__(self, first_line_num=0, fix_floats=True, compact_rows=False, columns=None,
+                 filters=None, encoding=None):
+        super(MixedArrayDataParser, self).__init__(first_line_num, encoding)
+        self.fix_floats = fix_floats
+        self.compact_rows = compact_rows
+        self.columns = None if columns is None else set(columns)
+        self.filters = filters
+
+    def _make_rows(self, records):
+        records = (record for record in records if record[0] >= self.first_line_num)
+        if self.filters:
+            records = _filter_records(records, None, self.filters)
+
+        return list(_make_mixed_array_rows(
+            records, fix_floats=self.fix_floats, compact_rows=self.compact_rows,
+            columns=self.columns))
+
+
+class TableDataParser(_PushParser):
+    """
+    Parses table data pushed in chunks (e.g. from a socket, serial bridge or message queue),
+    instead of read from a file. See read_table_data.
+
+    Parameters
+    ----------
+    header : list of str, optional
+        Column names to map to each rows' values.
+    header_row : int, optional
+        Line number of the header row fieldnames to map to each rows' values.
+    first_line_num : int, optional
+        First line number to parse. NOTE: Zero-based numbering.
+    parse_time_columns : bool, optional
+        Convert datalogger specific time string representations to datetime objects.
+    time_zone : str
+        String representation of a valid pytz time zone. (See pytz docs
+        for a list of valid time zones). The time zone refers to collected data's
+        time zone, which defaults to UTC and is used for localization and time conversion.
+    time_format_args_library : list of str
+        List of the maximum expected string
+        format columns sequence to match against when parsing time values. Defaults to
+        empty library.
+    time_parsed_column : str, optional
+        Converted time column name. If not given, use the name of the first
+        time column.
+    time_columns : list of str or int, optional
+        Column(s) (names or indices) to use for time conversion.
+    to_utc : bool, optional
+        Convert time to UTC.
+    compact_rows : bool, optional
+        Make CompactRow objects instead of Row objects.
+    columns : iterable of str or int, optional
+        Only parse these columns (names, or indices for ints naming no column), and the time
+        columns if parsing time.
+    filters : dict, optional
+        Only parse the rows matching these filters by column (name or index) (see
+        read_table_data).
+    encoding : str, optional
+        Encoding of the chunks fed as bytes. Defaults to the preferred encoding.
+
+    Raises
+    ------
+    TimeColumnValueError: If time columns are to be parsed, but not at least one time
+        column is given.
+    UnknownPytzTimeZoneError: If the provided time zone is not a valid pytz time zone.
+
+    Examples
+    --------
+    >>> parser = TableDataParser(
+    ...     header_row=0, parse_time_columns=True, time_columns=['Time'],
+    ...     time_format_args_library=['%Y-%m-%d %H:%M:%S'])
+    >>> parser.feed(b'Time,Value\\n2016-05-02 12:34:15,1.')
+    []
+    >>> parser.feed(b'5\\n2016-05-02 12:35:15,2.0')
+    [Row([('Time', datetime.datetime(2016, 5, 2, 12, 34, 15, tzinfo=<UTC>)), ('Value', '1.5')])]
+    >>> parser.close()
+    [Row([('Time', datetime.datetime(2016, 5, 2, 12, 35, 15, tzinfo=<UTC>)), ('Value', '2.0')])]
+
+    """
+    def __init__(self, header=None, header_row=None, first_line_num=0,
+                 parse_time_columns=False, time_zone='UTC', time_format_args_library=None,
+                 time_parsed_column=None, time_columns=None, to_utc=False, compact_rows=False,
+                 columns=None, filters=None, encoding=None):
+        super(TableDataParser, self).__init__(first_line_num, encoding)
+        if parse_time_columns:
+            try:
+                pytz.timezone(time_zone)
+            except pytz.UnknownTimeZoneError:
+                msg = "{time_zone} is not a valid pytz time zone! "
+                msg += "See pytz docs for valid time zones".format(time_zone=time_zone)
+                raise UnknownPytzTimeZoneError(msg)
+            if not time_columns:
+                raise TimeColumnValueError("At least one time column is required!")
+
+        if columns is not None:
+            columns = set(columns)
+            if parse_time_columns:
+                columns.update(time_columns)
+
+        self.header = header
+        self.header_row = header_row if isinstance(header_row, int) and header_row >= 0 else None
+        self.parse_time_columns = parse_time_columns
+        self.time_zone = time_zone
+        self.time_format_args_library = time_format_args_library
+        self.time_parsed_column = time_parsed_column
+        self.time_columns = time_columns
+        self.to_utc = to_utc
+        self.compact_rows = compact_rows
+        self.columns = columns
+        self.filters = filters
+
+    def _make_rows(self, records):
+        data_records = []
+        for line_num, record in records:
+            if self.header_row is not None and line_num <= self.header_row:
+                if line_num == self.header_row:
+                    self.header = record
+            elif line_num >= self.first_line_num:
+                data_records.append((line_num, record))
+
+        if self.filters:
+            data_records = _filter_records(data_records, self.header, self.filters)
+
+        rows = _make_table_rows(
+            data_records, header=self.header, compact_rows=self.compact_rows,
+            columns=self.columns)
+
+        if self.parse_time_columns:
+            rows = _parse_time_rows(
+                rows,
+                time_zone=self.time_zone,
+                time_format_args_library=self.time_format_args_library,
+                time_parsed_column=self.time_parsed_column,
+                time_columns=self.time_columns,
+                to_utc=self.to_utc,
+                batch_size=TIME_PARSING_BATCH_ROWS
+            )
+
+        return list(rows)
+
+
 def _data_generator(data):
     """
     Iterate over the rows of a data set (list of ordered dictionaries, i.e. rows
@@ -75,6 +900,242 @@ def _data_generator(data):
         yield row
 
 
+def _binary_record_format(names, data_types, pytz_time_zone, to_utc=False):
+    """
+    Builds the struct to unpack a binary (TOB1 or TOB3) file's records with, and the
+    functions turning unpacked values into column values. A SECONDS field directly followed
+    by a NANOSECONDS field is read as a single TIMESTAMP column.
+
+    Parameters
+    ----------
+    names : list of str
+        Field names, as listed in the file's header.
+    data_types : list of str
+        Field data types, as listed in the file's header.
+    pytz_time_zone : pytz time zone
+        Time zone of the file's time stamps.
+    to_utc : bool, optional
+        Convert time stamps to UTC.
+
+    Returns
+    -------
+    tuple of struct.Struct, list of str and list of callable
+        Record struct, column names and column value getters.
+
+    Raises
+    ------
+    FileFormatError: If a field's data type is not supported.
+
+    """
+    localizer = _time_zone_localizer(pytz_time_zone)
+
+    def time_stamp(seconds, nanoseconds):
+        return localizer.localize(
+            CAMPBELL_EPOCH + timedelta(seconds=seconds, microseconds=nanoseconds // 1000),
+            to_utc=to_utc)
+
+    fp2_values = _fp2_values()
+    names = list(names)
+    data_types = [data_type.upper() for data_type in data_types]
+    data_types = ['SECNANO' if data_type == 'NSEC' else data_type for data_type in data_types]
+    for i in range(len(names) - 1):
+        if (names[i:i + 2] == ['SECONDS', 'NANOSECONDS'] and
+                data_types[i:i + 2] == ['ULONG', 'ULONG']):
+            names[i:i + 2] = ['TIMESTAMP']
+            data_types[i:i + 2] = ['SECNANO']
+            break
+
+    record_format = '<'
+    getters = []
+    i = 0  # Index of the field's first unpacked value
+    for data_type in data_types:
+        if data_type.startswith('ASCII(') and data_type.endswith(')'):
+            record_format += data_type[len('ASCII('):-1] + 's'
+            getters.append(
+                lambda values, i=i: values[i].split(b'\0', 1)[0].decode('latin-1'))
+            i += 1
+            continue
+        if data_type not in _BINARY_DATA_TYPE_FORMATS:
+            raise FileFormatError("Unsupported binary data type {0}".format(data_type))
+
+        record_format += _BINARY_DATA_TYPE_FORMATS[data_type]
+        if data_type == 'FP2':
+            getters.append(lambda values, i=i: fp2_values[values[i]])
+        elif data_type in ('IEEE4B', 'IEEE8B'):
+            big_endian_format = '>f' if data_type == 'IEEE4B' else '>d'
+            getters.append(
+                lambda values, i=i, fmt=big_endian_format: struct.unpack(fmt, values[i])[0])
+        elif data_type in ('BOOL2', 'BOOL4'):
+            getters.append(lambda values, i=i: bool(values[i]))
+        elif data_type == 'SECNANO':
+            getters.append(lambda values, i=i: time_stamp(values[i], values[i + 1]))
+        else:
+            getters.append(lambda values, i=i: values[i])
+        i += 2 if data_type == 'SECNANO' else 1
+
+    return struct.Struct(record_format), names, getters
+
+
+def _bisect_time_range(data, time_column, from_timestamp, to_timestamp):
+    """
+    Finds the rows within a time range of a data set sorted by time, using bisection.
+
+    Parameters
+    ----------
+    data : DataSet
+        Data set to search, sorted by its time column.
+    time_column : str or int
+        Time column (name or index) the data set is sorted by.
+    from_timestamp : datetime
+        Start of the time range.
+    to_timestamp : datetime
+        End of the time range.
+
+    Returns
+    -------
+    tuple of int
+        Index of the first row within the time range, and the index following the last.
+
+    Raises
+    ------
+    TimeColumnValueError: If the time column does not exist in a looked up row.
+
+    """
+    def time_at(index):
+        try:
+            return data[index][time_column]
+        except KeyError:
+            raise TimeColumnValueError("Invalid time column")
+
+    low, high = 0, len(data)
+    while low < high:
+        middle = (low + high) // 2
+        if time_at(middle) < from_timestamp:
+            low = middle + 1
+        else:
+            high = middle
+
+    first = low
+    high = len(data)
+    while low < high:
+        middle = (low + high) // 2
+        if to_timestamp < time_at(middle):
+            high = middle
+        else:
+            low = middle + 1
+
+    return first, low
+
+
+def _compile_time_format(time_format_args_library, strict=False):
+    """
+    Compiles a time format library into a function parsing time values into a naive
+    datetime object, giving the same result as joining the values (see
+    _parse_custom_time_formats) and parsing them with datetime.strptime.
+
+    Time formats made of %Y, %y, %j, %m, %d, %H, %M, %S and the custom %H%M (Hour/Minute),
+    or of a single ISO 8601 time stamp ('%Y-%m-%d %H:%M:%S', optionally followed by '.%f'),
+    are parsed with integer arithmetic instead of strptime. Values these do not accept (and
+    any other time format) are handed to strptime.
+
+    Parameters
+    ----------
+    time_format_args_library : list of str
+        List of the maximum expected string format columns sequence to match against
+        when parsing time values.
+    strict : bool, optional
+        Never hand time values to strptime. Values (and time formats) not parsed with
+        integer arithmetic raise ValueError instead.
+
+    Returns
+    -------
+    callable
+        Function taking the time strings to parse as positional arguments, and returning
+        the parsed datetime object.
+
+    Raises
+    ------
+    The returned function raises ValueError if the time values could not be parsed.
+
+    """
+    def to_int(value, max_length, min_value, max_value, min_length=1):
+        if not min_length <= len(value) <= max_length or value.strip('0123456789'):
+            raise ValueError(value)
+        number = int(value)
+        if not min_value <= number <= max_value:
+            raise ValueError(value)
+        return number
+
+    def short_year(value):
+        year = to_int(value, 2, 0, 99, min_length=2)
+        return year + 2000 if year <= 68 else year + 1900,
+
+    def iso_time_stamp(value):
+        if (len(value) != 19 or value[4] != '-' or value[7] != '-' or value[10] != ' ' or
+                value[13] != ':' or value[16] != ':'):
+            raise ValueError(value)
+        return (to_int(value[:4], 4, 0, 9999, 4), to_int(value[5:7], 2, 1, 12, 2),
+                to_int(value[8:10], 2, 1, 31, 2), to_int(value[11:13], 2, 0, 23, 2),
+                to_int(value[14:16], 2, 0, 59, 2), to_int(value[17:19], 2, 0, 61, 2))
+
+    def iso_time_stamp_fraction(value):
+        if len(value) < 21 or value[19] != '.':
+            raise ValueError(value)
+        fraction = value[20:]
+        to_int(fraction, 6, 0, 999999)
+        return iso_time_stamp(value[:19]) + (int(fraction.ljust(6, '0')), )
+
+    hour_minute_values = _hour_minute_values()
+
+    # Datetime components: year, month, day, hour, minute, second, microsecond, day of year.
+    time_format_fields = {
+        '%Y': ((0, ), lambda value: (to_int(value, 4, 0, 9999, 4), )),
+        '%y': ((0, ), short_year),
+        '%m': ((1, ), lambda value: (to_int(value, 2, 1, 12), )),
+        '%d': ((2, ), lambda value: (to_int(value, 2, 1, 31), )),
+        '%H': ((3, ), lambda value: (to_int(value, 2, 0, 23), )),
+        '%M': ((4, ), lambda value: (to_int(value, 2, 0, 59), )),
+        '%S': ((5, ), lambda value: (to_int(value, 2, 0, 61), )),
+        '%j': ((7, ), lambda value: (to_int(value, 3, 1, 366), )),
+        '%H%M': ((3, 4), lambda value: hour_minute_values[value]),
+        '%Y-%m-%d %H:%M:%S': ((0, 1, 2, 3, 4, 5), iso_time_stamp),
+        '%Y-%m-%d %H:%M:%S.%f': ((0, 1, 2, 3, 4, 5, 6), iso_time_stamp_fraction),
+    }
+
+    fields = [time_format_fields.get(format_arg) for format_arg in time_format_args_library]
+    components = [component for field in fields if field for component in field[0]]
+    if None in fields or len(components) != len(set(components)):
+        fields = None  # Left to strptime
+
+    def strptime(*time_values):
+        if strict:
+            raise ValueError(time_values)
+        parsed_time_format, parsed_time = _parse_custom_time_formats(
+            time_format_args_library, *time_values)
+        return datetime.strptime(parsed_time, parsed_time_format)
+
+    def parse(*time_values):
+        if fields is None:
+            return strptime(*time_values)
+
+        time = [1900, 1, 1, 0, 0, 0, 0, None]
+        try:
+            for (field_components, convert), value in zip(fields, time_values):
+                for component, component_value in zip(field_components, convert(value)):
+                    time[component] = component_value
+
+            if time[7] is None:
+                return datetime(*time[:7])
+
+            date = datetime.fromordinal(datetime(time[0], 1, 1).toordinal() + time[7] - 1)
+            return date.replace(hour=time[3], minute=time[4], second=time[5],
+                                microsecond=time[6])
+        except (KeyError, ValueError):
+            return strptime(*time_values)
+
+    return parse
+
+
 def _convert_time_zone(dt, to_time_zone):
     """Converts datetime from one time zone to another.
 
@@ -92,7 +1153,91 @@ def _convert_time_zone(dt, to_time_zone):
 
     """
 
-    return dt.astimezone(to_time_zone)
+    return _time_zone_localizer(to_time_zone).from_datetime(dt)
+
+
+def _count_lines(f, size):
+    """Counts the lines of the next bytes of a file, and the quote characters they hold.
+
+    Parameters
+    ----------
+    f : file object
+        File opened in binary mode, positioned at the first line to count.
+    size : int
+        Number of bytes to count the lines of.
+
+    Returns
+    -------
+    tuple of int
+        Number of lines (a last line not terminated by a newline included) and of quote
+        characters.
+
+    """
+    num_lines = num_quotes = 0
+    last_byte = b'\n'
+    while size > 0:
+        block = f.read(min(PARALLEL_READ_BLOCK_SIZE, size))
+        if not block:
+            break  # Truncated since
+        size -= len(block)
+        num_lines += block.count(b'\n')
+        num_quotes += block.count(b'"')
+        last_byte = block[-1:]
+
+    if last_byte != b'\n':
+        num_lines += 1
+
+    return num_lines, num_quotes
+
+
+def _csv_line(values, dialect=None):
+    """Formats values as a line of CSV, like _csv_writer's writers, without line ending.
+
+    Parameters
+    ----------
+    values : iterable
+        Values to format.
+    dialect : csv.Dialect or str, optional
+        Dialect to format the values in (see _csv_writer).
+
+    Returns
+    -------
+    str
+        The formatted values.
+
+    """
+    line = io.StringIO()
+    _csv_writer(line, dialect).writerow(values)
+
+    return line.getvalue().rstrip('\r\n')
+
+
+def _csv_writer(f_out, dialect=None, line_terminator='\n'):
+    """
+    Creates a CSV writer of an output file. Values holding delimiters, quote characters or
+    line breaks are quoted.
+
+    Parameters
+    ----------
+    f_out : file object
+        Output file opened in text mode.
+    dialect : csv.Dialect or str, optional
+        Dialect to write in. Defaults to comma separated values, each line ending with the
+        line terminator.
+    line_terminator : str, optional
+        Ending of each line written if no dialect is given, a newline by default
+        (translated like any other written to the file).
+
+    Returns
+    -------
+    csv writer
+        The output file's writer.
+
+    """
+    if dialect is None:
+        return csv.writer(f_out, lineterminator=line_terminator)
+
+    return csv.writer(f_out, dialect)
 
 
 def _datetime_to_string(dt, include_time_zone=False):
@@ -120,8 +1265,124 @@ def _datetime_to_string(dt, include_time_zone=False):
     return dt.strftime("%Y-%m-%d %H:%M:%S")
 
 
-def _extract_columns_data_generator(data, *column_names, **time_range):
-    """Iterator for extract_column_data
+def _decode_fp2(value):
+    """
+    Decodes a Campbell Scientific FP2 value: a two byte floating point number made of a
+    sign bit, a two bit negative decimal exponent and a 13 bit mantissa.
+
+    Parameters
+    ----------
+    value : int
+        The FP2 value's two bytes as a (big-endian) unsigned integer.
+
+    Returns
+    -------
+    float
+        Decoded value. +/-INF and NAN are decoded as float infinity and NaN.
+
+    """
+    sign = value >> 15
+    exponent = (value >> 13) & 0x3
+    mantissa = value & 0x1FFF
+
+    if exponent == 0 and mantissa == 0x1FFF:
+        return float('-inf') if sign else float('inf')
+    if exponent == 0 and mantissa == 0x1FFE and sign:
+        return float('nan')
+
+    decoded = mantissa / 10 ** exponent
+
+    return -decoded if sign else decoded
+
+
+def _decode_tob3_frames(infile_path, header, frames, time_zone, to_utc=False,
+                        from_timestamp=None, to_timestamp=None):
+    """
+    Decodes the records of some of a TOB3 file's frames. Runs in worker processes when
+    frames are decoded in parallel, hence only takes picklable arguments.
+
+    Parameters
+    ----------
+    infile_path : str
+        Input file's absolute path.
+    header : TOB3Header
+        The file's header.
+    frames : list of TOB3Frame
+        Frames to decode.
+    time_zone : str
+        String representation of a valid pytz time zone.
+    to_utc : bool, optional
+        Convert time stamps to UTC.
+    from_timestamp : datetime, optional
+        Skip records time stamped before this time.
+    to_timestamp : datetime, optional
+        Skip records time stamped after this time.
+
+    Returns
+    -------
+    list of lists
+        Values of the decoded records, starting with their time stamp and record number.
+
+    """
+    pytz_time_zone = pytz.timezone(time_zone)
+    record_struct, names, getters = _binary_record_format(
+        header.names, header.data_types, pytz_time_zone, to_utc)
+    record_interval = timedelta(microseconds=_tob3_table_info(header)[3] // 1000)
+
+    localizer = _time_zone_localizer(pytz_time_zone)
+
+    records_values = []
+    with open(infile_path, 'rb') as f:
+        for frame in frames:
+            f.seek(frame.byte_offset + TOB3_FRAME_HEADER_SIZE)
+            records = f.read(frame.num_records * record_struct.size)
+            frame_time = localizer.from_datetime(frame.time_stamp).replace(tzinfo=None)
+
+            for i, values in enumerate(record_struct.iter_unpack(records)):
+                time_stamp = localizer.localize(frame_time + i * record_interval, to_utc=to_utc)
+                if from_timestamp is not None and time_stamp < from_timestamp:
+                    continue
+                if to_timestamp is not None and time_stamp > to_timestamp:
+                    break
+                records_values.append(
+                    [time_stamp, frame.record_num + i] + [getter(values) for getter in getters])
+
+    return records_values
+
+
+def _existing_header(outfile_path, mode):
+    """
+    Reads the header of an output file about to be exported to, i.e. its first line unless
+    it is empty. Only the first line is read, however large the file.
+
+    Parameters
+    ----------
+    outfile_path : str
+        Output file's absolute path.
+    mode : str
+        Mode the output file is to be opened in.
+
+    Returns
+    -------
+    str or None
+        The file's first line, without its line ending, or None if the file does not exist,
+        is empty or is to be truncated.
+
+    """
+    if 'w' in mode:
+        return None
+
+    try:
+        with open(outfile_path, 'r') as f:
+            first_line = f.readline()
+    except FileNotFoundError:
+        return None
+
+    return first_line.rstrip('\r\n') if first_line else None
+
+
+def _extract_columns_data_generator(data, *column_names, **time_range):
+    """Iterator for extract_column_data
 
     Parameters
     ----------
@@ -129,7 +1390,11 @@ def _extract_columns_data_generator(data, *column_names, **time_range):
         Data set to extract from.
     *column_names : Column(s) to extract.
     **time_range : Extract data from, to or between timestamps. If this mode is used, the
-        data set must be time converted.
+        data set must be time converted. If the data set is indexed by the time column
+        (see DataSet.index_time), the time range is looked up in its index. Otherwise, if
+        sorted_by_time is given and true, the data set is taken to be sorted by its time
+        column and the time range is found by bisection. sorted_by_time alone does not
+        select a time range.
 
     Yields
     ------
@@ -141,6 +1406,7 @@ def _extract_columns_data_generator(data, *column_names, **time_range):
         TimeColumnValueError: If the keyword argument time_column is not provided or if
             the given time column does not exist in a row.
     """
+    sorted_by_time = time_range.pop('sorted_by_time', False)
 
     if time_range:
         time_column = time_range.get('time_column')
@@ -155,7 +1421,18 @@ def _extract_columns_data_generator(data, *column_names, **time_range):
             to_timestamp = datetime.utcnow()
             to_timestamp = to_timestamp.replace(tzinfo=pytz.utc)
 
-    for row in _data_generator(data):
+    rows = _data_generator(data)
+    if time_range and getattr(data, 'time_index_column', None) == time_column:
+        try:
+            indices = data.time_range(from_timestamp, to_timestamp)
+        except KeyError:
+            raise TimeColumnValueError("Invalid time column")
+        rows = (data[index] for index in indices)
+    elif time_range and sorted_by_time:
+        first, last = _bisect_time_range(data, time_column, from_timestamp, to_timestamp)
+        rows = (data[index] for index in range(first, last))
+
+    for row in rows:
         if time_range:
             if time_column not in row:
                 raise TimeColumnValueError("Invalid time column")
@@ -173,329 +1450,2203 @@ def _extract_columns_data_generator(data, *column_names, **time_range):
                 yield Row([(name, value) for name, value in row.items()])
 
 
-def _find_first_time_column_name(column_names, time_columns):
-    """Search for the column name which holds the first time column value.
+def _file_digest(f, byte_offset):
+    """Fingerprints a file by its head and the bytes right before a given offset.
+
+    Parameters
+    ----------
+    f : file object
+        File opened in binary mode.
+    byte_offset : int
+        Offset to fingerprint the file up to.
+
+    Returns
+    -------
+    str
+        Hex digest of the file's first and last CURSOR_CHECK_SIZE bytes before the offset.
+
+    """
+    check_size = min(byte_offset, CURSOR_CHECK_SIZE)
+    digest = hashlib.sha1()
+    f.seek(0)
+    digest.update(f.read(check_size))
+    f.seek(byte_offset - check_size)
+    digest.update(f.read(check_size))
+
+    return digest.hexdigest()
+
+
+def _filter_records(records, header, filters):
+    """Iterate over the CSV records matching filters on their (unprocessed) values.
+
+    Parameters
+    ----------
+    records : iterable of tuple of int and list of str
+        Line numbers and values of the records to filter.
+    header : list of str
+        Column names of the records' values. If not given, the columns are named by index.
+    filters : dict
+        Filter by column (name or index). A filter is either a callable, taking the
+        column's value and returning whether to keep the record, a set (or list or tuple)
+        of values to keep, or a single value to keep. Records without a filtered column
+        are dropped.
+
+    Yields
+    ------
+    tuple of int and list of str
+        The next matching record's (last) line number and its values.
+
+    """
+    def value_test(value_filter):
+        if callable(value_filter):
+            return value_filter
+        if isinstance(value_filter, (set, frozenset, list, tuple)):
+            return set(value_filter).__contains__
+        return lambda value: value == value_filter
+
+    filter_tests = [(column, value_test(value_filter))
+                    for column, value_filter in filters.items()]
+    tests_by_length = {}  # Tests by record index, by number of values
+
+    for line_num, record in records:
+        try:
+            tests = tests_by_length[len(record)]
+        except KeyError:
+            names = list(header[:len(record)]) if header else []
+            tests = []
+            for column, test in filter_tests:
+                if column in names:
+                    tests.append((names.index(column), test))
+                elif isinstance(column, int) and 0 <= column < len(record):
+                    tests.append((column, test))
+                else:
+                    tests = None
+                    break
+            tests_by_length[len(record)] = tests
+
+        if tests is not None and all(test(record[i]) for i, test in tests):
+            yield line_num, record
+
+
+def _files_read_info(infile_paths, reader, read_options, common_read_options):
+    """Lists the files of a batch read, along with their reader and read options.
+
+    Parameters
+    ----------
+    infile_paths : str or list of str
+        Input files' paths, or a glob pattern matching them.
+    reader : str
+        Name of the reader of files having no reader in their own read options.
+    read_options : dict of dict
+        Read options by input file path, overriding the common read options.
+    common_read_options : dict
+        Read options shared by all files.
+
+    Returns
+    -------
+    list of tuple
+        Input file path, reader name and read options of each file, in order.
+
+    Raises
+    ------
+    ValueError: If a file's reader is not one of the named readers.
+
+    """
+    if isinstance(infile_paths, str):
+        infile_paths = sorted(glob.glob(infile_paths))
+    if read_options is None:
+        read_options = {}
+
+    files_read_info = []
+    for infile_path in infile_paths:
+        file_read_options = dict(common_read_options)
+        file_read_options.update(read_options.get(infile_path, {}))
+        file_reader = file_read_options.pop('reader', reader)
+        if file_reader not in _FILE_READERS:
+            raise ValueError("Unknown reader {0} for {1}".format(file_reader, infile_path))
+        files_read_info.append((infile_path, file_reader, file_read_options))
+
+    return files_read_info
+
+
+def _find_first_time_column_name(column_names, time_columns):
+    """Search for the column name which holds the first time column value.
+
+    Parameters
+    ----------
+    column_names : list of str or int
+        List of column names (or indices).
+    time_columns : list of str or int
+        List of column names (or indices) that represent time values.
+
+    Returns
+    -------
+    str or int
+        The column name or index of the first time column.
+
+    Raises
+    ------
+    TimeColumnValueError: If the first time column is not present in the list of
+        column names.
+
+    """
+    for name in column_names:
+        if name == time_columns[0]:
+            return name
+    else:
+        msg = "First time column '{first_time_column}' not found in column names!"
+        msg = msg.format(first_time_column=time_columns[0])
+        raise TimeColumnValueError(msg)
+
+
+def _follow_records(f, infile_path, position, iter_records, follow, last_line_num=None):
+    """
+    Iterate over the records of a file as it grows, keeping it open and polling it for new
+    complete lines once its end is reached. Lines not yet terminated by a newline are held
+    back until they are.
+
+    The file is checked for truncation (its size dropping below the position read up to)
+    and rotation (its path leading to another inode) between polls. A truncated file is
+    read again from its start. A rotated file is read to its end, then the new file at
+    the path is opened and read from its start.
+
+    Parameters
+    ----------
+    f : file object
+        File opened in binary mode, positioned at the given position.
+    infile_path : str
+        Input file's absolute path.
+    position : _ReadPosition
+        Position of the file object, holding the file's identity (see _seek_cursor).
+    iter_records : callable
+        Record iterator taking a file object, a position and complete_lines (e.g.
+        _iter_records with its line range bound).
+    follow : _FollowOptions
+        Seconds between two polls, and seconds without new lines to stop following the
+        file after (None to follow it until closed).
+    last_line_num : int, optional
+        Last line number to read, after which the file is no longer followed.
+
+    Yields
+    ------
+    tuple of int and list of str
+        The next record's line number and its values.
+
+    """
+    poll_interval = follow.poll_interval
+    if poll_interval is None:
+        poll_interval = FOLLOW_POLL_INTERVAL
+
+    followed_f = f
+    last_read_time = time.monotonic()
+    try:
+        while True:
+            for record in iter_records(followed_f, position, complete_lines=True):
+                last_read_time = time.monotonic()
+                yield record
+            if isinstance(last_line_num, int) and position.line_num > last_line_num:
+                return
+            if (follow.idle_timeout is not None and
+                    time.monotonic() - last_read_time >= follow.idle_timeout):
+                return
+
+            time.sleep(poll_interval)
+            try:
+                stat = os.stat(infile_path)
+            except FileNotFoundError:
+                continue  # Rotation in progress, keep reading the current file meanwhile
+            if (stat.st_dev, stat.st_ino) != (position.device, position.inode):
+                for record in iter_records(followed_f, position, complete_lines=True):
+                    yield record
+                if followed_f is not f:
+                    followed_f.close()
+                followed_f = _open_input(infile_path)
+                stat = os.fstat(followed_f.fileno())
+                position.device = stat.st_dev
+                position.inode = stat.st_ino
+                position.byte_offset = position.line_num = 0
+            elif not _is_compressed(followed_f) and stat.st_size < position.byte_offset:
+                position.byte_offset = position.line_num = 0
+                followed_f.seek(0)
+    finally:
+        if followed_f is not f:
+            followed_f.close()
+
+
+def _fp2_values():
+    """Returns the lookup table of decoded FP2 values, building it on first use.
+
+    Returns
+    -------
+    list of float
+        Decoded FP2 values, indexed by their raw value unpacked in little-endian byte order.
+
+    """
+    if not _FP2_VALUES:
+        _FP2_VALUES.extend(
+            _decode_fp2(((value & 0xFF) << 8) | (value >> 8)) for value in range(0x10000))
+
+    return _FP2_VALUES
+
+
+def _hour_minute_values():
+    """
+    Returns the (hour, minute) of every Hour/Minute string that, when parsed with
+    _parse_hourminute, forms a valid time. Builds the lookup table on first use.
+
+    Returns
+    -------
+    dict of str: tuple of int
+        Lookup table of hour and minute by Hour/Minute string.
+
+    """
+    if not _HOUR_MINUTE_VALUES:
+        for length in range(1, 5):
+            for number in range(10 ** length):
+                hour_minute = str(number).zfill(length)
+                parsed_time = _parse_hourminute(hour_minute)
+                hour, minute = int(parsed_time[:2]), int(parsed_time[2:])
+                if hour <= 23 and minute <= 59:
+                    _HOUR_MINUTE_VALUES[hour_minute] = (hour, minute)
+
+    return _HOUR_MINUTE_VALUES
+
+
+def _is_compressed(f):
+    """Returns whether a file object opened by _open_input decompresses its file."""
+    return isinstance(f, _COMPRESSED_FILE_TYPES)
+
+
+def _iter_array_id_rows(data, array_ids):
+    """Iterate over the rows of given array ids in a data set, one at a time.
+
+    Parameters
+    ----------
+    data : dict of DataSet or iterable of Row
+        Array id separated data, or mixed array data (e.g. a DataSet or an iterator over a
+        file's rows) whose rows' first value is their array id.
+    array_ids : collection of str
+        Array ids to yield the rows of.
+
+    Yields
+    ------
+    tuple of str and Row
+        The next row's array id and the row itself.
+
+    """
+    if isinstance(data, dict):
+        for array_id, array_id_data in data.items():
+            if array_id in array_ids:
+                for row in array_id_data:
+                    yield array_id, row
+        return
+
+    for row in data:
+        for array_id in row.values():
+            if array_id in array_ids:
+                yield array_id, row
+            break
+
+
+def _iter_array_id_records(f, position, array_ids, first_line_num=0, last_line_num=None,
+                           complete_lines=False, raw_lines=False):
+    """
+    Iterate over the CSV records of a mixed array file holding given array ids, within a
+    range of line numbers. Lines of other array ids are rejected from their first field,
+    before being split into values. A line holding an odd number of quote characters may
+    open a quoted field going on over the next lines, and is read along with them as a
+    single record (as by _iter_records) before its array id is checked.
+
+    Parameters
+    ----------
+    f : file object
+        File opened in binary mode, positioned at the given position.
+    position : _ReadPosition
+        Position of the file object. Moved past each record within the line range (or
+        skipped before it), right before the record is yielded.
+    array_ids : iterable of str
+        Array ids to yield the records of.
+    first_line_num : int, optional
+        First line number to read. NOTE: Zero-based numbering.
+    last_line_num : int, optional
+        Last line number to read. NOTE: Zero-based numbering.
+    complete_lines : bool, optional
+        Hold back a last line not (yet) terminated by a newline (see _iter_lines).
+    raw_lines : bool, optional
+        Yield each record's values as a _RawRecord, holding the line(s) they were read from.
+
+    Yields
+    ------
+    tuple of int and list of str
+        The next record's (last) line number and its values.
+
+    """
+    array_ids = set(array_ids)
+    read_position = _ReadPosition(position.byte_offset, position.line_num)
+    lines = _iter_lines(f, read_position, complete_lines)
+    record_lines = []  # Lines of a record read along with the lines following its first
+
+    def spanned_lines(first_line):
+        yield first_line
+        for line in lines:
+            record_lines.append(line)
+            yield line
+
+    for line in lines:
+        record = None
+        if line.count('"') % 2:
+            record_lines.append(line)
+            record = next(csv.reader(spanned_lines(line)), [])
+            line = ''.join(record_lines)
+            del record_lines[:]
+
+        line_num = read_position.line_num - 1
+        if isinstance(last_line_num, int) and last_line_num < line_num:
+            break
+        position.byte_offset = read_position.byte_offset
+        position.line_num = read_position.line_num
+        if line_num < first_line_num:
+            continue
+
+        if record is None:
+            array_id = line.split(',', 1)[0].rstrip('\r\n').strip('"')
+        else:
+            array_id = record[0] if record else ''
+        if array_id in array_ids:
+            if record is None:
+                record = next(csv.reader([line]))
+            if raw_lines:
+                record = _RawRecord(record)
+                record.raw_line = line
+            yield line_num, record
+
+
+def _iter_lines(f, position, complete_lines=False):
+    """Iterate over the decoded lines of a file, keeping track of the position read.
+
+    Parameters
+    ----------
+    f : file object
+        File opened in binary mode, positioned at the given position.
+    position : _ReadPosition
+        Position of the file object, moved past each line read.
+    complete_lines : bool, optional
+        Hold back a last line not (yet) terminated by a newline, leaving the file object
+        positioned at its start.
+
+    Yields
+    ------
+    str
+        The next line in the file.
+
+    """
+    encoding = locale.getpreferredencoding(False)
+    for line in f:
+        if complete_lines and not line.endswith(b'\n'):
+            f.seek(position.byte_offset)
+            return
+        position.byte_offset += len(line)
+        position.line_num += 1
+        yield line.decode(encoding)
+
+
+def _iter_records(f, position, first_line_num=0, last_line_num=None, complete_lines=False,
+                  raw_lines=False):
+    """Iterate over the CSV records of a file within a range of line numbers.
+
+    Parameters
+    ----------
+    f : file object
+        File opened in binary mode, positioned at the given position.
+    position : _ReadPosition
+        Position of the file object. Moved past each record within the line range
+        (or skipped before it), right before the record is yielded.
+    first_line_num : int, optional
+        First line number to read. NOTE: Zero-based numbering.
+    last_line_num : int, optional
+        Last line number to read. NOTE: Zero-based numbering.
+    complete_lines : bool, optional
+        Hold back a last line not (yet) terminated by a newline (see _iter_lines).
+    raw_lines : bool, optional
+        Yield each record's values as a _RawRecord, holding the line(s) they were read from.
+
+    Yields
+    ------
+    tuple of int and list of str
+        The next record's (last) line number and its values.
+
+    """
+    read_position = _ReadPosition(position.byte_offset, position.line_num)
+    lines = _iter_lines(f, read_position, complete_lines)
+    if raw_lines:
+        record_lines = []  # Lines of the record being read
+
+        def kept_lines(lines):
+            for line in lines:
+                record_lines.append(line)
+                yield line
+
+        lines = kept_lines(lines)
+
+    records = csv.reader(lines)
+    for record in records:
+        if raw_lines:
+            record = _RawRecord(record)
+            record.raw_line = ''.join(record_lines)
+            del record_lines[:]
+        line_num = read_position.line_num - 1
+        if isinstance(last_line_num, int) and last_line_num < line_num:
+            break
+        position.byte_offset = read_position.byte_offset
+        position.line_num = read_position.line_num
+        if first_line_num <= line_num:
+            yield line_num, record
+
+
+def _index_lines(f, line_index):
+    """Extends a line index with the complete lines found past its end.
+
+    Parameters
+    ----------
+    f : file object
+        File opened in binary mode.
+    line_index : dict
+        Line index to extend.
+
+    """
+    interval = line_index['interval']
+    byte_offsets = line_index['byte_offsets']
+    byte_offset = line_index['end_offset']
+    line_num = line_index['end_line_num']
+
+    f.seek(byte_offset)
+    for line in f:
+        if not line.endswith(b'\n'):
+            break  # Partially written line
+        if line_num % interval == 0:
+            byte_offsets.append(byte_offset)
+        byte_offset += len(line)
+        line_num += 1
+
+    line_index['end_offset'] = byte_offset
+    line_index['end_line_num'] = line_num
+
+
+def _keep_raw_lines(records, make_rows):
+    """
+    Iterator making the rows of records read with their raw lines, keeping each record's
+    raw line and values (as read, before being processed) with its row (see
+    Row.set_raw_line).
+
+    Parameters
+    ----------
+    records : iterable of tuple of int and _RawRecord
+        Line number and values of each record.
+    make_rows : callable
+        Iterator making one row of each record it is given (_make_table_rows or
+        _make_mixed_array_rows).
+
+    Yields
+    ------
+    Row or CompactRow
+        The next record's row.
+
+    """
+    raw_record = [None]  # Record being made a row of, left as read
+
+    def plain_records():
+        for line_num, record in records:
+            raw_record[0] = record
+            yield line_num, list(record)
+
+    for row in make_rows(plain_records()):
+        row.set_raw_line(raw_record[0].raw_line, raw_record[0])
+        yield row
+
+
+def _load_line_index(index_path):
+    """Loads a line index from its sidecar file.
+
+    Parameters
+    ----------
+    index_path : str
+        Line index file's absolute path.
+
+    Returns
+    -------
+    dict or None
+        The line index, or None if it does not exist or could not be read.
+
+    """
+    keys = {'interval', 'byte_offsets', 'end_offset', 'end_line_num', 'file_size', 'mtime',
+            'digest'}
+    try:
+        with open(index_path, 'r') as f:
+            line_index = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    if not isinstance(line_index, dict) or not keys.issubset(line_index):
+        return None
+
+    return line_index
+
+
+def _make_cursor(position):
+    """Creates a resume cursor from the position an input file was read up to.
+
+    Parameters
+    ----------
+    position : _ReadPosition
+        Position the file was read up to, fingerprinted by the reader while the file was
+        still open (see the resumable option of _process_table_rows).
+
+    Returns
+    -------
+    ReadCursor
+        Cursor to resume reading the file from.
+
+    """
+    return ReadCursor(position.byte_offset, position.line_num, position.device,
+                      position.inode, position.digest)
+
+
+def _make_mixed_array_rows(records, fix_floats=True, compact_rows=False, columns=None):
+    """Iterator making the rows of mixed array records.
+
+    Parameters
+    ----------
+    records : iterable of tuple of int and list of str
+        Line number and values of each record.
+    fix_floats : bool
+        Correct leading zeros for floating points values since many older CR-type
+        dataloggers strips leading zeros.
+    compact_rows : bool, optional
+        Yield CompactRow objects, sharing their header, instead of Row objects.
+    columns : collection of int, optional
+        Only keep these columns (indices). Other values are dropped before being processed.
+
+    Yields
+    ------
+    Row or CompactRow
+        The next record's row.
+
+    """
+    replacements = {'.': '0.', '-.': '-0.'}  # Patterns to look for
+    row_header = RowHeader([])
+    layouts = {}  # Selected columns, by number of values
+    for line_num, row in records:
+        if columns is not None:
+            try:
+                names, indices, selected_header = layouts[len(row)]
+            except KeyError:
+                names, indices, selected_header = layouts[len(row)] = (
+                    _select_columns(None, len(row), columns))
+            row = [row[i] for i in indices]
+
+        if fix_floats:
+            for i, value in enumerate(row):
+                for source, replacement in replacements.items():
+                    if value.startswith(source):
+                        row[i] = value.replace(source, replacement)
+
+        if columns is not None:
+            if compact_rows:
+                yield CompactRow(selected_header, row)
+            else:
+                yield Row(zip(names, row))
+        elif compact_rows:
+            if len(row) > len(row_header):
+                row_header = RowHeader(range(len(row)))
+            yield CompactRow(row_header, row)
+        else:
+            yield Row([(i, value) for i, value in enumerate(row)])
+
+
+def _make_table_rows(records, header=None, compact_rows=False, columns=None):
+    """Iterator making the rows of table records.
+
+    Parameters
+    ----------
+    records : iterable of tuple of int and list of str
+        Line number and values of each record.
+    header : list of str, optional
+        Column names to map to each rows' values.
+    compact_rows : bool, optional
+        Yield CompactRow objects, sharing their header, instead of Row objects.
+    columns : collection of str or int, optional
+        Only keep these columns (names or indices). Other values are dropped.
+
+    Yields
+    ------
+    Row or CompactRow
+        The next record's row.
+
+    """
+    if columns is not None:
+        layouts = {}  # Selected columns, by number of values
+        for line_num, row in records:
+            try:
+                names, indices, selected_header = layouts[len(row)]
+            except KeyError:
+                names, indices, selected_header = layouts[len(row)] = (
+                    _select_columns(header, len(row), columns))
+            if compact_rows:
+                yield CompactRow(selected_header, [row[i] for i in indices])
+            else:
+                yield Row(zip(names, [row[i] for i in indices]))
+    elif compact_rows:
+        row_header = RowHeader(header if header else [])
+        for line_num, row in records:
+            if not header and len(row) > len(row_header):
+                row_header = RowHeader(range(len(row)))
+            yield CompactRow(row_header, row)
+    elif header:
+        for line_num, row in records:
+            yield Row(
+                [(header, value) for header, value in zip(header, row)])
+    else:
+        for line_num, row in records:
+            yield Row([(i, value) for i, value in enumerate(row)])
+
+
+def _open_input(infile_path):
+    """
+    Opens an input file for reading in binary mode, transparently decompressing it if it is
+    gzip, bzip2 or xz compressed (as told by its first bytes).
+
+    Compressed files are decompressed as they are read, a buffer at a time. Byte offsets
+    (e.g. of cursors and line indexes) are then offsets into the decompressed data: seeking
+    to them decompresses the data before them again, without parsing it.
+
+    Parameters
+    ----------
+    infile_path : str
+        Input file's absolute path.
+
+    Returns
+    -------
+    file object
+        The opened file, or decompressed file (see _is_compressed).
+
+    """
+    with open(infile_path, 'rb') as f:
+        magic = f.read(6)
+
+    for compressed_magic, open_compressed in _COMPRESSED_FILE_OPENERS:
+        if magic.startswith(compressed_magic):
+            return open_compressed(infile_path, 'rb')
+
+    return open(infile_path, 'rb')
+
+
+def _parse_custom_time_formats(time_format_args_library, *time_values):
+    """
+    Parses CR-type datalogger specific time representations that are not supported
+    by the Python standard datetime module.
+
+    Parameters
+    ----------
+    time_format_args_library : list of str
+        List of the maximum expected string format columns sequence to match against
+        when parsing time values.
+    *time_values
+        Time strings to be matched against the datalogger parser time format library.
+
+    Returns
+    -------
+    namedtuple
+        Two comma separated strings in a namedtuple; one for the time string formats and
+        one for the time values.
+
+    """
+    parsing_info = namedtuple('ParsedCustomTimeInfo', ['parsed_time_format', 'parsed_time'])
+    found_time_format_args = []
+    found_time_values = []
+
+    for format_arg, time_arg in zip(time_format_args_library, time_values):
+        # Handle custom time formats here
+        if format_arg == '%H%M':
+            time_arg = _parse_hourminute(time_arg)
+        found_time_format_args.append(format_arg)
+        found_time_values.append(time_arg)
+
+    time_format_string = ','.join(found_time_format_args)
+    time_values_string = ','.join(found_time_values)
+
+    return parsing_info(time_format_string, time_values_string)
+
+
+def _parse_hourminute(hour_minute_str):
+    """
+    Parses the custom time format column 'Hour/Minute'. The time in the format HHMM is
+    determined by the length of the given time string since CR-type dataloggers using this
+    format does not  output hours and minutes with leading zeros (except for  midnight,
+    which is output as 0).
+
+    Examples of the 'Hour/Minute' pattern and how they would be parsed:
+
+    CR time string: '5'
+    HHMM time string: '0005'
+
+    CR time string: '35'
+    HHMM time string: '0035'
+
+    CR time string: '159'
+    HHMM time string: '0159'
+
+    CR time string: '2345'
+    HHMM time string: '2345'
+
+    Parameters
+    ----------
+    hour_minute_str : str
+        Hour/Minute string to be parsed.
+
+    Returns
+    -------
+    The time parsed in the format HHMM.
+
+    Raises
+    ------
+    TimeColumnValueError: If the given time column value could not be parsed.
+
+    """
+    if len(hour_minute_str) == 1:  # 0 - 9
+        minute = hour_minute_str
+        parsed_time = "000" + minute
+    elif len(hour_minute_str) == 2:  # 10 - 59
+        minute = hour_minute_str[-2:]
+        parsed_time = "00" + minute
+    elif len(hour_minute_str) == 3:  # 100 - 959
+        hour = hour_minute_str[:1]
+        minute = hour_minute_str[-2:]
+        parsed_time = "0" + hour + minute
+    elif len(hour_minute_str) == 4:  # 1000 - 2359
+        hour = hour_minute_str[:2]
+        minute = hour_minute_str[-2:]
+        parsed_time = hour + minute
+    else:
+        msg = "Hour/Minute {hour_minute} could not be parsed!".format(
+            hour_minute=hour_minute_str)
+        raise TimeColumnValueError(msg)
+
+    return parsed_time
+
+
+def _parse_time_columns(pytz_time_zone, time_format_args_library, *time_columns,
+                        **parsing_info):
+    """
+    Converts the time columns of a batch of rows into datetime objects, giving the same
+    result as calling _parse_time_values on each row.
+
+    Each row's time is split into its date and its time of day, which are parsed once per
+    distinct value (i.e. once per day and once per time of day logged) and added together
+    before localization. Rows whose time values can not be split and parsed that way are
+    parsed with _parse_time_values.
+
+    Parameters
+    ----------
+    pytz_time_zone : pytz time zone
+        Collected data's pytz time zone, used for localization and time conversion.
+    time_format_args_library : list of str
+        List of the maximum expected string format columns sequence to match against
+        when parsing time values.
+    *time_columns
+        Time string columns, holding one value per row.
+    **parsing_info
+        Additional parsing information (see _parse_time_values).
+
+    Returns
+    -------
+    list of datetime
+        Converted time of each row.
+
+    Raises
+    ------
+    TimeParsingError: If the time string format and time values of a row could not be
+        parsed to a datetime object and parsing errors are not ignored.
+
+    """
+    if parsing_info.get('time_format') is None:
+        parsing_info['time_format'] = _compile_time_format(time_format_args_library)
+
+    num_rows = len(time_columns[0]) if time_columns else 0
+    time_format_parts = [
+        _TIME_FORMAT_PARTS.get(format_arg) for format_arg in time_format_args_library]
+    if None in time_format_parts[:len(time_columns)] or not num_rows:
+        return [_parse_time_values(pytz_time_zone, time_format_args_library, *time_values,
+                                   **parsing_info)
+                for time_values in zip(*time_columns)]
+
+    # Date and time of day parts, and the time values to parse (from either part's values,
+    # prefix and suffix, or from a stand-in value) for each of them.
+    date_columns, date_args = [], []
+    time_of_day_columns, time_of_day_args, time_of_day_stand_ins = [], [], []
+    for (part, stand_in), column in zip(time_format_parts, time_columns):
+        if part == 'date':
+            date_args.append((len(date_columns), '', ''))
+            date_columns.append(column)
+            time_of_day_args.append(stand_in)
+        elif part == 'time':
+            date_args.append(stand_in)
+            time_of_day_args.append((len(time_of_day_columns), '', ''))
+            time_of_day_columns.append(column)
+            time_of_day_stand_ins.append(stand_in)
+        else:
+            date_args.append((len(date_columns), '', stand_in))
+            date_columns.append([value[:10] for value in column])
+            time_of_day_args.append((len(time_of_day_columns), '1900-01-01', ''))
+            time_of_day_columns.append([value[10:] for value in column])
+            time_of_day_stand_ins.append(stand_in)
+
+    strict_time_format = _compile_time_format(time_format_args_library, strict=True)
+
+    def parse(args, values):
+        try:
+            return strict_time_format(*[
+                arg if isinstance(arg, str) else arg[1] + values[arg[0]] + arg[2]
+                for arg in args])
+        except ValueError:
+            return None
+
+    midnight = parse(time_of_day_args, time_of_day_stand_ins)
+    date_keys = list(zip(*date_columns)) if date_columns else [()] * num_rows
+    time_of_day_keys = (
+        list(zip(*time_of_day_columns)) if time_of_day_columns else [()] * num_rows)
+
+    dates = {key: parse(date_args, key) for key in set(date_keys)}
+    times_of_day = {}
+    for key in set(time_of_day_keys):
+        time_of_day = parse(time_of_day_args, key)
+        times_of_day[key] = (
+            None if time_of_day is None or midnight is None else time_of_day - midnight)
+
+    localize = _time_zone_localizer(pytz_time_zone).localize
+    to_utc = parsing_info.get('to_utc', False)
+    parsed = []
+    for i, (date_key, time_of_day_key) in enumerate(zip(date_keys, time_of_day_keys)):
+        date = dates[date_key]
+        time_of_day = times_of_day[time_of_day_key]
+        if date is None or time_of_day is None:
+            parsed.append(_parse_time_values(
+                pytz_time_zone, time_format_args_library,
+                *[column[i] for column in time_columns], **parsing_info))
+        else:
+            parsed.append(localize(date + time_of_day, to_utc=to_utc))
+
+    return parsed
+
+
+def _parse_time_rows(data, time_zone, time_format_args_library, time_columns,
+                     time_parsed_column=None, replace_time_column=None, to_utc=False,
+                     batch_size=None):
+    """Iterator for parse_time. Parses each row's time columns as it is requested.
+
+    Parameters
+    ----------
+    data : iterable of Row
+        Rows to convert.
+    time_zone : str
+        String representation of a valid pytz time zone.
+    time_format_args_library : list of str
+        List of the maximum expected string format columns sequence to match against when
+        parsing time values.
+    time_columns : list of str or int
+        Column(s) (names or indices) to use for time conversion.
+    time_parsed_column : str, optional
+        Converted time column name. If not given, use the name of the first
+        time column.
+    replace_time_column : str or int, optional
+        Column (name or index) to place the parsed datetime object at. If not given,
+        insert at the first time column index.
+    to_utc : bool, optional
+        Convert time to UTC.
+    batch_size : int, optional
+        Read this many rows at a time and parse their time columns together (see
+        _parse_time_columns). If not given, parse each row's time columns as it is requested.
+
+    Yields
+    ------
+    Row or CompactRow
+        The next time converted row, of the same type as the row it is converted from.
+
+    Raises
+    ------
+    TimeColumnValueError: If not at least one time column is given or if the specified
+        time column to replace is not found.
+    UnknownPytzTimeZoneError: If the provided time zone is not a valid pytz time zone.
+
+    """
+    try:
+        pytz_time_zone = pytz.timezone(time_zone)
+    except pytz.UnknownTimeZoneError:
+        msg = "{time_zone} is not a valid pytz time zone! "
+        msg += "See pytz docs for valid time zones".format(time_zone=time_zone)
+        raise UnknownPytzTimeZoneError(msg)
+
+    if not time_format_args_library:
+        time_format_args_library = []
+    if not time_columns:
+        raise TimeColumnValueError("At least one time column is required!")
+
+    time_format = _compile_time_format(time_format_args_library)
+    row_layouts = {}  # Time column names to replace and read, by row column names
+    # Header and value indices (None for the time) of converted compact rows, by row header
+    compact_row_layouts = {}
+
+    def row_layout(row):
+        column_names = tuple(row.keys())
+        try:
+            return row_layouts[column_names]
+        except KeyError:
+            pass
+
+        if not replace_time_column:
+            replace_time_column_name = (
+                _find_first_time_column_name(
+                    column_names, time_columns)
+            )
+        else:
+            if replace_time_column not in column_names:
+                msg = "{0} not found in column names!".format(replace_time_column)
+                raise TimeColumnValueError(msg)
+
+            replace_time_column_name = replace_time_column
+
+        row_time_columns = [name for name in column_names if name in time_columns]
+        row_layouts[column_names] = replace_time_column_name, row_time_columns
+
+        return replace_time_column_name, row_time_columns
+
+    def convert_row(row, replace_time_column_name, row_time_converted):
+        old_name = replace_time_column_name
+        new_name = old_name
+        if time_parsed_column:
+            new_name = time_parsed_column
+
+        row_converted = Row(
+            (new_name if name == old_name else name, value) for name, value in row.items())
+        row_converted[new_name] = row_time_converted
+
+        for time_column in time_columns:
+            if time_column in row_converted and time_column != new_name:
+                del row_converted[time_column]
+
+        return row_converted
+
+    def convert_compact_row(row, replace_time_column_name, row_time_converted):
+        column_names = row.keys()
+        try:
+            header, value_indices = compact_row_layouts[column_names]
+        except KeyError:
+            # Convert a row of the value indices, to find where each converted value is from.
+            index_row = convert_row(
+                Row(zip(column_names, range(len(column_names)))), replace_time_column_name,
+                None)
+            header, value_indices = RowHeader(index_row.keys()), list(index_row.values())
+            compact_row_layouts[column_names] = header, value_indices
+
+        values = row.values()
+        return CompactRow(header, [row_time_converted if i is None else values[i]
+                                   for i in value_indices])
+
+    def convert_any_row(row, replace_time_column_name, row_time_converted):
+        if isinstance(row, CompactRow):
+            return convert_compact_row(row, replace_time_column_name, row_time_converted)
+
+        return convert_row(row, replace_time_column_name, row_time_converted)
+
+    rows = _data_generator(data)
+
+    if not batch_size:
+        for row in rows:
+            replace_time_column_name, row_time_columns = row_layout(row)
+            row_time_column_values = [row[name] for name in row_time_columns]
+            row_time_converted = (
+                _parse_time_values(
+                    pytz_time_zone, time_format_args_library,
+                    *row_time_column_values, to_utc=to_utc, time_format=time_format)
+            )
+
+            yield convert_any_row(row, replace_time_column_name, row_time_converted)
+
+        return
+
+    for batch in iter(lambda: list(itertools.islice(rows, batch_size)), []):
+        batch_layouts = [row_layout(row) for row in batch]
+        batch_time_column_values = [
+            [row[name] for name in row_time_columns]
+            for row, (_, row_time_columns) in zip(batch, batch_layouts)]
+
+        num_time_values = {len(values) for values in batch_time_column_values}
+        if len(num_time_values) == 1 and 0 not in num_time_values:
+            batch_time_converted = _parse_time_columns(
+                pytz_time_zone, time_format_args_library, *zip(*batch_time_column_values),
+                to_utc=to_utc, time_format=time_format)
+        else:
+            batch_time_converted = [
+                _parse_time_values(
+                    pytz_time_zone, time_format_args_library,
+                    *row_time_column_values, to_utc=to_utc, time_format=time_format)
+                for row_time_column_values in batch_time_column_values]
+
+        for row, (replace_time_column_name, _), row_time_converted in zip(
+                batch, batch_layouts, batch_time_converted):
+            yield convert_any_row(row, replace_time_column_name, row_time_converted)
+
+
+def _parse_time_values(pytz_time_zone, time_format_args_library, *time_values, **parsing_info):
+    """Converts datalogger model specific time representations into a datetime object.
+
+    Parameters
+    ----------
+    pytz_time_zone : pytz time zone
+        Collected data's pytz time zone, used for localization and time conversion.
+    time_format_args_library : list of str
+        List of the maximum expected string format columns sequence to match against
+        when parsing time values.
+    *time_values
+        Time strings to be parsed.
+    **parsing_info
+        Additional parsing information. If to_utc is given and true, the parsed time
+        will be converted to UTC. If ignore_parsing_error is present and true, set all
+        failed datetimes to epoch time and continue. If time_format is given, it is used
+        as the time format library compiled with _compile_time_format.
+
+    Returns
+    -------
+    datetime
+        Converted time.
+
+    Raises
+    ------
+    TimeParsingError: If the time string format and time values could not be
+        parsed to a datetime object and parsing errors are not ignored.
+
+    """
+    time_format = parsing_info.get('time_format')
+    if time_format is None:
+        time_format = _compile_time_format(time_format_args_library)
+
+    try:
+        dt = time_format(*time_values)
+    except ValueError:
+        parsed_time_format, parsed_time = _parse_custom_time_formats(
+            time_format_args_library, *time_values)
+        msg = "Could not parse time string {parsed_time} using the format {parsed_time_format}"
+        msg = msg.format(parsed_time=parsed_time, parsed_time_format=parsed_time_format)
+        print(msg)
+        ignore_parsing_error = parsing_info.get('ignore_parsing_error', False)
+
+        if ignore_parsing_error:
+            local_dt = datetime.fromtimestamp(0, pytz_time_zone)
+            msg = "Setting time value to epoch time ({epoch_dt})"
+            msg = msg.format(epoch_dt=str(local_dt))
+            print(msg)
+        else:
+            raise TimeParsingError(msg)
+    else:
+        try:
+            return _time_zone_localizer(pytz_time_zone).localize(
+                dt, to_utc=parsing_info.get('to_utc', False))
+        except ValueError:
+            print("Datetime already localized.")
+            local_dt = dt
+
+    parsed_dt = local_dt
+
+    if parsing_info.get('to_utc', False):
+        utc_dt = _convert_time_zone(local_dt, pytz.utc)
+        parsed_dt = utc_dt
+
+    return parsed_dt
+
+
+def _process_mixed_array_rows(infile_path, first_line_num=0, last_line_num=None, fix_floats=True,
+                              cursor=None, position=None, use_line_index=False,
+                              compact_rows=False, array_ids=None, columns=None,
+                              filters=None, follow=None, raw_lines=False, resumable=False):
+    """Iterator for _read_mixed_array_data.
+
+    Parameters
+    ----------
+    infile_path : str
+        Input file's absolute path.
+    first_line_num : int, optional
+        First line number to read. NOTE: Zero-based numbering.
+    last_line_num : int, optional
+        Last line number to read. NOTE: Zero-based numbering.
+    fix_floats : bool
+        Correct leading zeros for floating points values since many older CR-type
+        dataloggers strips leading zeros.
+    cursor : ReadCursor, optional
+        Resume reading from where a previous read left off. Ignored if the file has been
+        truncated or rotated since.
+    position : _ReadPosition, optional
+        Updated with the position read up to, to make a resume cursor from.
+    use_line_index : bool, optional
+        Seek to the first line number using the file's line index (see update_line_index).
+    compact_rows : bool, optional
+        Yield CompactRow objects, sharing their header, instead of Row objects.
+    array_ids : iterable of str, optional
+        Only read the rows of these array ids. Other lines are skipped without being split.
+    columns : collection of int, optional
+        Only read these columns (indices). Other values are dropped before being processed.
+    filters : dict, optional
+        Only read the rows matching these filters by column index (see _filter_records),
+        evaluated before the rows are processed.
+    follow : _FollowOptions, optional
+        Keep following the file for new lines once its end is reached (see
+        _follow_records).
+    raw_lines : bool, optional
+        Keep the line each row was read from with the row (see _keep_raw_lines).
+    resumable : bool, optional
+        Read complete lines only, stopping before a last line not (yet) terminated by a
+        newline, and fingerprint the file read up to once done (see _file_digest), for a
+        resume cursor to be made of the position.
+
+    Yields
+    ------
+    Row or CompactRow
+        The next row read and processed from a mixed array format CSV file.
+
+    """
+    if position is None:
+        position = _ReadPosition()
+
+    with _open_input(infile_path) as f:
+        if use_line_index:
+            _seek_line_index(f, infile_path, first_line_num, position)
+        _seek_cursor(f, cursor, position)
+        if array_ids is None:
+            iter_records = functools.partial(
+                _iter_records, first_line_num=first_line_num, last_line_num=last_line_num,
+                raw_lines=raw_lines)
+        else:
+            iter_records = functools.partial(
+                _iter_array_id_records, array_ids=array_ids, first_line_num=first_line_num,
+                last_line_num=last_line_num, raw_lines=raw_lines)
+        if follow is None:
+            records = iter_records(f, position, complete_lines=resumable)
+        else:
+            records = _follow_records(
+                f, infile_path, position, iter_records, follow, last_line_num)
+        if filters:
+            records = _filter_records(records, None, filters)
+
+        make_rows = functools.partial(
+            _make_mixed_array_rows, fix_floats=fix_floats, compact_rows=compact_rows,
+            columns=columns)
+        for row in _keep_raw_lines(records, make_rows) if raw_lines else make_rows(records):
+            yield row
+
+        if resumable:
+            position.digest = _file_digest(f, position.byte_offset)
+
+
+def _process_table_rows(infile_path, header=None, header_row=None, first_line_num=0,
+                        last_line_num=None, cursor=None, position=None, use_line_index=False,
+                        compact_rows=False, columns=None, filters=None, follow=None,
+                        raw_lines=False, resumable=False):
+    """Iterator for _read_table_data.
+
+    Parameters
+    ----------
+    infile_path : str
+        Input file's absolute path.
+    header : list of str, optional
+        Column names to map to each rows' values.
+    header_row : int, optional
+        Input file's header row to map to each rows' values.
+    first_line_num : int, optional
+        First line number to read. NOTE: Zero-based numbering.
+    last_line_num : int, optional
+        Last line number to read. NOTE: Zero-based numbering.
+    cursor : ReadCursor, optional
+        Resume reading from where a previous read left off. Ignored if the file has been
+        truncated or rotated since.
+    position : _ReadPosition, optional
+        Updated with the position read up to, to make a resume cursor from.
+    use_line_index : bool, optional
+        Seek to the first line number using the file's line index (see update_line_index).
+    compact_rows : bool, optional
+        Yield CompactRow objects, sharing their header, instead of Row objects.
+    columns : collection of str or int, optional
+        Only read these columns (names or indices). Other values are dropped.
+    filters : dict, optional
+        Only read the rows matching these filters by column (name or index) (see
+        _filter_records), evaluated before the rows are processed.
+    follow : _FollowOptions, optional
+        Keep following the file for new lines once its end is reached (see
+        _follow_records). The header is kept if the file is truncated or rotated, and its
+        header lines skipped when it is read again from its start.
+    raw_lines : bool, optional
+        Keep the line each row was read from with the row (see _keep_raw_lines).
+    resumable : bool, optional
+        Read complete lines only, stopping before a last line not (yet) terminated by a
+        newline, and fingerprint the file read up to once done (see _file_digest), for a
+        resume cursor to be made of the position.
+
+    Yields
+    ------
+    Row or CompactRow
+        The next row read and processed from a table format CSV file.
+
+    """
+    if position is None:
+        position = _ReadPosition()
+
+    with _open_input(infile_path) as f:
+        if isinstance(header_row, int) and header_row >= 0:
+            header = None
+            for line_num, row in _iter_records(f, position, last_line_num=header_row):
+                header = row
+        if use_line_index:
+            _seek_line_index(f, infile_path, first_line_num, position)
+        _seek_cursor(f, cursor, position)
+        if follow is None:
+            rows = _iter_records(f, position, first_line_num, last_line_num,
+                                 complete_lines=resumable, raw_lines=raw_lines)
+        else:
+            if isinstance(header_row, int) and header_row >= 0:
+                # Skip the header lines too when a truncated or rotated file is read again
+                # from its start.
+                first_line_num = max(first_line_num, header_row + 1)
+            iter_records = functools.partial(
+                _iter_records, first_line_num=first_line_num, last_line_num=last_line_num,
+                raw_lines=raw_lines)
+            rows = _follow_records(f, infile_path, position, iter_records, follow, last_line_num)
+        if filters:
+            rows = _filter_records(rows, header, filters)
+
+        make_rows = functools.partial(
+            _make_table_rows, header=header, compact_rows=compact_rows, columns=columns)
+        for row in _keep_raw_lines(rows, make_rows) if raw_lines else make_rows(rows):
+            yield row
+
+        if resumable:
+            position.digest = _file_digest(f, position.byte_offset)
+
+
+def _read_table_data(infile_path, header=None, header_row=None, first_line_num=0,
+                     last_line_num=None, parse_time_columns=False, time_zone='UTC',
+                     time_format_args_library=None, time_parsed_column=None,
+                     time_columns=None, to_utc=False, cursor=None, position=None,
+                     use_line_index=False, compact_rows=False, time_batch_size=None,
+                     columns=None, filters=None, follow=None, raw_lines=False,
+                     resumable=False):
+    """
+    Iterate over data read from a CSV file starting at a given line number, optionally
+    parsing each row's time columns.
+
+    Parameters
+    ----------
+    infile_path : str
+        Input file's absolute path.
+    header : list of str, optional
+        Column names to map to each rows' values.
+    header_row : int, optional
+        Input file's header row to map to each rows' values.
+    first_line_num : int, optional
+        First line number to read. NOTE: Zero-based numbering.
+    last_line_num : int, optional
+        Last line number to read. NOTE: Zero-based numbering.
+    parse_time_columns : bool, optional
+        Convert datalogger specific time string representations to datetime objects.
+    time_zone : str
+        String representation of a valid pytz time zone.
+    time_format_args_library : list of str
+        List of the maximum expected string format columns sequence to match against
+        when parsing time values.
+    time_parsed_column : str, optional
+        Converted time column name.
+    time_columns : list of str or int, optional
+        Column(s) (names or indices) to use for time conversion.
+    to_utc : bool, optional
+        Convert time to UTC.
+    cursor : ReadCursor, optional
+        Resume reading from where a previous read left off.
+    position : _ReadPosition, optional
+        Updated with the position read up to.
+    use_line_index : bool, optional
+        Seek to the first line number using the file's line index.
+    compact_rows : bool, optional
+        Yield CompactRow objects instead of Row objects.
+    time_batch_size : int, optional
+        Parse time columns in batches of this many rows (see _parse_time_rows).
+    columns : iterable of str or int, optional
+        Only read these columns (names, or indices for ints naming no column), and the time
+        columns if parsing time.
+    filters : dict, optional
+        Only read the rows matching these filters by column (name or index).
+    follow : _FollowOptions, optional
+        Keep following the file for new lines once its end is reached.
+    raw_lines : bool, optional
+        Keep the line each row was read from with the row.
+    resumable : bool, optional
+        Read complete lines only, and fingerprint the file read up to once done, for a
+        resume cursor to be made of the position.
+
+    Yields
+    ------
+    Row
+        The next row read and processed from an input CSV file.
+
+    """
+    if columns is not None:
+        columns = set(columns)
+        if parse_time_columns and time_columns:
+            columns.update(time_columns)
+
+    rows = _process_table_rows(
+        infile_path, header=header, header_row=header_row, first_line_num=first_line_num,
+        last_line_num=last_line_num, cursor=cursor, position=position,
+        use_line_index=use_line_index, compact_rows=compact_rows, columns=columns,
+        filters=filters, follow=follow, raw_lines=raw_lines, resumable=resumable)
+
+    if parse_time_columns:
+        rows = _parse_time_rows(
+            rows,
+            time_zone=time_zone,
+            time_format_args_library=time_format_args_library,
+            time_parsed_column=time_parsed_column,
+            time_columns=time_columns,
+            to_utc=to_utc,
+            batch_size=time_batch_size
+        )
+
+    for row in rows:
+        yield row
+
+
+def _raw_export_line(row, line_terminator='\n'):
+    """
+    Returns the raw line to export a row as: the source line it was read from, if kept and
+    the row's values are unchanged since (see Row.raw_line), ending with a line terminator.
+
+    Parameters
+    ----------
+    row : Row
+        Row to export.
+    line_terminator : str, optional
+        Line terminator to end a source line read without one with.
+
+    Returns
+    -------
+    str
+        The row's raw line, or None if the row has to be written value by value.
+
+    """
+    raw_line = getattr(row, 'raw_line', None)
+    if raw_line is not None and not raw_line.endswith('\n'):
+        raw_line += line_terminator
+
+    return raw_line
+
+
+def _raw_line_terminator(row):
+    """
+    Returns the line terminator of the source line a row was read from, to end the lines
+    written value by value next to raw lines with (see export_to_csv).
+
+    Parameters
+    ----------
+    row : Row
+        Row to export.
+
+    Returns
+    -------
+    str
+        The terminator of the row's source line, whether its values have changed since or
+        not, or a newline if the row's source line is not kept or not terminated.
+
+    """
+    raw = getattr(row, '_raw', None)
+    if raw is not None and raw[0].endswith('\r\n'):
+        return '\r\n'
+
+    return '\n'
+
+
+def _read_file(infile_path, reader, read_options):
+    """Reads a single file of a batch read, catching the error it may raise.
+
+    Parameters
+    ----------
+    infile_path : str
+        Input file's absolute path.
+    reader : str
+        Name of the reader to read the file with.
+    read_options : dict
+        Keyword arguments passed on to the reader.
+
+    Returns
+    -------
+    tuple
+        The data read and None, or None and the error raised while reading the file.
+
+    """
+    read_data = _FILE_READERS[reader]
+    try:
+        return read_data(infile_path, **read_options), None
+    except Exception as read_error:
+        return None, read_error
+
+
+def _read_files(files_read_info, processes=None):
+    """Iterator for iter_files_data and read_files_data.
+
+    Parameters
+    ----------
+    files_read_info : list of tuple
+        Input file path, reader name and read options of each file (see _files_read_info).
+    processes : int, optional
+        Number of worker processes reading files in parallel. Only as many files are
+        submitted to them at a time, so at most that many results are held back until
+        they are yielded.
+
+    Yields
+    ------
+    FileReadResult
+        The data read from, or the error raised while reading, the next file read.
+
+    """
+    if not processes:
+        for infile_path, reader, read_options in files_read_info:
+            data, error = _read_file(infile_path, reader, read_options)
+            yield FileReadResult(infile_path, data, error)
+        return
+
+    executor = ProcessPoolExecutor(max_workers=processes)
+    files_read_info = iter(files_read_info)
+    futures = {}
+    try:
+        while True:
+            for file_read_info in itertools.islice(files_read_info, processes - len(futures)):
+                futures[executor.submit(_read_file, *file_read_info)] = file_read_info[0]
+            if not futures:
+                break
+            done_futures, _ = wait(futures, return_when=FIRST_COMPLETED)
+            for future in done_futures:
+                try:
+                    data, error = future.result()
+                except Exception as read_error:
+                    # E.g. the data or error could not be sent back from the worker process.
+                    data, error = None, read_error
+                yield FileReadResult(futures.pop(future), data, error)
+    finally:
+        for future in futures:
+            future.cancel()
+        executor.shutdown()
+
+
+def _read_in_processes(read_data, infile_path, processes, header_row=None,
+                       first_line_num=0, last_line_num=None, cursor=None, position=None,
+                       use_line_index=False, resumable=False, **read_info):
+    """
+    Iterate over data read from a CSV file in several processes. The file is split into
+    chunks of whole lines (see _split_line_chunks), each read by read_data in a process of
+    its own, and the rows are yielded in file order (see _read_line_chunks). Compressed
+    files are read in the calling process.
+
+    Parameters
+    ----------
+    read_data : callable
+        Function reading the rows of a range of lines, from a given position
+        (_read_table_data or _read_mixed_array_data).
+    infile_path : str
+        Input file's absolute path.
+    processes : int
+        Maximum number of processes to read the file in.
+    header_row : int, optional
+        Input file's header row to map to each rows' values.
+    first_line_num : int, optional
+        First line number to read. NOTE: Zero-based numbering.
+    last_line_num : int, optional
+        Last line number to read. NOTE: Zero-based numbering.
+    cursor : ReadCursor, optional
+        Resume reading from where a previous read left off.
+    position : _ReadPosition, optional
+        Updated with the position read up to.
+    use_line_index : bool, optional
+        Seek to the first line number using the file's line index.
+    resumable : bool, optional
+        Read complete lines only, and fingerprint the file read up to once done, for a
+        resume cursor to be made of the position (see _process_table_rows).
+    **read_info
+        Additional keyword arguments passed on to read_data.
+
+    Yields
+    ------
+    Row
+        The next row read and processed from the file.
+
+    """
+    if position is None:
+        position = _ReadPosition()
+
+    with _open_input(infile_path) as f:
+        if isinstance(header_row, int) and header_row >= 0:
+            read_info['header'] = None
+            for line_num, row in _iter_records(f, position, last_line_num=header_row):
+                read_info['header'] = row
+        if use_line_index:
+            _seek_line_index(f, infile_path, first_line_num, position)
+        _seek_cursor(f, cursor, position)
+
+        if _is_compressed(f):
+            # Each process would have to decompress the file up to its chunk.
+            for row in read_data(infile_path, first_line_num=first_line_num,
+                                 last_line_num=last_line_num, position=position,
+                                 resumable=resumable, **read_info):
+                yield row
+            return
+
+        # Line numbers are only needed to find the chunks of a range of lines.
+        count_lines = first_line_num > position.line_num or isinstance(last_line_num, int)
+        chunks = _split_line_chunks(f, position, count_lines=count_lines)
+        for row in _read_line_chunks(read_data, infile_path, processes, chunks,
+                                     first_line_num, last_line_num, position,
+                                     resumable=resumable, **read_info):
+            yield row
+
+        if resumable:
+            position.digest = _file_digest(f, position.byte_offset)
+
+
+def _read_line_chunk(read_data, infile_path, chunk, **read_info):
+    """Reads the rows of a chunk of whole lines. Worker of _read_line_chunks.
+
+    Parameters
+    ----------
+    read_data : callable
+        Function reading the rows of a range of lines, from a given position.
+    infile_path : str
+        Input file's absolute path.
+    chunk : tuple
+        Byte offset and line number of the chunk's first line, the byte offset following
+        its last line, and the first and last line numbers to read. If the line numbers are
+        None, all of the chunk's lines are read, numbered from the chunk's first line.
+    **read_info
+        Additional keyword arguments passed on to read_data.
+
+    Returns
+    -------
+    tuple
+        The rows read, and the byte offset and line number read up to.
+
+    """
+    byte_offset, line_num, end_byte_offset, first_line_num, last_line_num = chunk
+    if line_num is None:
+        with open(infile_path, 'rb') as f:
+            f.seek(byte_offset)
+            num_lines, _ = _count_lines(f, end_byte_offset - byte_offset)
+        line_num, first_line_num, last_line_num = 0, 0, num_lines - 1
+    position = _ReadPosition(byte_offset, line_num)
+    rows = list(read_data(infile_path, first_line_num=first_line_num,
+                          last_line_num=last_line_num, position=position, **read_info))
+
+    return rows, position.byte_offset, position.line_num
+
+
+def _read_line_chunks(read_data, infile_path, processes, chunks, first_line_num, last_line_num,
+                      position, resumable=False, **read_info):
+    """
+    Iterate over the rows of chunks of whole lines within a range of line numbers, each
+    chunk read by read_data in a process of its own. Only as many chunks as there are
+    processes are read ahead of the rows yielded.
+
+    A chunk read up to short of its end holds the start of a record spanning into the next
+    chunk (a quoted value holding a line break), whose reader would start within it. The
+    rest of the file is then read in the calling process instead, from that record on.
+
+    Parameters
+    ----------
+    read_data : callable
+        Function reading the rows of a range of lines, from a given position.
+    infile_path : str
+        Input file's absolute path.
+    processes : int
+        Maximum number of processes to read the chunks in.
+    chunks : list of tuple
+        Byte offset and line number of each chunk's first line and of the line following it
+        (see _split_line_chunks). Chunks without line numbers are all read.
+    first_line_num : int
+        First line number to read. NOTE: Zero-based numbering.
+    last_line_num : int or None
+        Last line number to read. NOTE: Zero-based numbering.
+    position : _ReadPosition
+        Updated with the position read up to.
+    resumable : bool, optional
+        Read complete lines only (see _process_table_rows). The last chunk is then read
+        even if skipped over, to stop before a last line not terminated by a newline.
+    **read_info
+        Additional keyword arguments passed on to read_data.
+
+    Yields
+    ------
+    Row
+        The next row read and processed, in file order.
+
+    """
+    read_last_line_num = last_line_num
+    if not isinstance(last_line_num, int):
+        last_line_num = float('inf')
+
+    chunks_in_range = []
+    for i, (byte_offset, line_num, end_byte_offset, end_line_num) in enumerate(chunks):
+        if line_num is None:
+            chunks_in_range.append((byte_offset, None, end_byte_offset, None, None))
+            continue
+        if line_num > last_line_num:
+            break
+        if (first_line_num >= end_line_num and last_line_num >= end_line_num - 1 and
+                not (resumable and i == len(chunks) - 1)):
+            # Skipped over, as when reading line by line
+            position.byte_offset, position.line_num = end_byte_offset, end_line_num
+            continue
+        chunks_in_range.append((byte_offset, line_num, end_byte_offset,
+                                max(first_line_num, line_num),
+                                min(last_line_num, end_line_num - 1)))
+
+    if not chunks_in_range:
+        return
+
+    read_chunk = functools.partial(
+        _read_line_chunk, read_data, infile_path, resumable=resumable, **read_info)
+    executor = ProcessPoolExecutor(max_workers=processes)
+    chunks_to_read = iter(chunks_in_range)
+    futures = deque()  # Chunks being read and their futures, in file order
+    num_chunks_read = 0
+    try:
+        while True:
+            for chunk in itertools.islice(chunks_to_read, processes - len(futures)):
+                futures.append((chunk, executor.submit(read_chunk, chunk)))
+            if not futures:
+                return
+            chunk, future = futures.popleft()
+            rows, byte_offset, line_num = future.result()
+            num_chunks_read += 1
+            if chunk[1] is None:
+                line_num += position.line_num
+            position.byte_offset = byte_offset
+            position.line_num = line_num
+            for row in rows:
+                yield row
+            if num_chunks_read < len(chunks_in_range) and byte_offset != chunk[2]:
+                break
+    finally:
+        for chunk, future in futures:
+            future.cancel()
+        executor.shutdown()
+
+    for row in read_data(infile_path, first_line_num=first_line_num,
+                         last_line_num=read_last_line_num, position=position,
+                         resumable=resumable, **read_info):
+        yield row
+
+
+def _read_mixed_array_data(infile_path, first_line_num=0, last_line_num=None, fix_floats=True,
+                           cursor=None, position=None, use_line_index=False,
+                           compact_rows=False, array_ids=None, columns=None, filters=None,
+                           follow=None, raw_lines=False, resumable=False):
+    """Iterate over mixed data read from given a CSV file starting at a given line number.
+
+    Parameters
+    ----------
+    infile_path : str
+        Input file's absolute path.
+    first_line_num : int, optional
+        First line number to read. NOTE: Zero-based numbering.
+    last_line_num : int, optional
+        Last line number to read. NOTE: Zero-based numbering.
+    fix_floats : bool
+        Correct leading zeros for floating points values since many older CR-type
+        dataloggers strips leading zeros.
+    cursor : ReadCursor, optional
+        Resume reading from where a previous read left off.
+    position : _ReadPosition, optional
+        Updated with the position read up to.
+    use_line_index : bool, optional
+        Seek to the first line number using the file's line index.
+    compact_rows : bool, optional
+        Yield CompactRow objects instead of Row objects.
+    array_ids : iterable of str, optional
+        Only read the rows of these array ids.
+    columns : iterable of int, optional
+        Only read these columns (indices).
+    filters : dict, optional
+        Only read the rows matching these filters by column index.
+    follow : _FollowOptions, optional
+        Keep following the file for new lines once its end is reached.
+    raw_lines : bool, optional
+        Keep the line each row was read from with the row.
+    resumable : bool, optional
+        Read complete lines only, and fingerprint the file read up to once done, for a
+        resume cursor to be made of the position.
+
+    Returns
+    -------
+    Each processed row, one at a time.
+
+    """
+    for row in _process_mixed_array_rows(
+            infile_path=infile_path, first_line_num=first_line_num,
+            last_line_num=last_line_num, fix_floats=fix_floats, cursor=cursor,
+            position=position, use_line_index=use_line_index, compact_rows=compact_rows,
+            array_ids=array_ids, columns=None if columns is None else set(columns),
+            filters=filters, follow=follow, raw_lines=raw_lines, resumable=resumable):
+        yield row
+
+
+def _read_tob1_header(f):
+    """Reads the ASCII header lines of a TOB1 file.
 
     Parameters
     ----------
-    column_names : list of str or int
-        List of column names (or indices).
-    time_columns : list of str or int
-        List of column names (or indices) that represent time values.
+    f : file object
+        TOB1 file opened in binary mode, positioned at its start. Left positioned at the
+        first binary record.
 
     Returns
     -------
-    str or int
-        The column name or index of the first time column.
+    TOB1Header
+        The file's information, field names, units, processing and data types lines.
 
     Raises
     ------
-    TimeColumnValueError: If the first time column is not present in the list of
-        column names.
+    FileFormatError: If the file is not a TOB1 file.
 
     """
-    for name in column_names:
-        if name == time_columns[0]:
-            return name
-    else:
-        msg = "First time column '{first_time_column}' not found in column names!"
-        msg = msg.format(first_time_column=time_columns[0])
-        raise TimeColumnValueError(msg)
+    lines = [f.readline().decode('latin-1') for i in range(TOB1_HEADER_LINES)]
+    header = TOB1Header(*[next(csv.reader([line]), []) for line in lines])
 
+    if not header.file_info or header.file_info[0] != 'TOB1':
+        raise FileFormatError("Not a TOB1 file: {0}".format(f.name))
+    if len(header.names) != len(header.data_types):
+        raise FileFormatError("Mismatching TOB1 field names and data types")
 
-def _parse_custom_time_formats(time_format_args_library, *time_values):
-    """
-    Parses CR-type datalogger specific time representations that are not supported
-    by the Python standard datetime module.
+    return header
+
+
+def _read_tob3_header(f):
+    """Reads the ASCII header lines of a TOB3 file.
 
     Parameters
     ----------
-    time_format_args_library : list of str
-        List of the maximum expected string format columns sequence to match against
-        when parsing time values.
-    *time_values
-        Time strings to be matched against the datalogger parser time format library.
+    f : file object
+        TOB3 file opened in binary mode, positioned at its start. Left positioned at the
+        first data frame.
 
     Returns
     -------
-    namedtuple
-        Two comma separated strings in a namedtuple; one for the time string formats and
-        one for the time values.
-
-    """
-    parsing_info = namedtuple('ParsedCustomTimeInfo', ['parsed_time_format', 'parsed_time'])
-    found_time_format_args = []
-    found_time_values = []
-
-    for format_arg, time_arg in zip(time_format_args_library, time_values):
-        # Handle custom time formats here
-        if format_arg == '%H%M':
-            time_arg = _parse_hourminute(time_arg)
-        found_time_format_args.append(format_arg)
-        found_time_values.append(time_arg)
-
-    time_format_string = ','.join(found_time_format_args)
-    time_values_string = ','.join(found_time_values)
-
-    return parsing_info(time_format_string, time_values_string)
+    TOB3Header
+        The file's information, table information, field names, units, processing and data
+        types lines.
 
+    Raises
+    ------
+    FileFormatError: If the file is not a TOB3 file.
 
-def _parse_hourminute(hour_minute_str):
     """
-    Parses the custom time format column 'Hour/Minute'. The time in the format HHMM is
-    determined by the length of the given time string since CR-type dataloggers using this
-    format does not  output hours and minutes with leading zeros (except for  midnight,
-    which is output as 0).
-
-    Examples of the 'Hour/Minute' pattern and how they would be parsed:
+    lines = [f.readline().decode('latin-1') for i in range(TOB3_HEADER_LINES)]
+    header = TOB3Header(*[next(csv.reader([line]), []) for line in lines])
 
-    CR time string: '5'
-    HHMM time string: '0005'
+    if not header.file_info or header.file_info[0] != 'TOB3':
+        raise FileFormatError("Not a TOB3 file: {0}".format(f.name))
+    if len(header.names) != len(header.data_types):
+        raise FileFormatError("Mismatching TOB3 field names and data types")
 
-    CR time string: '35'
-    HHMM time string: '0035'
+    return header
 
-    CR time string: '159'
-    HHMM time string: '0159'
 
-    CR time string: '2345'
-    HHMM time string: '2345'
+def _row_export_values(row, format_datetime, conversions):
+    """
+    Returns the values of a row to export. Datetime values are converted to strings (see
+    _DatetimeFormatter) and None to 'None'. Other values are left to the CSV writer, which
+    converts them to strings as str does.
 
     Parameters
     ----------
-    hour_minute_str : str
-        Hour/Minute string to be parsed.
+    row : Row
+        Row to export.
+    format_datetime : callable
+        Function converting datetime values to strings.
+    conversions : dict
+        Indices of the values to convert, by the types of a row's values. Filled as rows of
+        new value types are exported.
 
     Returns
     -------
-    The time parsed in the format HHMM.
-
-    Raises
-    ------
-    TimeColumnValueError: If the given time column value could not be parsed.
+    list
+        The row's values, to write.
 
     """
-    if len(hour_minute_str) == 1:  # 0 - 9
-        minute = hour_minute_str
-        parsed_time = "000" + minute
-    elif len(hour_minute_str) == 2:  # 10 - 59
-        minute = hour_minute_str[-2:]
-        parsed_time = "00" + minute
-    elif len(hour_minute_str) == 3:  # 100 - 959
-        hour = hour_minute_str[:1]
-        minute = hour_minute_str[-2:]
-        parsed_time = "0" + hour + minute
-    elif len(hour_minute_str) == 4:  # 1000 - 2359
-        hour = hour_minute_str[:2]
-        minute = hour_minute_str[-2:]
-        parsed_time = hour + minute
-    else:
-        msg = "Hour/Minute {hour_minute} could not be parsed!".format(
-            hour_minute=hour_minute_str)
-        raise TimeColumnValueError(msg)
+    values = list(row.values())
+    value_types = tuple(map(type, values))
+    try:
+        indices = conversions[value_types]
+    except KeyError:
+        indices = conversions[value_types] = [
+            i for i, value_type in enumerate(value_types)
+            if value_type is type(None) or issubclass(value_type, datetime)]
+
+    for i in indices:
+        value = values[i]
+        if value is None:
+            values[i] = 'None'
+        else:
+            values[i] = format_datetime(value)
 
-    return parsed_time
+    return values
 
 
-def _parse_time_values(pytz_time_zone, time_format_args_library, *time_values, **parsing_info):
-    """Converts datalogger model specific time representations into a datetime object.
+def _scan_tob3_frames(f, header, record_size, pytz_time_zone, to_utc=False):
+    """
+    Finds the valid data frames of a TOB3 file from their headers and footers, without
+    reading their records. A frame holding minor frames (written when a table is closed
+    before its frame is full) yields one TOB3Frame per minor frame, found by walking the
+    minor frames backwards from the frame's end.
 
     Parameters
     ----------
+    f : file object
+        TOB3 file opened in binary mode, positioned at its first data frame.
+    header : TOB3Header
+        The file's header.
+    record_size : int
+        Size in bytes of a record.
     pytz_time_zone : pytz time zone
-        Collected data's pytz time zone, used for localization and time conversion.
-    time_format_args_library : list of str
-        List of the maximum expected string format columns sequence to match against
-        when parsing time values.
-    *time_values
-        Time strings to be parsed.
-    **parsing_info
-        Additional parsing information. If to_utc is given and true, the parsed time
-        will be converted to UTC. If ignore_parsing_error is present and true, set all
-        failed datetimes to epoch time and continue.
+        Time zone of the file's time stamps.
+    to_utc : bool, optional
+        Convert time stamps to UTC.
 
     Returns
     -------
-    datetime
-        Converted time.
-
-    Raises
-    ------
-    TimeParsingError: If the time string format and time values could not be
-        parsed to a datetime object and parsing errors are not ignored.
+    list of TOB3Frame
+        The file's valid, non-empty frames, in time stamp order.
 
     """
-    parsed_time_format, parsed_time = _parse_custom_time_formats(
-        time_format_args_library, *time_values)
+    frame_size, validation_stamps, time_resolution, record_interval = _tob3_table_info(header)
+    localizer = _time_zone_localizer(pytz_time_zone)
+    frame_overhead = TOB3_FRAME_HEADER_SIZE + TOB3_FRAME_FOOTER_SIZE
+    data_offset = f.tell()
+    file_size = os.fstat(f.fileno()).st_size
+
+    frames = []
+    for frame_offset in range(data_offset, file_size - frame_size + 1, frame_size):
+        minor_frames = []
+        end = frame_size
+        while end >= frame_overhead:
+            f.seek(frame_offset + end - TOB3_FRAME_FOOTER_SIZE)
+            footer, = struct.unpack('<I', f.read(TOB3_FRAME_FOOTER_SIZE))
+            if footer >> 16 not in validation_stamps or footer & _TOB3_EMPTY_FRAME:
+                break
+
+            start = 0
+            if footer & _TOB3_MINOR_FRAME:
+                start = end - (footer & _TOB3_MINOR_FRAME_SIZE_MASK)
+                if not 0 <= start <= end - frame_overhead:
+                    break
 
-    try:
-        dt = datetime.strptime(parsed_time, parsed_time_format)
-    except ValueError:
-        msg = "Could not parse time string {parsed_time} using the format {parsed_time_format}"
-        msg = msg.format(parsed_time=parsed_time, parsed_time_format=parsed_time_format)
-        print(msg)
-        ignore_parsing_error = parsing_info.get('ignore_parsing_error', False)
+            f.seek(frame_offset + start)
+            seconds, subseconds, record_num = struct.unpack(
+                '<III', f.read(TOB3_FRAME_HEADER_SIZE))
+            time_stamp = localizer.localize(CAMPBELL_EPOCH + timedelta(
+                seconds=seconds, microseconds=subseconds * time_resolution // 1000),
+                to_utc=to_utc)
 
-        if ignore_parsing_error:
-            local_dt = datetime.fromtimestamp(0, pytz_time_zone)
-            msg = "Setting time value to epoch time ({epoch_dt})"
-            msg = msg.format(epoch_dt=str(local_dt))
-            print(msg)
-        else:
-            raise TimeParsingError(msg)
-    else:
-        try:
-            local_dt = pytz_time_zone.localize(dt)
-        except ValueError:
-            print("Datetime already localized.")
-            local_dt = dt
+            num_records = (end - start - frame_overhead) // record_size
+            if num_records > 0:
+                minor_frames.append(
+                    TOB3Frame(frame_offset + start, time_stamp, record_num, num_records))
+            if start == 0:
+                break
+            end = start
 
-    parsed_dt = local_dt
+        frames.extend(reversed(minor_frames))
 
-    if parsing_info.get('to_utc', False):
-        utc_dt = local_dt.astimezone(pytz.utc)
-        parsed_dt = utc_dt
+    frames.sort(key=lambda frame: (frame.time_stamp, frame.record_num))
 
-    return parsed_dt
+    return frames
 
 
-def _process_mixed_array_rows(infile_path, first_line_num=0, last_line_num=None, fix_floats=True):
-    """Iterator for _read_mixed_array_data.
+def _seek_cursor(f, cursor, position):
+    """
+    Moves a file object to a resume cursor. Falls back to the given position if no cursor
+    is given, if the cursor lies before the position or if the file no longer matches the
+    cursor (i.e. it has been truncated or rotated).
+
+    Parameters
+    ----------
+    f : file object
+        File opened in binary mode.
+    cursor : ReadCursor or None
+        Cursor to resume reading from.
+    position : _ReadPosition
+        Position to fall back to. Updated with the cursor's position and the file's identity.
+
+    """
+    stat = os.fstat(f.fileno())
+    position.device = stat.st_dev
+    position.inode = stat.st_ino
+
+    if (cursor is not None and
+            cursor.byte_offset >= position.byte_offset and
+            (_is_compressed(f) or cursor.byte_offset <= stat.st_size) and
+            (cursor.device, cursor.inode) == (stat.st_dev, stat.st_ino) and
+            cursor.digest == _file_digest(f, cursor.byte_offset)):
+        position.byte_offset = cursor.byte_offset
+        position.line_num = cursor.line_num
+
+    f.seek(position.byte_offset)
+
+
+def _seek_line_index(f, infile_path, first_line_num, position):
+    """
+    Moves the given position to the closest line indexed at or before the first line number
+    to read, unless the position is already further into the file.
 
     Parameters
     ----------
+    f : file object
+        File opened in binary mode.
     infile_path : str
         Input file's absolute path.
-    first_line_num : int, optional
+    first_line_num : int
         First line number to read. NOTE: Zero-based numbering.
-    last_line_num : int, optional
-        Last line number to read. NOTE: Zero-based numbering.
-    fix_floats : bool
-        Correct leading zeros for floating points values since many older CR-type
-        dataloggers strips leading zeros.
+    position : _ReadPosition
+        Position to move.
 
-    Yields
-    ------
-    Row
-        The next row read and processed from a mixed array format CSV file.
+    """
+    line_index = _update_line_index(f, infile_path + LINE_INDEX_SUFFIX)
+    byte_offsets = line_index['byte_offsets']
+    entry = min(first_line_num // line_index['interval'], len(byte_offsets) - 1)
+    line_num = entry * line_index['interval']
+
+    if entry >= 0 and line_num > position.line_num:
+        position.byte_offset = byte_offsets[entry]
+        position.line_num = line_num
+
+
+def _select_columns(header, num_values, columns):
+    """Selects the columns of a record to read.
+
+    Parameters
+    ----------
+    header : list of str
+        Column names of the record's values. If not given, the columns are named by index.
+    num_values : int
+        Number of values in the record.
+    columns : collection of str or int
+        Columns to select. Each column is looked up by name first, and taken as an index
+        only if it is an int naming no column.
+
+    Returns
+    -------
+    tuple
+        The selected columns' names, their indices in the record, and a RowHeader of the
+        names (for compact rows).
 
     """
-    with open(infile_path, 'r') as f:
-        rows = csv.reader(f)
-        replacements = {'.': '0.', '-.': '-0.'}  # Patterns to look for
-        for row in rows:
-            # Correct reader for zero-based numbering
-            if first_line_num <= (rows.line_num - 1):
-                if isinstance(last_line_num, int) and last_line_num < (rows.line_num - 1):
-                    break
-                if fix_floats:
-                    for i, value in enumerate(row):
-                        for source, replacement in replacements.items():
-                            if value.startswith(source):
-                                row[i] = value.replace(source, replacement)
+    names = list(header) if header else list(range(num_values))
+    indices = set()
+    for column in columns:
+        column_indices = [i for i, name in enumerate(names) if name == column]
+        if column_indices:
+            indices.update(column_indices)
+        elif isinstance(column, int) and 0 <= column < len(names):
+            indices.add(column)
 
-                yield Row([(i, value) for i, value in enumerate(row)])
+    selected_indices = sorted(i for i in indices if i < num_values)
+    selected_names = tuple(names[i] for i in selected_indices)
 
+    return selected_names, selected_indices, RowHeader(selected_names)
 
-def _process_table_rows(infile_path, header=None, header_row=None, first_line_num=0,
-                        last_line_num=None):
-    """Iterator for _read_table_data.
+
+def _split_line_chunks(f, position, chunk_size=None, count_lines=False):
+    """
+    Splits the rest of a file into chunks of whole lines. The file is cut at approximate
+    byte offsets, each moved to the start of the line it falls in, so that it is not read
+    before being split.
 
     Parameters
     ----------
-    infile_path : str
-        Input file's absolute path.
-    header : list of str, optional
-        Column names to map to each rows' values.
-    header_row : int, optional
-        Input file's header row to map to each rows' values.
-    first_line_num : int, optional
-        First line number to read. NOTE: Zero-based numbering.
-    last_line_num : int, optional
-        Last line number to read. NOTE: Zero-based numbering.
+    f : file object
+        File opened in binary mode.
+    position : _ReadPosition
+        Position to split the file from.
+    chunk_size : int, optional
+        Approximate size in bytes of each chunk. Defaults to PARALLEL_READ_CHUNK_SIZE.
+    count_lines : bool, optional
+        Count the lines of each chunk, reading the file. Chunks starting within a quoted
+        value are then merged with the chunk before them.
 
-    Yields
-    ------
-    Row
-        The next row read and processed from a table format CSV file.
+    Returns
+    -------
+    list of tuple
+        Byte offset and line number of each chunk's first line, and the byte offset and
+        line number following its last line. The line numbers are None unless counted.
 
     """
-    with open(infile_path, 'r') as f:
-        rows = csv.reader(f)
-        if header:
-            pass
-        if isinstance(header_row, int) and header_row >= 0:
-            header = rows.__next__()
-            for i in range(header_row):
-                header = rows.__next__()
-        if header:
-            for row in rows:
-                if first_line_num <= (rows.line_num - 1):
-                    if isinstance(last_line_num, int) and last_line_num < (rows.line_num - 1):
-                        break
-                    yield Row(
-                        [(header, value) for header, value in zip(header, row)])
+    if chunk_size is None:
+        chunk_size = PARALLEL_READ_CHUNK_SIZE
+
+    f.seek(0, os.SEEK_END)
+    end_byte_offset = f.tell()
+
+    byte_offsets = [position.byte_offset]
+    while byte_offsets[-1] + chunk_size < end_byte_offset:
+        f.seek(byte_offsets[-1] + chunk_size - 1)
+        f.readline()
+        if f.tell() >= end_byte_offset:
+            break
+        byte_offsets.append(f.tell())
+    if byte_offsets[-1] < end_byte_offset:
+        byte_offsets.append(end_byte_offset)
+
+    if not count_lines:
+        return [(byte_offset, None, next_byte_offset, None)
+                for byte_offset, next_byte_offset in zip(byte_offsets, byte_offsets[1:])]
+
+    f.seek(position.byte_offset)
+    chunks = []
+    line_num = position.line_num
+    open_quote = False
+    for byte_offset, next_byte_offset in zip(byte_offsets, byte_offsets[1:]):
+        num_lines, num_quotes = _count_lines(f, next_byte_offset - byte_offset)
+        if open_quote:
+            chunk_byte_offset, chunk_line_num, _, _ = chunks.pop()
         else:
-            for row in rows:
-                if first_line_num <= (rows.line_num - 1):
-                    if isinstance(last_line_num, int) and last_line_num < (rows.line_num - 1):
-                        break
-                    yield Row([(i, value) for i, value in enumerate(row)])
+            chunk_byte_offset, chunk_line_num = byte_offset, line_num
+        line_num += num_lines
+        open_quote ^= num_quotes % 2 == 1
+        chunks.append((chunk_byte_offset, chunk_line_num, next_byte_offset, line_num))
 
+    return chunks
 
-def _read_table_data(infile_path, header=None, header_row=None, first_line_num=0,
-                     last_line_num=None):
-    """Iterate over data read from a CSV file starting at a given line number.
+
+def _time_zone_localizer(pytz_time_zone):
+    """Returns the (shared) localizer of a pytz time zone, creating it on first use.
 
     Parameters
     ----------
-    infile_path : str
-        Input file's absolute path.
-    header : list of str, optional
-        Column names to map to each rows' values.
-    header_row : int, optional
-        Input file's header row to map to each rows' values.
-    first_line_num : int, optional
-        First line number to read. NOTE: Zero-based numbering.
-    last_line_num : int, optional
-        Last line number to read. NOTE: Zero-based numbering.
+    pytz_time_zone : pytz time zone
+        Time zone to localize and convert to.
 
-    Yields
+    Returns
+    -------
+    _TimeZoneLocalizer
+        The time zone's localizer.
+
+    """
+    try:
+        return _TIME_ZONE_LOCALIZERS[pytz_time_zone]
+    except KeyError:
+        localizer = _TIME_ZONE_LOCALIZERS[pytz_time_zone] = _TimeZoneLocalizer(pytz_time_zone)
+        return localizer
+
+
+def _tob3_table_info(header):
+    """Reads the frame layout and timing of a TOB3 file from its table information line.
+
+    Parameters
+    ----------
+    header : TOB3Header
+        The file's header.
+
+    Returns
+    -------
+    tuple of int, set of int, int and int
+        Frame size in bytes, the frames' valid validation stamps, nanoseconds per unit of
+        the frames' sub-second time stamps and the record interval in nanoseconds.
+
+    Raises
     ------
-    Row
-        The next row read and processed from an input CSV file.
+    FileFormatError: If the table information is missing or invalid.
 
     """
-    for row in _process_table_rows(
-            infile_path, header=header, header_row=header_row, first_line_num=first_line_num,
-            last_line_num=last_line_num):
-        yield row
+    try:
+        frame_size = int(header.table_info[2])
+        validation_stamp = int(header.table_info[4])
+        time_resolution = _TOB3_FRAME_TIME_RESOLUTIONS[header.table_info[5].upper()]
+        interval, interval_unit = header.table_info[1].split()
+        record_interval = int(interval) * _TIME_UNIT_NANOSECONDS[interval_unit.upper().rstrip('S')]
+    except (IndexError, KeyError, ValueError):
+        raise FileFormatError("Invalid TOB3 table information: {0}".format(header.table_info))
 
+    # Frames written on every other pass through a ring file carry the stamp's complement.
+    validation_stamps = {validation_stamp, 0xFFFF ^ validation_stamp}
 
-def _read_mixed_array_data(infile_path, first_line_num=0, last_line_num=None, fix_floats=True):
-    """Iterate over mixed data read from given a CSV file starting at a given line number.
+    return frame_size, validation_stamps, time_resolution, record_interval
+
+
+def _update_line_index(f, index_path, interval=None):
+    """
+    Loads a file's line index and brings it up to date. The index is extended if the file
+    has grown since it was indexed, and rebuilt if it no longer matches the file (i.e. the
+    file has been truncated, rotated or rewritten). Changes are saved back to the index
+    file, if possible.
 
     Parameters
     ----------
-    infile_path : str
-        Input file's absolute path.
-    first_line_num : int, optional
-        First line number to read. NOTE: Zero-based numbering.
-    last_line_num : int, optional
-        Last line number to read. NOTE: Zero-based numbering.
-    fix_floats : bool
-        Correct leading zeros for floating points values since many older CR-type
-        dataloggers strips leading zeros.
+    f : file object
+        File opened in binary mode.
+    index_path : str
+        Line index file's absolute path.
+    interval : int, optional
+        Number of lines between two index entries. Defaults to the existing index's
+        interval, or LINE_INDEX_INTERVAL.
 
     Returns
     -------
-    Each processed row, one at a time.
+    dict
+        Up to date line index.
 
     """
-    for row in _process_mixed_array_rows(
-            infile_path=infile_path, first_line_num=first_line_num,
-            last_line_num=last_line_num, fix_floats=fix_floats):
-        yield row
+    stat = os.fstat(f.fileno())
+    line_index = _load_line_index(index_path)
+
+    if line_index is not None:
+        if interval is not None and interval != line_index['interval']:
+            line_index = None
+        elif (line_index['file_size'], line_index['mtime']) == (stat.st_size, stat.st_mtime):
+            return line_index
+        elif not ((_is_compressed(f) or line_index['end_offset'] <= stat.st_size) and
+                  _file_digest(f, line_index['end_offset']) == line_index['digest']):
+            line_index = None
+
+    if line_index is None:
+        line_index = {
+            'interval': interval or LINE_INDEX_INTERVAL,
+            'byte_offsets': [],
+            'end_offset': 0,
+            'end_line_num': 0
+        }
+
+    _index_lines(f, line_index)
+    line_index['file_size'] = stat.st_size
+    line_index['mtime'] = stat.st_mtime
+    line_index['digest'] = _file_digest(f, line_index['end_offset'])
+
+    # Written to a file of its own first, for concurrent readers not to write over each
+    # other's index before it is moved into place.
+    temp_index_path = None
+    try:
+        with tempfile.NamedTemporaryFile(
+                'w', dir=os.path.dirname(index_path) or os.curdir,
+                prefix=os.path.basename(index_path) + '.', suffix='.tmp',
+                delete=False) as f_out:
+            temp_index_path = f_out.name
+            json.dump(line_index, f_out)
+        os.replace(temp_index_path, index_path)
+    except OSError:
+        # E.g. read-only archive, use the index without saving it
+        if temp_index_path is not None and os.path.exists(temp_index_path):
+            os.remove(temp_index_path)
+
+    return line_index
 
 
 def _values_to_strings(row, include_time_zone=False):
@@ -588,31 +3739,53 @@ datetime.datetime(2016, 5, 2, 21, 34, 15, tzinfo=<DstTzInfo 'Asia/Hong_Kong' HKT
         raise UnknownPytzTimeZoneError(msg)
 
     data_time_zone_converted = DataSet([])
+    localizer = _time_zone_localizer(pytz_to_time_zone)
 
     for row in _data_generator(data):
-        row[time_column] = _convert_time_zone(row.get(time_column), pytz_to_time_zone)
+        row[time_column] = localizer.from_datetime(row.get(time_column))
         data_time_zone_converted.append(row)
 
     return data_time_zone_converted
 
 
 def export_array_ids_to_csv(data, array_ids_info, export_header=False,
-                            mode='a+', include_time_zone=False):
+                            mode='a+', include_time_zone=False, max_open_files=None,
+                            check_header=False, dialect=None, time_format=None,
+                            raw_lines=False):
     """Write array id separated data to a CSV file.
 
+    The data is streamed: each row is read once and written to its array id's output
+    file. Output files are kept open (and their writes buffered) while rows are routed to
+    them, at most max_open_files at a time.
+
     Parameters
     ----------
-    data : dict
-        Data set to export.
+    data : dict of DataSet or iterable of Row
+        Data set to export. Either array id separated data, or mixed array data whose rows'
+        first value is their array id, e.g. a DataSet or the rows of iter_mixed_array_data.
     array_ids_info : dict
         Array ids to export. Contains output file paths.
     export_header : bool, optional
         Write file header at the top of the output file.
     mode : str, optional
         Output file open mode, defaults to a+. See Python Docs for other
-        mode options.
+        mode options. Output files closed to open others are reopened in append mode.
     include_time_zone : bool, optional
         Include time zone in string converted datetime values.
+    max_open_files : int, optional
+        Maximum number of output files kept open at a time. The least recently written to
+        file is closed to open another. Defaults to EXPORT_MAX_OPEN_FILES.
+    check_header : bool, optional
+        Check that the header of each output file already holding data matches the column
+        names of the first row exported to it (see export_to_csv).
+    dialect : csv.Dialect or str, optional
+        CSV dialect to write in (see export_to_csv).
+    time_format : str, optional
+        Format of string converted datetime values (see export_to_csv).
+    raw_lines : bool, optional
+        Write rows read with their raw lines, and left unchanged since, as these lines
+        (see export_to_csv). The lines of each file written value by value end like the
+        source line of the first row exported to it.
 
     Examples
     --------
@@ -644,35 +3817,68 @@ def export_array_ids_to_csv(data, array_ids_info, export_header=False,
     ------
     ArrayIdsInfoValueError: If not at least one array id in array_ids_info is found.
     ArrayIdsExportInfoError: If no information for a certain array id is found.
+    HeaderMismatchError: If checking headers, and an output file's header does not match
+        the columns exported to it.
+    ValueError: If the time format is not one of the named formats, or if writing raw
+        lines in a given dialect.
 
     """
     if len(array_ids_info) < 1:
         raise ArrayIdsInfoValueError("At least one array id must be given!")
+    if raw_lines and dialect is not None:
+        raise ValueError("Raw lines can not be written in a given dialect")
+
+    file_paths = {}  # Output file paths, by array id
+    headed_file_paths = set()  # Output file paths whose header has been seen to
+    format_datetime = _DatetimeFormatter(time_format, include_time_zone).format
+    conversions = {}  # Indices of the values to convert, by value types
+    with _OutputFiles(mode, max_open_files, dialect=dialect,
+                      newline='' if raw_lines else None) as output_files:
+        for array_id, row in _iter_array_id_rows(data, array_ids_info):
+            try:
+                file_path = file_paths[array_id]
+            except KeyError:
+                export_info = array_ids_info.get(array_id)
+                if not export_info:
+                    msg = "No information was found for array id {0}".format(array_id)
+                    raise ArrayIdsExportInfoError(msg)
+                file_path = export_info.get('file_path')
+                if not file_path:
+                    msg = "Not file path was found for array id {0}".format(array_id)
+                    raise ArrayIdsExportInfoError(msg)
+                file_paths[array_id] = file_path
+
+            if file_path not in headed_file_paths:
+                header = [str(key) for key in row.keys()]
+                existing_header = None
+                if export_header or check_header:
+                    existing_header = _existing_header(file_path, mode)
+                if check_header and existing_header not in (None, _csv_line(header, dialect)):
+                    msg = "Header of {0} does not match columns {1}".format(file_path, header)
+                    raise HeaderMismatchError(msg)
+                line_terminator = _raw_line_terminator(row) if raw_lines else None
+                f_out, writer = output_files.get(file_path, line_terminator)
+                if export_header and existing_header is None:
+                    writer.writerow(header)
+                headed_file_paths.add(file_path)
+            else:
+                f_out, writer = output_files.get(file_path)
 
-    data_filtered = filter_mixed_array_data(data, *array_ids_info.keys())
-
-    for array_id, array_id_data in data_filtered.items():
-        export_info = array_ids_info.get(array_id)
-        if not export_info:
-            msg = "No information was found for array id {0}".format(array_id)
-            raise ArrayIdsExportInfoError(msg)
-        file_path = export_info.get('file_path')
-        if not file_path:
-            msg = "Not file path was found for array id {0}".format(array_id)
-            raise ArrayIdsExportInfoError(msg)
-
-        export_to_csv(
-            data=array_id_data,
-            outfile_path=file_path,
-            export_header=export_header,
-            mode=mode,
-            include_time_zone=include_time_zone)
+            raw_line = _raw_export_line(row, writer.dialect.lineterminator) if raw_lines else None
+            if raw_line is None:
+                writer.writerow(_row_export_values(row, format_datetime, conversions))
+            else:
+                f_out.write(raw_line)
 
 
 def export_to_csv(data, outfile_path, export_header=False, mode='a+',
-                  include_time_zone=False):
+                  include_time_zone=False, check_header=False, dialect=None,
+                  time_format=None, raw_lines=False):
     """Write data set to a CSV file.
 
+    Rows are written straight from the data set, through a CSV writer (quoting values
+    holding delimiters, quote characters or line breaks) and a large write buffer.
+
     Parameters
     ----------
     data : DataSet
@@ -680,12 +3886,39 @@ def export_to_csv(data, outfile_path, export_header=False, mode='a+',
     outfile_path : str
         Output file's absolute path.
     export_header : bool, optional
-        Write file header at the top of the output file.
+        Write file header at the top of the output file, unless the file already holds
+        data (i.e. is not empty and is not opened for truncation). Only the file's size and
+        first line are looked at, so appending to a large file costs no more than the rows
+        appended.
     mode : str, optional
         Output file open mode, defaults to a+. See Python Docs for other
         mode options.
     include_time_zone : bool, optional
         Include time zone in string converted datetime values.
+    check_header : bool, optional
+        Check that the header (first line) of an output file already holding data matches
+        the column names of the first row exported, before anything is written.
+    dialect : csv.Dialect or str, optional
+        CSV dialect to write in (see the csv module), e.g. 'excel' or 'excel-tab'. Defaults
+        to comma separated values, each line ending with a newline.
+    time_format : str, optional
+        Format of string converted datetime values: 'default' ('2016-05-02 12:34:15'),
+        'iso' (ISO 8601, '2016-05-02T12:34:15') or 'epoch' (seconds since 1970-01-01 UTC).
+        Time zones are included as UTC offsets ('+0200', or '+02:00' if ISO 8601) if
+        include_time_zone is true.
+    raw_lines : bool, optional
+        Write rows read with their raw lines (see read_table_data), and whose values are
+        unchanged since, as these lines: byte for byte as read, quoting and line breaks
+        included, without being converted value by value. Other rows, and the header, are
+        written as usual, their lines ending like the first row's source line (e.g. with
+        '\\r\\n'). Can not be combined with a dialect.
+
+    Raises
+    ------
+    HeaderMismatchError: If checking the header, and the output file's header does not
+        match the columns exported.
+    ValueError: If the time format is not one of the named formats, or if writing raw
+        lines in a given dialect.
 
     Examples
     --------
@@ -718,25 +3951,48 @@ def export_to_csv(data, outfile_path, export_header=False, mode='a+',
     >>> shutil.rmtree(temp_dir)
 
     """
-    data_to_export = DataSet([
-        Row([(name, value) for name, value in row.items()]) for row in data])
-
+    format_datetime = _DatetimeFormatter(time_format, include_time_zone).format
+    if raw_lines and dialect is not None:
+        raise ValueError("Raw lines can not be written in a given dialect")
     os.makedirs(os.path.dirname(outfile_path), exist_ok=True)
 
-    if os.path.exists(outfile_path) and export_header:
-        with open(outfile_path, 'r') as f:
-            f_list = [line.strip() for line in f]
-        if len(f_list) > 0:
-            export_header = False
-
-    with open(outfile_path, mode) as f_out:
-        for row in _data_generator(data_to_export):
-            if export_header:
-                header = [str(key) for key in row.keys()]
-                f_out.write(",".join(header) + "\n")
-                export_header = False
+    rows = _data_generator(data)
+    first_row = next(rows, None)
+    header = None if first_row is None else [str(key) for key in first_row.keys()]
+
+    existing_header = None
+    if export_header or check_header:
+        existing_header = _existing_header(outfile_path, mode)
+    if existing_header is not None:
+        export_header = False
+    if check_header and existing_header is not None and header is not None:
+        if _csv_line(header, dialect) != existing_header:
+            msg = "Header of {0} does not match columns {1}".format(outfile_path, header)
+            raise HeaderMismatchError(msg)
+
+    with open(outfile_path, mode, buffering=EXPORT_BUFFER_SIZE,
+              newline='' if raw_lines else None) as f_out:
+        if first_row is None:
+            return
+
+        line_terminator = _raw_line_terminator(first_row) if raw_lines else '\n'
+        writer = _csv_writer(f_out, dialect, line_terminator)
+        if export_header:
+            writer.writerow(header)
+
+        conversions = {}  # Indices of the values to convert, by value types
+        rows = itertools.chain([first_row], rows)
+        if not raw_lines:
+            writer.writerows(
+                _row_export_values(row, format_datetime, conversions) for row in rows)
+            return
 
-            f_out.write(",".join(_values_to_strings(row, include_time_zone)) + "\n")
+        for row in rows:
+            raw_line = _raw_export_line(row, line_terminator)
+            if raw_line is None:
+                writer.writerow(_row_export_values(row, format_datetime, conversions))
+            else:
+                f_out.write(raw_line)
 
 
 def extract_columns_data(data, *column_names, **time_range):
@@ -748,7 +4004,10 @@ def extract_columns_data(data, *column_names, **time_range):
         Data set to extract from.
     *column_names : Column(s) to extract.
     **time_range : Extract data from, to or between timestamps. If this mode is used, the
-        data set must be time converted.
+        data set must be time converted. If the data set is indexed by the time column
+        (see DataSet.index_time), or if sorted_by_time is given and true (the data set is
+        then taken to be sorted by its time column, as logged data usually is), only the
+        rows within the time range are looked at.
 
     Returns
     -------
@@ -839,50 +4098,578 @@ def filter_mixed_array_data(data, *array_ids):
     defaultdict(<class 'campbellsciparser.dataset.DataSet'>, {'100': DataSet([Row([('ID', \
 '100'), ('Year', '2016'), ('Julian Day', '123'), ('Data', '54.2')])])})
 
-    >>> filter_mixed_array_data(data, '101')
-    defaultdict(<class 'campbellsciparser.dataset.DataSet'>, {'101': DataSet([Row([('ID', \
-'101'), ('Year', '2016'), ('Julian Day', '123'), ('Hour/Minute', '1245'), ('Data', '44.2')])])})
-    >>> data_filtered = filter_mixed_array_data(data, '100', '101')
-    >>> data_filtered.get('100')
-    DataSet([Row([('ID', '100'), ('Year', '2016'), ('Julian Day', '123'), ('Data', '54.2')])])
-    >>> data_filtered.get('101')
-    DataSet([Row([('ID', '101'), ('Year', '2016'), ('Julian Day', '123'), ('Hour/Minute', \
-'1245'), ('Data', '44.2')])])
+    >>> filter_mixed_array_data(data, '101')
+    defaultdict(<class 'campbellsciparser.dataset.DataSet'>, {'101': DataSet([Row([('ID', \
+'101'), ('Year', '2016'), ('Julian Day', '123'), ('Hour/Minute', '1245'), ('Data', '44.2')])])})
+    >>> data_filtered = filter_mixed_array_data(data, '100', '101')
+    >>> data_filtered.get('100')
+    DataSet([Row([('ID', '100'), ('Year', '2016'), ('Julian Day', '123'), ('Data', '54.2')])])
+    >>> data_filtered.get('101')
+    DataSet([Row([('ID', '101'), ('Year', '2016'), ('Julian Day', '123'), ('Hour/Minute', \
+'1245'), ('Data', '44.2')])])
+
+    Raises:
+        DataTypeError: if anything else than list or dictionary data is given.
+
+    """
+    data_filtered = defaultdict(DataSet)
+
+    if isinstance(data, dict):
+        if not array_ids:
+            return data
+        for array_id, array_id_data in data.items():
+            if array_id in array_ids:
+                data_filtered[array_id] = array_id_data
+    elif isinstance(data, DataSet):
+        for row in _data_generator(data):
+            try:
+                array_id_name = list(row.values())[0]
+            except IndexError:
+                continue
+            if not array_ids:
+                # Append to unfiltered data set, but split by array ids.
+                data_filtered[array_id_name].append(row)
+            else:
+                if array_id_name in array_ids:
+                    data_filtered[array_id_name].append(row)
+    else:
+        msg = "Data collection of type {data_type} not supported. "
+        msg += "Valid collection types are dict and list.".format(data_type=type(data))
+        raise DataSetTypeError(msg)
+
+    return data_filtered
+
+
+def iter_array_ids_data(infile_path, first_line_num=0, last_line_num=None, fix_floats=True,
+                        array_id_names=None, cursor=None, use_line_index=False,
+                        compact_rows=False, follow=False, poll_interval=None,
+                        idle_timeout=None, raw_lines=False):
+    """
+    Iterate over data filtered by array id (each rows' first element) read from a file,
+    one row at a time. Streaming counterpart of read_array_ids_data, which never holds
+    more than one row in memory.
+
+    Parameters
+    ----------
+    infile_path : str
+        Input file's absolute path.
+    first_line_num : int, optional
+        First line number to read. NOTE: Zero-based numbering.
+    last_line_num : int, optional
+        Last line number to read. NOTE: Zero-based numbering.
+    fix_floats : bool
+        Correct leading zeros for floating points values since many older CR-type
+        dataloggers strips leading zeros.
+    array_id_names : dict
+        Lookup table for array id name translation. If given, only rows of these array
+        ids are yielded.
+    cursor : ReadCursor, optional
+        Resume reading from where a previous read left off. If the file has been
+        truncated or rotated since, it is read from the start instead.
+    use_line_index : bool, optional
+        Seek to the first line number using the file's line index (see update_line_index).
+    compact_rows : bool, optional
+        Yield CompactRow objects instead of Row objects. Compact rows share a single
+        header instead of each holding their own column names, which takes far less
+        memory for wide tables.
+    follow : bool, optional
+        Keep the file open once its end is reached, and go on yielding new lines as they
+        are appended to it (e.g. by LoggerNet), polling it for new complete lines. A last
+        line not yet terminated by a newline is held back until it is. A truncated file is
+        read again from its start, and a rotated file (its path leading to a new file) is
+        read to its end before the new file is read from its start.
+    poll_interval : float, optional
+        Seconds between two checks for new lines when following the file. Defaults to
+        FOLLOW_POLL_INTERVAL.
+    idle_timeout : float, optional
+        Stop following the file once no new line has been read for this many seconds. The
+        file is followed until the iterator is closed by default.
+    raw_lines : bool, optional
+        Keep the line each row was read from with the row (see Row.raw_line), for the
+        exporters to write rows left unchanged byte for byte as read (see export_to_csv).
+        Rows whose floats are fixed do not count as unchanged (see fix_floats).
+
+    Yields
+    ------
+    tuple of str and Row
+        The next row's array id (or its translated name) and the row itself.
+
+    Examples
+    --------
+    >>> import shutil
+    >>> import tempfile
+    >>> temp_dir = tempfile.mkdtemp()
+    >>> temp_outfile = os.path.join(temp_dir, 'temp_outfile.dat')
+
+    >>> data = DataSet([
+    ...     Row([('ID', '100'), ('Year', '2016'), ('Julian Day', '123'), ('Data', '54.2')]),
+    ...     Row([('ID', '101'), ('Year', '2016'), ('Julian Day', '123'),
+    ...     ('Hour/Minute', '1245'), ('Data', '44.2')])
+    ... ])
+    >>> export_to_csv(data, temp_outfile)
+
+    >>> for array_name, row in iter_array_ids_data(temp_outfile, array_id_names={'101': 'Hourly'}):
+    ...     print(array_name, row)
+    ...
+    Hourly Row([(0, '101'), (1, '2016'), (2, '123'), (3, '1245'), (4, '44.2')])
+
+    >>> shutil.rmtree(temp_dir)
+
+    """
+    if not array_id_names:
+        array_id_names = {}
+
+    for row in _read_mixed_array_data(
+            infile_path=infile_path, first_line_num=first_line_num,
+            last_line_num=last_line_num, fix_floats=fix_floats, cursor=cursor,
+            use_line_index=use_line_index, compact_rows=compact_rows,
+            array_ids=array_id_names or None,
+            follow=_FollowOptions(poll_interval, idle_timeout) if follow else None,
+            raw_lines=raw_lines):
+        try:
+            array_id = row[0]
+        except KeyError:
+            continue
+        yield array_id_names.get(array_id) or array_id, row
+
+
+def iter_files_data(infile_paths, reader='table', read_options=None, processes=None,
+                    **common_read_options):
+    """
+    Iterate over the data of a batch of files (e.g. one per station), one file at a time,
+    reading them concurrently with a bounded pool of worker processes.
+
+    An error raised while reading a file does not stop the batch: it is returned in place of
+    the file's data.
+
+    Parameters
+    ----------
+    infile_paths : str or list of str
+        Input files' absolute paths, or a glob pattern matching them (read in sorted order).
+    reader : str, optional
+        Reader of the files: 'table' (read_table_data, the default), 'mixed_array'
+        (read_mixed_array_data), 'array_ids' (read_array_ids_data), 'tob1'
+        (read_tob1_data) or 'tob3' (read_tob3_data).
+    read_options : dict of dict, optional
+        Read options of specific files, by input file path (as given or matched by the
+        glob pattern). They override the common read options, and may also name another
+        reader under the 'reader' key.
+    processes : int, optional
+        Number of worker processes reading files in parallel, at most one file per process
+        at a time. Files are read one after the other in the calling process by default.
+        The read options, data and errors must be picklable to be sent between processes.
+    common_read_options
+        Keyword arguments passed on to the reader of every file, e.g. header_row,
+        time_columns, time_zone or array_id_names.
+
+    Yields
+    ------
+    FileReadResult
+        The next file read, with the data returned by its reader and None, or None and the
+        error raised while reading it. Files are yielded as soon as they have been read,
+        i.e. in order of completion when read in parallel.
+
+    Raises
+    ------
+    ValueError: If a file's reader is not one of the named readers.
+
+    """
+    files_read_info = _files_read_info(infile_paths, reader, read_options, common_read_options)
+
+    for file_result in _read_files(files_read_info, processes=processes):
+        yield file_result
+
+
+def iter_mixed_array_data(infile_path, first_line_num=0, last_line_num=None, fix_floats=True,
+                          cursor=None, use_line_index=False, compact_rows=False, columns=None,
+                          filters=None, follow=False, poll_interval=None, idle_timeout=None,
+                          raw_lines=False):
+    """
+    Iterate over mixed array data read from a file (without array ids filtering), one row
+    at a time. Streaming counterpart of read_mixed_array_data, which never holds more than
+    one row in memory.
+
+    Parameters
+    ----------
+    infile_path : str
+        Input file's absolute path.
+    first_line_num : int, optional
+        First line number to read. NOTE: Zero-based numbering.
+    last_line_num : int, optional
+        Last line number to read. NOTE: Zero-based numbering.
+    fix_floats : bool
+        Correct leading zeros for floating points values since many older CR-type
+        dataloggers strips leading zeros.
+    cursor : ReadCursor, optional
+        Resume reading from where a previous read left off. If the file has been
+        truncated or rotated since, it is read from the start instead.
+    use_line_index : bool, optional
+        Seek to the first line number using the file's line index (see update_line_index).
+    compact_rows : bool, optional
+        Yield CompactRow objects instead of Row objects. Compact rows share a single
+        header instead of each holding their own column names, which takes far less
+        memory for wide tables.
+    columns : iterable of int, optional
+        Only read these columns (indices). Other values are dropped as each line is read.
+    filters : dict, optional
+        Only read the rows matching these filters by column index. A filter is either a
+        callable, taking the column's (unprocessed) value and returning whether to keep the
+        row, a set of values to keep, or a single value to keep. Filters are evaluated as
+        each line is read, before any row is made or floats are fixed.
+    follow : bool, optional
+        Keep the file open once its end is reached, and go on yielding new lines as they
+        are appended to it (e.g. by LoggerNet), polling it for new complete lines. A last
+        line not yet terminated by a newline is held back until it is. A truncated file is
+        read again from its start, and a rotated file (its path leading to a new file) is
+        read to its end before the new file is read from its start.
+    poll_interval : float, optional
+        Seconds between two checks for new lines when following the file. Defaults to
+        FOLLOW_POLL_INTERVAL.
+    idle_timeout : float, optional
+        Stop following the file once no new line has been read for this many seconds. The
+        file is followed until the iterator is closed by default.
+    raw_lines : bool, optional
+        Keep the line each row was read from with the row (see Row.raw_line), for the
+        exporters to write rows left unchanged byte for byte as read (see export_to_csv).
+        Rows whose floats are fixed do not count as unchanged (see fix_floats).
+
+    Yields
+    ------
+    Row
+        The next row read from the file.
+
+    """
+    for row in _read_mixed_array_data(
+            infile_path=infile_path, first_line_num=first_line_num,
+            last_line_num=last_line_num, fix_floats=fix_floats, cursor=cursor,
+            use_line_index=use_line_index, compact_rows=compact_rows, columns=columns,
+            filters=filters,
+            follow=_FollowOptions(poll_interval, idle_timeout) if follow else None,
+            raw_lines=raw_lines):
+        yield row
+
+
+def iter_table_data(infile_path, header=None, header_row=None, first_line_num=0,
+                    last_line_num=None, parse_time_columns=False, time_zone='UTC',
+                    time_format_args_library=None, time_parsed_column=None,
+                    time_columns=None, to_utc=False, cursor=None, use_line_index=False,
+                    compact_rows=False, columns=None, filters=None, follow=False,
+                    poll_interval=None, idle_timeout=None, raw_lines=False):
+    """
+    Iterate over table data read from a file, one row at a time. Streaming counterpart of
+    read_table_data: each row is read and (optionally) time parsed as it is requested, so
+    memory use does not grow with the file's size.
+
+    Parameters
+    ----------
+    infile_path : str
+        Input file's absolute path.
+    header : list of str, optional
+        Column names to map to each rows' values.
+    header_row : int, optional
+        Input file's header row fieldnames to map to each rows' values.
+    first_line_num : int, optional
+        First line number to read. NOTE: Zero-based numbering.
+    last_line_num : int, optional
+        Last line number to read. NOTE: Zero-based numbering.
+    parse_time_columns : bool, optional
+        Convert datalogger specific time string representations to datetime objects.
+    time_zone : str
+        String representation of a valid pytz time zone. (See pytz docs
+        for a list of valid time zones). The time zone refers to collected data's
+        time zone, which defaults to UTC and is used for localization and time conversion.
+    time_format_args_library : list of str
+        List of the maximum expected string
+        format columns sequence to match against when parsing time values. Defaults to
+        empty library.
+    time_parsed_column : str, optional
+        Converted time column name. If not given, use the name of the first
+        time column.
+    time_columns : list of str or int, optional
+        Column(s) (names or indices) to use for time conversion.
+    to_utc : bool, optional
+        Convert time to UTC.
+    cursor : ReadCursor, optional
+        Resume reading from where a previous read left off. If the file has been
+        truncated or rotated since, it is read from the start instead.
+    use_line_index : bool, optional
+        Seek to the first line number using the file's line index (see update_line_index).
+    compact_rows : bool, optional
+        Yield CompactRow objects instead of Row objects. Compact rows share a single
+        header instead of each holding their own column names, which takes far less
+        memory for wide tables.
+    columns : iterable of str or int, optional
+        Only read these columns (names, or indices for ints naming no column), and the time
+        columns if parsing time.
+        Other values are dropped as each line is read, before any time parsing.
+    filters : dict, optional
+        Only read the rows matching these filters by column (name or index). A filter is
+        either a callable, taking the column's (unprocessed) value and returning whether to
+        keep the row, a set of values to keep, or a single value to keep. Filters are
+        evaluated as each line is read, before any row is made or time parsed.
+    follow : bool, optional
+        Keep the file open once its end is reached, and go on yielding new lines as they
+        are appended to it (e.g. by LoggerNet), polling it for new complete lines. A last
+        line not yet terminated by a newline is held back until it is. A truncated file is
+        read again from its start, and a rotated file (its path leading to a new file) is
+        read to its end before the new file is read from its start.
+    poll_interval : float, optional
+        Seconds between two checks for new lines when following the file. Defaults to
+        FOLLOW_POLL_INTERVAL.
+    idle_timeout : float, optional
+        Stop following the file once no new line has been read for this many seconds. The
+        file is followed until the iterator is closed by default.
+    raw_lines : bool, optional
+        Keep the line each row was read from with the row (see Row.raw_line), for the
+        exporters to write rows left unchanged byte for byte as read (see export_to_csv).
+        Rows whose time columns are parsed do not count as unchanged.
+
+    Yields
+    ------
+    Row
+        The next row read (and time parsed) from the file.
+
+    Examples
+    --------
+    >>> import pytz
+    >>> import shutil
+    >>> import tempfile
+    >>> temp_dir = tempfile.mkdtemp()
+    >>> temp_outfile = os.path.join(temp_dir, 'temp_outfile.dat')
+
+    >>> data = DataSet([
+    ...     Row([
+    ...         ('Label_1', 'some_value'),
+    ...         ('Label_2', datetime(2016, 5, 2, i, 34, 15, tzinfo=pytz.UTC))])
+    ...     for i in range(20)
+    ... ])
+    >>> export_to_csv(data, temp_outfile, export_header=True)
+
+    >>> rows = iter_table_data(
+    ...     temp_outfile,
+    ...     header_row=0,
+    ...     parse_time_columns=True,
+    ...     time_format_args_library=['%Y-%m-%d %H:%M:%S'],
+    ...     time_columns=['Label_2']
+    ... )
+    >>> next(rows)
+    Row([('Label_1', 'some_value'), ('Label_2', datetime.datetime(2016, 5, 2, 0, 34, 15, \
+tzinfo=<UTC>))])
+    >>> rows.close()
+
+    >>> shutil.rmtree(temp_dir)
+
+    Raises
+    ------
+    TimeColumnValueError: If time columns are to be parsed, but not at least one time
+        column is given.
+    UnknownPytzTimeZoneError: If the provided time zone is not a valid pytz time zone.
+
+    """
+    for row in _read_table_data(
+            infile_path=infile_path,
+            header=header,
+            header_row=header_row,
+            first_line_num=first_line_num,
+            last_line_num=last_line_num,
+            parse_time_columns=parse_time_columns,
+            time_zone=time_zone,
+            time_format_args_library=time_format_args_library,
+            time_parsed_column=time_parsed_column,
+            time_columns=time_columns,
+            to_utc=to_utc,
+            cursor=cursor,
+            use_line_index=use_line_index, compact_rows=compact_rows, columns=columns,
+            filters=filters,
+            follow=_FollowOptions(poll_interval, idle_timeout) if follow else None,
+            raw_lines=raw_lines):
+        yield row
+
+
+def iter_tob1_data(infile_path, first_line_num=0, last_line_num=None, time_zone='UTC',
+                   to_utc=False, compact_rows=False):
+    """
+    Iterate over the records of a TOB1 (table oriented binary) file, one row at a time.
+
+    The file's ASCII header gives the column names and data types. FP2, IEEE4/IEEE8
+    (including big-endian IEEE4B/IEEE8B), integer, boolean and ASCII(n) fields are
+    supported. SecNano/NSec fields, and SECONDS and NANOSECONDS fields (read as a single
+    TIMESTAMP column), are converted into datetime objects.
+
+    Parameters
+    ----------
+    infile_path : str
+        Input file's absolute path.
+    first_line_num : int, optional
+        First line number to read. NOTE: Zero-based numbering, where each of the
+        TOB1_HEADER_LINES header lines and each record counts as a line, i.e. the first
+        record is line number TOB1_HEADER_LINES.
+    last_line_num : int, optional
+        Last line number to read. NOTE: Zero-based numbering.
+    time_zone : str
+        String representation of a valid pytz time zone. (See pytz docs
+        for a list of valid time zones). The time zone refers to collected data's
+        time zone, which defaults to UTC and is used for localization and time conversion.
+    to_utc : bool, optional
+        Convert time to UTC.
+    compact_rows : bool, optional
+        Yield CompactRow objects instead of Row objects.
+
+    Yields
+    ------
+    Row or CompactRow
+        The next record read from the file.
+
+    Raises
+    ------
+    FileFormatError: If the file is not a TOB1 file, or holds an unsupported data type.
+    UnknownPytzTimeZoneError: If the provided time zone is not a valid pytz time zone.
+
+    """
+    try:
+        pytz_time_zone = pytz.timezone(time_zone)
+    except pytz.UnknownTimeZoneError:
+        msg = "{time_zone} is not a valid pytz time zone! "
+        msg += "See pytz docs for valid time zones".format(time_zone=time_zone)
+        raise UnknownPytzTimeZoneError(msg)
+
+    with _open_input(infile_path) as f:
+        header = _read_tob1_header(f)
+        record_struct, names, getters = _binary_record_format(
+            header.names, header.data_types, pytz_time_zone, to_utc)
+        if record_struct.size == 0:
+            return
+
+        record_num = max(first_line_num - TOB1_HEADER_LINES, 0)
+        f.seek(record_num * record_struct.size, os.SEEK_CUR)
+        row_header = RowHeader(names)
+
+        while True:
+            num_records = BINARY_READ_RECORDS
+            if isinstance(last_line_num, int):
+                num_records = min(num_records, last_line_num - TOB1_HEADER_LINES + 1 - record_num)
+                if num_records <= 0:
+                    break
+
+            records = f.read(num_records * record_struct.size)
+            num_records = len(records) // record_struct.size  # Skip partially written records
+            if num_records == 0:
+                break
+
+            records = memoryview(records)[:num_records * record_struct.size]
+            for values in record_struct.iter_unpack(records):
+                row_values = [getter(values) for getter in getters]
+                if compact_rows:
+                    yield CompactRow(row_header, row_values)
+                else:
+                    yield Row(zip(names, row_values))
+
+            record_num += num_records
+
+
+def iter_tob3_data(infile_path, from_timestamp=None, to_timestamp=None, time_zone='UTC',
+                   to_utc=False, processes=None, compact_rows=False):
+    """
+    Iterate over the records of a TOB3 (table oriented binary, frame based) file, one row
+    at a time and in time stamp order.
+
+    TOB3 files store records in fixed size frames, each holding the time stamp and number
+    of its first record. Frames are validated and located from their headers and footers
+    first, so only the frames holding records within the requested time range are decoded,
+    optionally in parallel. Records are time stamped from their frame's time stamp and the
+    table's record interval, and read into TIMESTAMP and RECORD columns followed by the
+    file's fields. See iter_tob1_data for the supported data types.
+
+    Parameters
+    ----------
+    infile_path : str
+        Input file's absolute path.
+    from_timestamp : datetime, optional
+        Only read records time stamped at or after this (time zone aware) time. Frames
+        ending before it are skipped without being decoded.
+    to_timestamp : datetime, optional
+        Only read records time stamped at or before this (time zone aware) time. Frames
+        starting after it are skipped without being decoded.
+    time_zone : str
+        String representation of a valid pytz time zone. (See pytz docs
+        for a list of valid time zones). The time zone refers to collected data's
+        time zone, which defaults to UTC and is used for localization and time conversion.
+    to_utc : bool, optional
+        Convert time to UTC.
+    processes : int, optional
+        Number of worker processes decoding frames in parallel. Frames are decoded in the
+        calling process by default.
+    compact_rows : bool, optional
+        Yield CompactRow objects instead of Row objects.
+
+    Yields
+    ------
+    Row or CompactRow
+        The next record read from the file.
 
-    Raises:
-        DataTypeError: if anything else than list or dictionary data is given.
+    Raises
+    ------
+    FileFormatError: If the file is not a TOB3 file, or holds an unsupported data type.
+    UnknownPytzTimeZoneError: If the provided time zone is not a valid pytz time zone.
 
     """
-    data_filtered = defaultdict(DataSet)
+    try:
+        pytz_time_zone = pytz.timezone(time_zone)
+    except pytz.UnknownTimeZoneError:
+        msg = "{time_zone} is not a valid pytz time zone! "
+        msg += "See pytz docs for valid time zones".format(time_zone=time_zone)
+        raise UnknownPytzTimeZoneError(msg)
 
-    if isinstance(data, dict):
-        if not array_ids:
-            return data
-        for array_id, array_id_data in data.items():
-            if array_id in array_ids:
-                data_filtered[array_id] = array_id_data
-    elif isinstance(data, DataSet):
-        for row in _data_generator(data):
-            try:
-                array_id_name = list(row.values())[0]
-            except IndexError:
-                continue
-            if not array_ids:
-                # Append to unfiltered data set, but split by array ids.
-                data_filtered[array_id_name].append(row)
-            else:
-                if array_id_name in array_ids:
-                    data_filtered[array_id_name].append(row)
+    with open(infile_path, 'rb') as f:
+        header = _read_tob3_header(f)
+        record_struct, names, getters = _binary_record_format(
+            header.names, header.data_types, pytz_time_zone, to_utc)
+        if record_struct.size == 0:
+            return
+        frames = _scan_tob3_frames(f, header, record_struct.size, pytz_time_zone, to_utc)
+
+    record_interval = timedelta(microseconds=_tob3_table_info(header)[3] // 1000)
+    frames_batches = [[]]
+    batch_num_records = 0
+    for frame in frames:
+        last_time_stamp = frame.time_stamp + (frame.num_records - 1) * record_interval
+        if from_timestamp is not None and last_time_stamp < from_timestamp:
+            continue
+        if to_timestamp is not None and frame.time_stamp > to_timestamp:
+            continue
+        if batch_num_records >= BINARY_READ_RECORDS:
+            frames_batches.append([])
+            batch_num_records = 0
+        frames_batches[-1].append(frame)
+        batch_num_records += frame.num_records
+
+    decode_frames = functools.partial(
+        _decode_tob3_frames, infile_path, header, time_zone=time_zone, to_utc=to_utc,
+        from_timestamp=from_timestamp, to_timestamp=to_timestamp)
+
+    row_header = RowHeader(['TIMESTAMP', 'RECORD'] + names)
+    if processes:
+        executor = ProcessPoolExecutor(max_workers=processes)
+        batches_values = executor.map(decode_frames, frames_batches)
     else:
-        msg = "Data collection of type {data_type} not supported. "
-        msg += "Valid collection types are dict and list.".format(data_type=type(data))
-        raise DataSetTypeError(msg)
+        executor = None
+        batches_values = map(decode_frames, frames_batches)
 
-    return data_filtered
+    try:
+        for records_values in batches_values:
+            for values in records_values:
+                if compact_rows:
+                    yield CompactRow(row_header, values)
+                else:
+                    yield Row(zip(row_header.names, values))
+    finally:
+        if executor is not None:
+            executor.shutdown()
 
 
 def parse_time(data, time_zone, time_format_args_library, time_columns,
-               time_parsed_column=None, replace_time_column=None, to_utc=False):
+               time_parsed_column=None, replace_time_column=None, to_utc=False,
+               batch_size=None):
     """
     Parses specific time columns from a data set into a datetime object.
 
@@ -908,6 +4695,11 @@ def parse_time(data, time_zone, time_format_args_library, time_columns,
         insert at the first time column index.
     to_utc : bool, optional
         Convert time to UTC.
+    batch_size : int, optional
+        Number of rows whose time columns are parsed together, one column at a time and
+        with each distinct date and time of day parsed once (e.g. TIME_PARSING_BATCH_ROWS,
+        as read_table_data does). Gives the same result as parsing row by row, which is
+        done if not given.
 
     Returns
     -------
@@ -951,61 +4743,21 @@ def parse_time(data, time_zone, time_format_args_library, time_columns,
     UnknownPytzTimeZoneError: If the provided time zone is not a valid pytz time zone.
 
     """
-    try:
-        pytz_time_zone = pytz.timezone(time_zone)
-    except pytz.UnknownTimeZoneError:
-        msg = "{time_zone} is not a valid pytz time zone! "
-        msg += "See pytz docs for valid time zones".format(time_zone=time_zone)
-        raise UnknownPytzTimeZoneError(msg)
-
-    if not time_format_args_library:
-        time_format_args_library = []
-    if not time_columns:
-        raise TimeColumnValueError("At least one time column is required!")
-
-    data_converted = DataSet([])
-
-    for row in _data_generator(data):
-        if not replace_time_column:
-            replace_time_column_name = (
-                _find_first_time_column_name(
-                    list(row.keys()), time_columns)
-            )
-        else:
-            if replace_time_column not in list(row.keys()):
-                msg = "{0} not found in column names!".format(replace_time_column)
-                raise TimeColumnValueError(msg)
-
-            replace_time_column_name = replace_time_column
-
-        row_time_column_values = [value for name, value in row.items()
-                                  if name in time_columns]
-        row_time_converted = (
-            _parse_time_values(
-                pytz_time_zone, time_format_args_library,
-                *row_time_column_values, to_utc=to_utc)
-        )
-
-        old_name = replace_time_column_name
-        new_name = old_name
-        if time_parsed_column:
-            new_name = time_parsed_column
-
-        row_converted = Row(
-            (new_name if name == old_name else name, value) for name, value in row.items())
-        row_converted[new_name] = row_time_converted
-
-        for time_column in time_columns:
-            if time_column in row_converted and time_column != new_name:
-                del row_converted[time_column]
-
-        data_converted.append(row_converted)
-
-    return data_converted
+    return DataSet([row for row in _parse_time_rows(
+        data,
+        time_zone=time_zone,
+        time_format_args_library=time_format_args_library,
+        time_columns=time_columns,
+        time_parsed_column=time_parsed_column,
+        replace_time_column=replace_time_column,
+        to_utc=to_utc,
+        batch_size=batch_size
+    )])
 
 
 def read_array_ids_data(infile_path, first_line_num=0, last_line_num=None, fix_floats=True,
-                        array_id_names=None):
+                        array_id_names=None, cursor=None, get_cursor=False,
+                        use_line_index=False, compact_rows=False, raw_lines=False):
     """Parses data filtered by array id (each rows' first element) read from a file.
 
     Parameters
@@ -1021,11 +4773,34 @@ def read_array_ids_data(infile_path, first_line_num=0, last_line_num=None, fix_f
         dataloggers strips leading zeros.
     array_id_names : dict
         Lookup table for array id name translation.
+    cursor : ReadCursor, optional
+        Resume reading from where a previous read left off. If the file has been
+        truncated or rotated since, it is read from the start instead.
+    get_cursor : bool, optional
+        Return also a cursor to resume reading from on the next call. The results will
+        in that case be packed in a namedtuple. Only complete lines are then read: a last
+        line not (yet) terminated by a newline is left to be read on resuming.
+    use_line_index : bool, optional
+        Seek to the first line number using a sparse index of the file's line offsets,
+        instead of reading all lines before it. The index is kept in a sidecar file next
+        to the input file (see update_line_index), and is created or brought up to date
+        as needed.
+    compact_rows : bool, optional
+        Store CompactRow objects instead of Row objects. Compact rows share a single
+        header instead of each holding their own column names, which takes far less
+        memory for wide tables.
+    raw_lines : bool, optional
+        Keep the line each row was read from with the row (see Row.raw_line), for the
+        exporters to write rows left unchanged byte for byte as read (see export_to_csv).
+        Rows whose floats are fixed do not count as unchanged (see fix_floats).
+        Keeping them roughly doubles the memory held by each row, which keeps its line and
+        a copy of the values read from it.
 
     Returns
     -------
-    dict of DataSet
-        All data found from the given line number onwards, filtered by array id.
+    dict of DataSet or namedtuple
+        All data found from the given line number onwards, filtered by array id. If
+        get_cursor is true, return also a cursor to resume reading from.
 
     Examples
     --------
@@ -1054,25 +4829,90 @@ def read_array_ids_data(infile_path, first_line_num=0, last_line_num=None, fix_f
     if not array_id_names:
         array_id_names = {}
 
-    array_ids = [array_id for array_id in array_id_names]
+    # Route each row to its array id's data set as it is read, in a single pass.
+    data_by_array_ids = defaultdict(DataSet)
+    position = _ReadPosition()
+    for row in _read_mixed_array_data(
+            infile_path=infile_path, first_line_num=first_line_num,
+            last_line_num=last_line_num, fix_floats=fix_floats, cursor=cursor,
+            position=position, use_line_index=use_line_index, compact_rows=compact_rows,
+            array_ids=array_id_names or None, raw_lines=raw_lines, resumable=get_cursor):
+        try:
+            array_id = row[0]
+        except KeyError:
+            continue
+        data_by_array_ids[array_id_names.get(array_id) or array_id].append(row)
 
-    data_mixed = read_mixed_array_data(
-        infile_path=infile_path,
-        first_line_num=first_line_num,
-        last_line_num=last_line_num,
-        fix_floats=fix_floats)
+    if get_cursor:
+        return ReadResult(data_by_array_ids, _make_cursor(position))
 
-    data_by_array_ids = filter_mixed_array_data(data_mixed, *array_ids)
+    return data_by_array_ids
 
-    for array_id, array_name in array_id_names.items():
-        if array_id in data_by_array_ids:
-            if array_name:
-                data_by_array_ids[array_name] = data_by_array_ids.pop(array_id)
 
-    return data_by_array_ids
+def read_files_data(infile_paths, reader='table', read_options=None, processes=None,
+                    **common_read_options):
+    """
+    Reads the data of a batch of files (e.g. one per station), reading them concurrently
+    with a bounded pool of worker processes. See iter_files_data to process each file's data
+    as soon as it has been read.
+
+    An error raised while reading a file does not stop the batch: it is collected, by input
+    file path, along with the data of the files read successfully.
+
+    Parameters
+    ----------
+    infile_paths : str or list of str
+        Input files' absolute paths, or a glob pattern matching them (read in sorted order).
+    reader : str, optional
+        Reader of the files: 'table' (read_table_data, the default), 'mixed_array'
+        (read_mixed_array_data), 'array_ids' (read_array_ids_data), 'tob1'
+        (read_tob1_data) or 'tob3' (read_tob3_data).
+    read_options : dict of dict, optional
+        Read options of specific files, by input file path (as given or matched by the
+        glob pattern). They override the common read options, and may also name another
+        reader under the 'reader' key.
+    processes : int, optional
+        Number of worker processes reading files in parallel, at most one file per process
+        at a time. Files are read one after the other in the calling process by default.
+        The read options, data and errors must be picklable to be sent between processes.
+    common_read_options
+        Keyword arguments passed on to the reader of every file, e.g. header_row,
+        time_columns, time_zone or array_id_names.
+
+    Returns
+    -------
+    namedtuple
+        The data returned by the reader of each file read successfully, and the error raised
+        while reading each other file, in two ordered dicts by input file path (in the order
+        the files were given).
 
+    Raises
+    ------
+    ValueError: If a file's reader is not one of the named readers.
+
+    """
+    files_read_info = _files_read_info(infile_paths, reader, read_options, common_read_options)
+
+    file_results = {}
+    for file_result in _read_files(files_read_info, processes=processes):
+        file_results[file_result.infile_path] = file_result
+
+    data = OrderedDict()
+    errors = OrderedDict()
+    for infile_path, _, _ in files_read_info:
+        file_result = file_results[infile_path]
+        if file_result.error is None:
+            data[infile_path] = file_result.data
+        else:
+            errors[infile_path] = file_result.error
+
+    return FilesReadResult(data, errors)
 
-def read_mixed_array_data(infile_path, first_line_num=0, last_line_num=None, fix_floats=True):
+
+def read_mixed_array_data(infile_path, first_line_num=0, last_line_num=None, fix_floats=True,
+                          cursor=None, get_cursor=False, use_line_index=False, columnar=False,
+                          compact_rows=False, columns=None, filters=None, processes=None,
+                          raw_lines=False):
     """
     Reads mixed array data from a file (without array ids filtering) and stores it
     in the CR module's data structure format (see module documentation for details).
@@ -1088,11 +4928,50 @@ def read_mixed_array_data(infile_path, first_line_num=0, last_line_num=None, fix
     fix_floats : bool
         Correct leading zeros for floating points values since many older CR-type
         dataloggers strips leading zeros.
+    cursor : ReadCursor, optional
+        Resume reading from where a previous read left off. If the file has been
+        truncated or rotated since, it is read from the start instead.
+    get_cursor : bool, optional
+        Return also a cursor to resume reading from on the next call. The results will
+        in that case be packed in a namedtuple. Only complete lines are then read: a last
+        line not (yet) terminated by a newline is left to be read on resuming.
+    use_line_index : bool, optional
+        Seek to the first line number using a sparse index of the file's line offsets,
+        instead of reading all lines before it. The index is kept in a sidecar file next
+        to the input file (see update_line_index), and is created or brought up to date
+        as needed.
+    columnar : bool, optional
+        Store the data column by column in a ColumnarDataSet. The values read are strings,
+        so the columns are kept as lists, taking about as little memory as compact_rows
+        (with slower iteration, each row being materialized when accessed).
+    compact_rows : bool, optional
+        Store CompactRow objects instead of Row objects. Compact rows share a single
+        header instead of each holding their own column names, which takes far less
+        memory for wide tables.
+    columns : iterable of int, optional
+        Only read these columns (indices). Other values are dropped as each line is read,
+        which saves processing and memory compared to extracting columns afterwards.
+    filters : dict, optional
+        Only read the rows matching these filters by column index. A filter is either a
+        callable, taking the column's (unprocessed) value and returning whether to keep the
+        row, a set of values to keep, or a single value to keep. Filters are evaluated as
+        each line is read, before any row is made or floats are fixed.
+    processes : int, optional
+        Number of worker processes reading the file in parallel, each a chunk of whole lines
+        at a time (records must not span several lines, and filters must be picklable).
+        The file is read in the calling process by default.
+    raw_lines : bool, optional
+        Keep the line each row was read from with the row (see Row.raw_line), for the
+        exporters to write rows left unchanged byte for byte as read (see export_to_csv).
+        Rows whose floats are fixed do not count as unchanged (see fix_floats).
+        Not kept by columnar data sets. Keeping them roughly doubles the memory held by
+        each row, which keeps its line and a copy of the values read from it.
 
     Returns
     -------
-    DataSet
-        All data found from the given line number onwards.
+    DataSet or namedtuple
+        All data found from the given line number onwards. If get_cursor is true, return
+        also a cursor to resume reading from.
 
     Example
     -------
@@ -1116,15 +4995,37 @@ def read_mixed_array_data(infile_path, first_line_num=0, last_line_num=None, fix
     >>> shutil.rmtree(temp_dir)
 
     """
-    return DataSet([row for row in _read_mixed_array_data(
-        infile_path=infile_path, first_line_num=first_line_num,
-        last_line_num=last_line_num, fix_floats=fix_floats)])
+    position = _ReadPosition()
+    read_info = dict(fix_floats=fix_floats, compact_rows=compact_rows, columns=columns,
+                     filters=filters, raw_lines=raw_lines, resumable=get_cursor)
+    if processes:
+        rows = _read_in_processes(
+            _read_mixed_array_data, infile_path, processes, first_line_num=first_line_num,
+            last_line_num=last_line_num, cursor=cursor, position=position,
+            use_line_index=use_line_index, **read_info)
+    else:
+        rows = _read_mixed_array_data(
+            infile_path=infile_path, first_line_num=first_line_num,
+            last_line_num=last_line_num, cursor=cursor, position=position,
+            use_line_index=use_line_index, **read_info)
+
+    if columnar:
+        data = ColumnarDataSet(rows)
+    else:
+        data = DataSet([row for row in rows])
+
+    if get_cursor:
+        return ReadResult(data, _make_cursor(position))
+
+    return data
 
 
 def read_table_data(infile_path, header=None, header_row=None, first_line_num=0,
                     last_line_num=None, parse_time_columns=False, time_zone='UTC',
                     time_format_args_library=None, time_parsed_column=None,
-                    time_columns=None, to_utc=False):
+                    time_columns=None, to_utc=False, cursor=None, get_cursor=False,
+                    use_line_index=False, columnar=False, compact_rows=False, columns=None,
+                    filters=None, processes=None, raw_lines=False):
     """
     Reads data from a file and stores it in the parser's data structure format
     (see class documentation for details).
@@ -1158,11 +5059,52 @@ def read_table_data(infile_path, header=None, header_row=None, first_line_num=0,
         Column(s) (names or indices) to use for time conversion.
     to_utc : bool, optional
         Convert time to UTC.
+    cursor : ReadCursor, optional
+        Resume reading from where a previous read left off. If the file has been
+        truncated or rotated since, it is read from the start instead.
+    get_cursor : bool, optional
+        Return also a cursor to resume reading from on the next call. The results will
+        in that case be packed in a namedtuple. Only complete lines are then read: a last
+        line not (yet) terminated by a newline is left to be read on resuming.
+    use_line_index : bool, optional
+        Seek to the first line number using a sparse index of the file's line offsets,
+        instead of reading all lines before it. The index is kept in a sidecar file next
+        to the input file (see update_line_index), and is created or brought up to date
+        as needed.
+    columnar : bool, optional
+        Store the data column by column in a ColumnarDataSet. The values read are strings,
+        so the columns are kept as lists, taking about as little memory as compact_rows
+        (with slower iteration, each row being materialized when accessed).
+    compact_rows : bool, optional
+        Store CompactRow objects instead of Row objects. Compact rows share a single
+        header instead of each holding their own column names, which takes far less
+        memory for wide tables.
+    columns : iterable of str or int, optional
+        Only read these columns (names, or indices for ints naming no column), and the time
+        columns if parsing time.
+        Other values are dropped as each line is read, before any time parsing, which
+        saves processing and memory compared to extracting columns afterwards.
+    filters : dict, optional
+        Only read the rows matching these filters by column (name or index). A filter is
+        either a callable, taking the column's (unprocessed) value and returning whether to
+        keep the row, a set of values to keep, or a single value to keep. Filters are
+        evaluated as each line is read, before any row is made or time parsed.
+    processes : int, optional
+        Number of worker processes reading the file in parallel, each a chunk of whole lines
+        at a time (records must not span several lines, and filters must be picklable).
+        The file is read in the calling process by default.
+    raw_lines : bool, optional
+        Keep the line each row was read from with the row (see Row.raw_line), for the
+        exporters to write rows left unchanged byte for byte as read (see export_to_csv).
+        Rows whose time columns are parsed do not count as unchanged.
+        Not kept by columnar data sets. Keeping them roughly doubles the memory held by
+        each row, which keeps its line and a copy of the values read from it.
 
     Returns
     -------
-    DataSet
-        All data found from the given line number onwards.
+    DataSet or namedtuple
+        All data found from the given line number onwards. If get_cursor is true, return
+        also a cursor to resume reading from.
 
     Examples
     --------
@@ -1223,30 +5165,205 @@ tzinfo=<UTC>)), ('Label_3', 'some_other_value')]), Row([('Label_1', \
 'some_value'), ('TIMESTAMP', datetime.datetime(2016, 5, 2, 2, 34, 15, tzinfo=<UTC>)), \
 ('Label_3', 'some_other_value')])]
 
+    >>> exported_data, cursor = read_table_data(temp_outfile, header_row=0, get_cursor=True)
+    >>> export_to_csv(data[:1], temp_outfile)
+    >>> read_table_data(temp_outfile, header_row=0, cursor=cursor)
+    DataSet([Row([('Label_1', 'some_value'), ('Label_2', '2016-05-02 00:34:15'), \
+('Label_3', 'some_other_value')])])
+
     >>> shutil.rmtree(temp_dir)
 
     """
-    data = DataSet([row for row in _read_table_data(
-        infile_path=infile_path,
+    position = _ReadPosition()
+    read_info = dict(
         header=header,
-        header_row=header_row,
-        first_line_num=first_line_num,
-        last_line_num=last_line_num
-    )])
-
-    if parse_time_columns:
-        data = parse_time(
-            data=data,
-            time_zone=time_zone,
-            time_format_args_library=time_format_args_library,
-            time_parsed_column=time_parsed_column,
-            time_columns=time_columns,
-            to_utc=to_utc
+        parse_time_columns=parse_time_columns,
+        time_zone=time_zone,
+        time_format_args_library=time_format_args_library,
+        time_parsed_column=time_parsed_column,
+        time_columns=time_columns,
+        to_utc=to_utc,
+        compact_rows=compact_rows,
+        time_batch_size=TIME_PARSING_BATCH_ROWS,
+        columns=columns,
+        filters=filters,
+        raw_lines=raw_lines,
+        resumable=get_cursor
+    )
+    if processes:
+        rows = _read_in_processes(
+            _read_table_data, infile_path, processes, header_row=header_row,
+            first_line_num=first_line_num, last_line_num=last_line_num, cursor=cursor,
+            position=position, use_line_index=use_line_index, **read_info)
+    else:
+        rows = _read_table_data(
+            infile_path=infile_path,
+            header_row=header_row,
+            first_line_num=first_line_num,
+            last_line_num=last_line_num,
+            cursor=cursor,
+            position=position,
+            use_line_index=use_line_index,
+            **read_info
         )
 
+    if columnar:
+        data = ColumnarDataSet(rows)
+    else:
+        data = DataSet([row for row in rows])
+
+    if get_cursor:
+        return ReadResult(data, _make_cursor(position))
+
     return data
 
 
+def read_tob1_data(infile_path, first_line_num=0, last_line_num=None, time_zone='UTC',
+                   to_utc=False, compact_rows=False, columnar=False):
+    """
+    Reads the records of a TOB1 (table oriented binary) file and stores them in the
+    parser's data structure format. See iter_tob1_data for the supported data types.
+
+    Parameters
+    ----------
+    infile_path : str
+        Input file's absolute path.
+    first_line_num : int, optional
+        First line number to read. NOTE: Zero-based numbering, where each of the
+        TOB1_HEADER_LINES header lines and each record counts as a line, i.e. the first
+        record is line number TOB1_HEADER_LINES.
+    last_line_num : int, optional
+        Last line number to read. NOTE: Zero-based numbering.
+    time_zone : str
+        String representation of a valid pytz time zone. (See pytz docs
+        for a list of valid time zones). The time zone refers to collected data's
+        time zone, which defaults to UTC and is used for localization and time conversion.
+    to_utc : bool, optional
+        Convert time to UTC.
+    compact_rows : bool, optional
+        Store CompactRow objects instead of Row objects.
+    columnar : bool, optional
+        Store the data column by column in a ColumnarDataSet, which takes far less memory
+        than a DataSet for large files.
+
+    Returns
+    -------
+    DataSet
+        All records found from the given line number onwards.
+
+    Raises
+    ------
+    FileFormatError: If the file is not a TOB1 file, or holds an unsupported data type.
+    UnknownPytzTimeZoneError: If the provided time zone is not a valid pytz time zone.
+
+    """
+    rows = iter_tob1_data(
+        infile_path=infile_path, first_line_num=first_line_num, last_line_num=last_line_num,
+        time_zone=time_zone, to_utc=to_utc, compact_rows=compact_rows)
+
+    if columnar:
+        return ColumnarDataSet(rows)
+
+    return DataSet([row for row in rows])
+
+
+def read_tob3_data(infile_path, from_timestamp=None, to_timestamp=None, time_zone='UTC',
+                   to_utc=False, processes=None, compact_rows=False, columnar=False):
+    """
+    Reads the records of a TOB3 (table oriented binary, frame based) file, in time stamp
+    order, and stores them in the parser's data structure format. See iter_tob3_data for
+    how frames are read.
+
+    Parameters
+    ----------
+    infile_path : str
+        Input file's absolute path.
+    from_timestamp : datetime, optional
+        Only read records time stamped at or after this (time zone aware) time. Frames
+        ending before it are skipped without being decoded.
+    to_timestamp : datetime, optional
+        Only read records time stamped at or before this (time zone aware) time. Frames
+        starting after it are skipped without being decoded.
+    time_zone : str
+        String representation of a valid pytz time zone. (See pytz docs
+        for a list of valid time zones). The time zone refers to collected data's
+        time zone, which defaults to UTC and is used for localization and time conversion.
+    to_utc : bool, optional
+        Convert time to UTC.
+    processes : int, optional
+        Number of worker processes decoding frames in parallel. Frames are decoded in the
+        calling process by default.
+    compact_rows : bool, optional
+        Store CompactRow objects instead of Row objects.
+    columnar : bool, optional
+        Store the data column by column in a ColumnarDataSet, which takes far less memory
+        than a DataSet for large files.
+
+    Returns
+    -------
+    DataSet
+        All records found within the given time range.
+
+    Raises
+    ------
+    FileFormatError: If the file is not a TOB3 file, or holds an unsupported data type.
+    UnknownPytzTimeZoneError: If the provided time zone is not a valid pytz time zone.
+
+    """
+    rows = iter_tob3_data(
+        infile_path=infile_path, from_timestamp=from_timestamp, to_timestamp=to_timestamp,
+        time_zone=time_zone, to_utc=to_utc, processes=processes, compact_rows=compact_rows)
+
+    if columnar:
+        return ColumnarDataSet(rows)
+
+    return DataSet([row for row in rows])
+
+
+def read_tob3_frames(infile_path, time_zone='UTC', to_utc=False):
+    """
+    Lists the valid data frames of a TOB3 file, without decoding their records. Each
+    frame's time stamp is that of its first record.
+
+    Parameters
+    ----------
+    infile_path : str
+        Input file's absolute path.
+    time_zone : str
+        String representation of a valid pytz time zone. (See pytz docs
+        for a list of valid time zones). The time zone refers to collected data's
+        time zone, which defaults to UTC and is used for localization and time conversion.
+    to_utc : bool, optional
+        Convert time to UTC.
+
+    Returns
+    -------
+    list of TOB3Frame
+        The file's valid, non-empty frames, in time stamp order.
+
+    Raises
+    ------
+    FileFormatError: If the file is not a TOB3 file, or holds an unsupported data type.
+    UnknownPytzTimeZoneError: If the provided time zone is not a valid pytz time zone.
+
+    """
+    try:
+        pytz_time_zone = pytz.timezone(time_zone)
+    except pytz.UnknownTimeZoneError:
+        msg = "{time_zone} is not a valid pytz time zone! "
+        msg += "See pytz docs for valid time zones".format(time_zone=time_zone)
+        raise UnknownPytzTimeZoneError(msg)
+
+    with open(infile_path, 'rb') as f:
+        header = _read_tob3_header(f)
+        record_struct, names, getters = _binary_record_format(
+            header.names, header.data_types, pytz_time_zone, to_utc)
+        if record_struct.size == 0:
+            return []
+
+        return _scan_tob3_frames(f, header, record_struct.size, pytz_time_zone, to_utc)
+
+
 def update_column_names(data, column_names, match_row_lengths=True,
                         get_mismatched_row_lengths=False):
     """Updates a data set's column names.
@@ -1330,3 +5447,62 @@ def update_column_names(data, column_names, match_row_lengths=True,
             data_updated_column_names, data_mismatched_row_lengths)
 
     return data_updated_column_names
+
+
+def update_line_index(infile_path, interval=None):
+    """
+    Creates or updates a sparse index of a file's line offsets, stored in a sidecar file
+    next to it (the file's path suffixed with LINE_INDEX_SUFFIX). Readers given
+    use_line_index=True use it to seek to their first line number instead of reading every
+    line before it.
+
+    The index is extended with the lines appended since it was last updated, and rebuilt
+    if the file has been truncated, rotated or rewritten (checked by size, modification
+    time and a digest of the file's head and indexed tail).
+
+    Parameters
+    ----------
+    infile_path : str
+        Input file's absolute path.
+    interval : int, optional
+        Number of lines between two index entries. Defaults to the existing index's
+        interval, or LINE_INDEX_INTERVAL. If it differs from the existing index's
+        interval, the index is rebuilt.
+
+    Returns
+    -------
+    dict
+        Up to date line index. Its 'byte_offsets' holds the byte offsets of every interval
+        line, and 'end_line_num' the number of (complete) lines indexed.
+
+    Examples
+    --------
+    >>> import shutil
+    >>> import tempfile
+    >>> temp_dir = tempfile.mkdtemp()
+    >>> temp_outfile = os.path.join(temp_dir, 'temp_outfile.dat')
+
+    >>> data = DataSet([Row([('Label_1', i)]) for i in range(10)])
+    >>> export_to_csv(data, temp_outfile)
+
+    >>> line_index = update_line_index(temp_outfile, interval=4)
+    >>> line_index['byte_offsets']
+    [0, 8, 16]
+    >>> read_table_data(temp_outfile, first_line_num=9, use_line_index=True)
+    DataSet([Row([(0, '9')])])
+
+    >>> shutil.rmtree(temp_dir)
+
+    """
+    with _open_input(infile_path) as f:
+        return _update_line_index(f, infile_path + LINE_INDEX_SUFFIX, interval=interval)
+
+
+# Function reading each kind of file, by reader name (see read_files_data).
+_FILE_READERS = {
+    'table': read_table_data,
+    'mixed_array': read_mixed_array_data,
+    'array_ids': read_array_ids_data,
+    'tob1': read_tob1_data,
+    'tob3': read_tob3_data,
+}
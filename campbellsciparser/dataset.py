@@ -8,7 +8,14 @@ output file.
 
 """
 
+import bisect
+
+from array import array
 from collections import OrderedDict
+from collections.abc import MutableMapping
+
+# Python types stored in typed array columns, by array type code.
+_ARRAY_COLUMN_TYPES = {'q': int, 'd': float}
 
 
 class DataSet(object):
@@ -16,13 +23,15 @@ class DataSet(object):
 
     Parameters
     ----------
-    data : list of Row, optional
+    data : iterable of Row, optional
         Sequence representing the rows.
 
     Attributes
     ----------
     _rows : list of Row, optional
         Sequence representing the rows.
+    _time_index : _TimeIndex, optional
+        Index of the rows by a time column (see index_time).
 
     Example
     -------
@@ -41,10 +50,12 @@ class DataSet(object):
     Row([('Label_1', '123'), ('Label_2', '789')])
 
     """
+    _time_index = None
+
     def __init__(self, rows=None):
         if rows:
-            DataSet._validate_rows(rows)
             self._rows = list(rows)
+            DataSet._validate_rows(self._rows)
         else:
             self._rows = list()
 
@@ -72,10 +83,10 @@ class DataSet(object):
 
         Raises
         ------
-        TypeError: If the given item is not of type 'Row'.
+        TypeError: If the given item is not of type 'Row' (or 'CompactRow').
 
         """
-        if not isinstance(row, Row):
+        if not isinstance(row, (Row, CompactRow)):
             raise TypeError(
                 "Only row objects allowed, got {type}".format(type=type(row)))
 
@@ -90,12 +101,89 @@ class DataSet(object):
         """
         DataSet._validate_row(row)
         self._rows.append(row)
+        if self._time_index is not None:
+            self._time_index.add(len(self) - 1, row)
+
+    def index_time(self, time_column):
+        """
+        Indexes the rows by a (time converted) time column, for time range queries (see
+        time_range). The index replaces any previous one.
+
+        The index is kept up to date as long as rows are appended in time order, and is
+        rebuilt when next used otherwise. Changes made to rows in place are not tracked;
+        index the data set again after making them.
+
+        Parameters
+        ----------
+        time_column : str or int
+            Time column (name or index) to index the rows by.
+
+        Raises
+        ------
+        KeyError: If a row does not have the time column.
+
+        """
+        time_index = _TimeIndex(time_column)
+        time_index.build(self)
+        self._time_index = time_index
 
     @property
     def rows(self):
         """Returns data set. """
         return self._rows
 
+    @property
+    def time_index_column(self):
+        """Returns the time column the rows are indexed by, or None if not indexed. """
+        return self._time_index.time_column if self._time_index is not None else None
+
+    def time_range(self, from_timestamp=None, to_timestamp=None):
+        """Looks up the rows within a time range in the data set's time index.
+
+        Parameters
+        ----------
+        from_timestamp : datetime, optional
+            Start of the time range. If not given, the range has no start.
+        to_timestamp : datetime, optional
+            End of the time range. If not given, the range has no end.
+
+        Returns
+        -------
+        list of int
+            Indices of the rows within the time range, in ascending order.
+
+        Raises
+        ------
+        ValueError: If the data set has no time index.
+        KeyError: If the index is rebuilt and a row does not have the time column.
+
+        """
+        if self._time_index is None:
+            raise ValueError("Data set has no time index, see index_time")
+        if self._time_index.stale:
+            self._time_index.build(self)
+
+        return self._time_index.find(from_timestamp, to_timestamp)
+
+    def time_slice(self, from_timestamp=None, to_timestamp=None):
+        """Returns the rows within a time range (see time_range), as a new data set.
+
+        Parameters
+        ----------
+        from_timestamp : datetime, optional
+            Start of the time range. If not given, the range has no start.
+        to_timestamp : datetime, optional
+            End of the time range. If not given, the range has no end.
+
+        Returns
+        -------
+        DataSet
+            Data set of the same type, holding the rows within the time range.
+
+        """
+        return self.__class__(
+            [self[index] for index in self.time_range(from_timestamp, to_timestamp)])
+
     def __getitem__(self, index):
         return self._rows[index]
 
@@ -112,11 +200,266 @@ class DataSet(object):
     def __setitem__(self, index, row):
         DataSet._validate_row(row)
         self._rows[index] = row
+        if self._time_index is not None:
+            self._time_index.stale = True
 
     def __str__(self):
         return self.__repr__()
 
 
+class ColumnarDataSet(DataSet):
+    """
+    Container holding a sequence of rows read from a data collection, stored column by
+    column rather than row by row.
+
+    Column names are kept once, in a schema shared by all rows, and each column's values
+    in a single sequence: a typed array for int and float columns and a list otherwise.
+    Values are stored as they are, so the columns of rows read from CSV files (whose values
+    are strings) are lists, and only decoded binary data (TOB1, TOB3) or converted values
+    fill typed arrays.
+    Rows with different columns (e.g. mixed array data) are supported; each distinct
+    sequence of column names is stored once as a layout, and each row only refers to its
+    layout.
+
+    Rows are materialized as CompactRow objects when accessed, sharing one header per
+    layout, which means that changes made to them are not stored in the data set. Use item
+    assignment to replace a row.
+
+    Parameters
+    ----------
+    rows : iterable of Row, optional
+        Sequence representing the rows.
+
+    Example
+    -------
+    >>> rows = [Row([('Label_1', '123'), ('Label_2', 4.5)]),
+    ... Row([('Label_1', '123'), ('Label_2', 7.5)])]
+    >>> dataset = ColumnarDataSet(rows)
+    >>> for row in dataset:
+    ...     print(row)
+    ...
+    CompactRow([('Label_1', '123'), ('Label_2', 4.5)])
+    CompactRow([('Label_1', '123'), ('Label_2', 7.5)])
+    >>> list(dataset) == rows
+    True
+    >>> dataset.column('Label_2')
+    [4.5, 7.5]
+
+    """
+    def __init__(self, rows=None):
+        self._column_names = []
+        self._column_indices = {}
+        self._columns = []
+        self._layouts = []
+        self._layout_headers = []
+        self._layout_ids = {}
+        self._row_layouts = array('I')
+
+        if rows is not None:
+            for row in rows:
+                self.append(row)
+
+    def _add_column(self, name, value):
+        """Adds a column to the schema, typed after its first value.
+
+        Parameters
+        ----------
+        name : str or int
+            Column name.
+        value
+            Column's first value.
+
+        """
+        length = len(self._row_layouts)
+        for typecode, value_type in _ARRAY_COLUMN_TYPES.items():
+            if type(value) is value_type:
+                column = array(typecode, [value_type()]) * length
+                break
+        else:
+            column = [None] * length
+
+        self._column_indices[name] = len(self._columns)
+        self._column_names.append(name)
+        self._columns.append(column)
+
+    def _layout_id(self, row):
+        """Returns the id of a row's layout, adding the layout (and its columns) if new.
+
+        Parameters
+        ----------
+        row : Row
+            Row to look up the layout of.
+
+        Returns
+        -------
+        int
+            Layout id.
+
+        """
+        names = tuple(row.keys())
+        layout_id = self._layout_ids.get(names)
+        if layout_id is None:
+            for name, value in row.items():
+                if name not in self._column_indices:
+                    self._add_column(name, value)
+            layout_id = len(self._layouts)
+            self._layouts.append(tuple(self._column_indices[name] for name in names))
+            self._layout_headers.append(RowHeader(names))
+            self._layout_ids[names] = layout_id
+
+        return layout_id
+
+    def _set_value(self, column_index, value, index=None):
+        """
+        Stores a value in a column, at the given row index or at its end. Typed array
+        columns are turned into lists when given a value of any other type.
+
+        Parameters
+        ----------
+        column_index : int
+            Column's index in the schema.
+        value
+            Value to store.
+        index : int, optional
+            Row index to store the value at. If not given, append the value.
+
+        """
+        column = self._columns[column_index]
+        if isinstance(column, array):
+            if type(value) is not _ARRAY_COLUMN_TYPES[column.typecode]:
+                column = self._columns[column_index] = list(column)
+            elif column.typecode == 'q' and not -2 ** 63 <= value < 2 ** 63:
+                column = self._columns[column_index] = list(column)
+
+        if index is None:
+            column.append(value)
+        else:
+            column[index] = value
+
+    def _store(self, row, index=None):
+        """Stores a row's layout and values, at the given row index or at the end.
+
+        Parameters
+        ----------
+        row : Row
+            Row to store.
+        index : int, optional
+            Row index to store the row at. If not given, append the row.
+
+        """
+        layout_id = self._layout_id(row)
+        layout = self._layouts[layout_id]
+
+        for column_index, value in zip(layout, row.values()):
+            self._set_value(column_index, value, index)
+
+        if len(layout) < len(self._columns):
+            # Fill in the columns the row does not have, to keep all columns aligned
+            layout_columns = set(layout)
+            for column_index, column in enumerate(self._columns):
+                if column_index in layout_columns:
+                    continue
+                placeholder = _ARRAY_COLUMN_TYPES[column.typecode]() if isinstance(
+                    column, array) else None
+                self._set_value(column_index, placeholder, index)
+
+        if index is None:
+            self._row_layouts.append(layout_id)
+        else:
+            self._row_layouts[index] = layout_id
+
+    def append(self, row):
+        """Stores row at the end of the data set.
+
+        Parameters
+        ----------
+        row : Row
+            row to append.
+
+        """
+        DataSet._validate_row(row)
+        self._store(row)
+        if self._time_index is not None:
+            self._time_index.add(len(self) - 1, row)
+
+    def column(self, name):
+        """Returns the values of a column.
+
+        Parameters
+        ----------
+        name : str or int
+            Column name.
+
+        Returns
+        -------
+        list
+            Each row's value of the column, or None for rows without it.
+
+        Raises
+        ------
+        KeyError: If no row has the given column.
+
+        """
+        column_index = self._column_indices[name]
+        column = self._columns[column_index]
+        in_layouts = [column_index in layout for layout in self._layouts]
+
+        return [value if in_layouts[layout_id] else None
+                for layout_id, value in zip(self._row_layouts, column)]
+
+    @property
+    def column_names(self):
+        """Returns the names of all columns found in the data set. """
+        return list(self._column_names)
+
+    @property
+    def rows(self):
+        """Returns data set, as a list of (newly materialized) rows. """
+        return list(self)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+
+        columns = self._columns
+        layout_id = self._row_layouts[index]
+
+        return CompactRow(
+            self._layout_headers[layout_id],
+            [columns[i][index] for i in self._layouts[layout_id]])
+
+    def __iter__(self):
+        headers = self._layout_headers
+        full_layout = tuple(range(len(self._columns)))
+        layouts = [None if layout == full_layout else layout for layout in self._layouts]
+
+        if not self._columns:  # Only empty rows
+            for layout_id in self._row_layouts:
+                yield CompactRow(headers[layout_id], [])
+            return
+
+        for layout_id, values in zip(self._row_layouts, zip(*self._columns)):
+            layout = layouts[layout_id]
+            if layout is None:
+                yield CompactRow(headers[layout_id], list(values))
+            else:
+                yield CompactRow(headers[layout_id], [values[i] for i in layout])
+
+    def __len__(self):
+        return len(self._row_layouts)
+
+    def __repr__(self):
+        return '{name}({rows})'.format(name=self.__class__.__name__, rows=self.rows)
+
+    def __setitem__(self, index, row):
+        DataSet._validate_row(row)
+        if not -len(self) <= index < len(self):
+            raise IndexError('data set index out of range')
+        self._store(row, index % len(self))
+        if self._time_index is not None:
+            self._time_index.stale = True
+
+
 class Row(OrderedDict):
     """Container representing rows' column names and values as key/value pairs.
 
@@ -131,5 +474,323 @@ class Row(OrderedDict):
     Column name: Label_2 Column value: 456
 
     """
+    _raw = None  # Source line and the values read from it, if kept (see set_raw_line)
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
+
+    @property
+    def raw_line(self):
+        """
+        Returns the source line the row was read from, or None if it was not kept or if the
+        row's values are no longer the ones read from it.
+
+        """
+        raw = self._raw
+        if raw is None or raw[1:] != tuple(self.values()):
+            return None
+
+        return raw[0]
+
+    def set_raw_line(self, raw_line, raw_values):
+        """Keeps the source line the row was read from.
+
+        Parameters
+        ----------
+        raw_line : str
+            Source line (or lines, for a record spanning several), line break included.
+        raw_values : iterable
+            Values read from the source line. The line is only returned (see raw_line) while
+            the row holds these same values.
+
+        Example
+        -------
+        >>> row = Row([('Label_1', '123'), ('Label_2', '456')])
+        >>> row.set_raw_line('123,"456"\\n', ['123', '456'])
+        >>> row.raw_line
+        '123,"456"\\n'
+        >>> row['Label_2'] = '789'
+        >>> row.raw_line is None
+        True
+
+        """
+        self._raw = (raw_line, ) + tuple(raw_values)
+
+
+class RowHeader(object):
+    """Immutable sequence of column names, shared by compact rows.
+
+    Parameters
+    ----------
+    names : iterable of str or int
+        Column names, in order.
+
+    Attributes
+    ----------
+    names : tuple of str or int
+        Column names, in order.
+    indices : dict
+        Lookup table from column name to column index.
+
+    Raises
+    ------
+    ValueError: If a column name is given more than once.
+
+    Example
+    -------
+    >>> header = RowHeader(['Label_1', 'Label_2'])
+    >>> header
+    RowHeader(['Label_1', 'Label_2'])
+    >>> header.indices['Label_2']
+    1
+
+    """
+    __slots__ = ('names', 'indices')
+
+    def __init__(self, names):
+        names = tuple(names)
+        indices = {name: i for i, name in enumerate(names)}
+        if len(indices) != len(names):
+            raise ValueError("Column names must be unique, got {names}".format(names=names))
+        object.__setattr__(self, 'names', names)
+        object.__setattr__(self, 'indices', indices)
+
+    def __eq__(self, other):
+        return isinstance(other, RowHeader) and self.names == other.names
+
+    def __hash__(self):
+        return hash(self.names)
+
+    def __len__(self):
+        return len(self.names)
+
+    def __reduce__(self):
+        return self.__class__, (self.names, )
+
+    def __repr__(self):
+        return '{name}({names})'.format(name=self.__class__.__name__, names=list(self.names))
+
+    def __setattr__(self, name, value):
+        raise AttributeError("{name} is immutable".format(name=self.__class__.__name__))
+
+
+class CompactRow(MutableMapping):
+    """
+    Lightweight alternative to Row, holding only a list of values and a reference to a
+    header shared with other rows. Supports the same mapping API as Row, and compares equal
+    to a Row with the same column names and values, in the same order.
+
+    A row holding fewer values than its header has only the header's first columns. Adding
+    or removing a column gives the row a header of its own.
+
+    Parameters
+    ----------
+    header : RowHeader
+        Column names.
+    values : list
+        Column values. Used as is, i.e. not copied.
+
+    Examples
+    --------
+    >>> header = RowHeader(['Label_1', 'Label_2'])
+    >>> row = CompactRow(header, ['123', '456'])
+    >>> row
+    CompactRow([('Label_1', '123'), ('Label_2', '456')])
+    >>> row['Label_2']
+    '456'
+    >>> row == Row([('Label_1', '123'), ('Label_2', '456')])
+    True
+
+    """
+    __slots__ = ('_header', '_values', '_raw')
+
+    def __init__(self, header, values):
+        self._header = header
+        self._values = values
+
+    @property
+    def header(self):
+        """Returns the row's header. """
+        return self._header
+
+    @property
+    def raw_line(self):
+        """
+        Returns the source line the row was read from, or None if it was not kept or if the
+        row's values are no longer the ones read from it (see Row.set_raw_line).
+
+        """
+        raw = getattr(self, '_raw', None)
+        if raw is None or raw[1:] != tuple(self.values()):
+            return None
+
+        return raw[0]
+
+    def set_raw_line(self, raw_line, raw_values):
+        """Keeps the source line the row was read from (see Row.set_raw_line). """
+        self._raw = (raw_line, ) + tuple(raw_values)
+
+    def get(self, key, default=None):
+        index = self._header.indices.get(key)
+        if index is None or index >= len(self._values):
+            return default
+
+        return self._values[index]
+
+    def items(self):
+        return list(zip(self._header.names, self._values))
+
+    def keys(self):
+        return self._header.names[:len(self._values)]
+
+    def values(self):
+        return list(self._values[:len(self._header.names)])
+
+    def __contains__(self, key):
+        index = self._header.indices.get(key)
+        return index is not None and index < len(self._values)
+
+    def __delitem__(self, key):
+        if key not in self:
+            raise KeyError(key)
+        index = self._header.indices[key]
+        names = self.keys()
+        self._header = RowHeader(names[:index] + names[index + 1:])
+        self._values = self._values[:index] + self._values[index + 1:len(names)]
+
+    def __eq__(self, other):
+        if isinstance(other, (CompactRow, OrderedDict)):
+            return self.items() == list(other.items())
+        if isinstance(other, dict):
+            return dict(self.items()) == other
+
+        return NotImplemented
+
+    def __getitem__(self, key):
+        index = self._header.indices.get(key)
+        if index is None or index >= len(self._values):
+            raise KeyError(key)
+
+        return self._values[index]
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def __len__(self):
+        return min(len(self._header.names), len(self._values))
+
+    def __ne__(self, other):
+        result = self.__eq__(other)
+        return result if result is NotImplemented else not result
+
+    def __repr__(self):
+        return '{name}({items})'.format(name=self.__class__.__name__, items=self.items())
+
+    def __setitem__(self, key, value):
+        if key in self:
+            self._values[self._header.indices[key]] = value
+        else:
+            names = self.keys()
+            self._header = RowHeader(names + (key, ))
+            self._values = self._values[:len(names)] + [value]
+
+    __hash__ = None
+
+
+class _TimeIndex(object):
+    """Sorted time column values of a data set's rows, with the rows' indices.
+
+    Parameters
+    ----------
+    time_column : str or int
+        Time column (name or index) to index the rows by.
+
+    Attributes
+    ----------
+    time_column : str or int
+        Time column (name or index) the rows are indexed by.
+    times : list of datetime
+        Each row's time, in ascending order.
+    positions : list of int
+        Row index of each time, or None while the rows are in time order (i.e. each
+        time's row index is its own index).
+    stale : bool
+        Whether the index needs to be rebuilt before being used.
+
+    """
+    def __init__(self, time_column):
+        self.time_column = time_column
+        self.times = []
+        self.positions = None
+        self.stale = True
+
+    def add(self, position, row):
+        """Adds an appended row, or marks the index stale if it is not in time order.
+
+        Parameters
+        ----------
+        position : int
+            Row index.
+        row : Row
+            Appended row.
+
+        """
+        if self.stale:
+            return
+
+        time = row.get(self.time_column)
+        if time is None or (self.times and time < self.times[-1]):
+            self.stale = True
+        elif self.positions is None:
+            self.times.append(time)
+        else:
+            self.times.append(time)
+            self.positions.append(position)
+
+    def build(self, rows):
+        """Indexes all rows.
+
+        Parameters
+        ----------
+        rows : iterable of Row
+            The data set's rows.
+
+        Raises
+        ------
+        KeyError: If a row does not have the time column.
+
+        """
+        times = [row[self.time_column] for row in rows]
+        if all(time <= next_time for time, next_time in zip(times, times[1:])):
+            self.times = times
+            self.positions = None
+        else:
+            self.positions = sorted(range(len(times)), key=times.__getitem__)
+            self.times = [times[position] for position in self.positions]
+
+        self.stale = False
+
+    def find(self, from_timestamp=None, to_timestamp=None):
+        """Finds the rows within a time range.
+
+        Parameters
+        ----------
+        from_timestamp : datetime, optional
+            Start of the time range.
+        to_timestamp : datetime, optional
+            End of the time range.
+
+        Returns
+        -------
+        list of int
+            Indices of the rows within the time range, in ascending order.
+
+        """
+        first = 0 if from_timestamp is None else bisect.bisect_left(self.times, from_timestamp)
+        last = (len(self.times) if to_timestamp is None else
+                bisect.bisect_right(self.times, to_timestamp))
+
+        if self.positions is None:
+            return list(range(first, last))
+
+        return sorted(self.positions[first:last])
@@ -0,0 +1,58 @@
+#!/usr/bin/env
+# -*- coding: utf-8 -*-
+
+import bz2
+import gzip
+import lzma
+import os
+import shutil
+import tempfile
+
+import pytest
+
+from campbellsciparser import cr
+
+TEST_DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data')
+
+
+@pytest.fixture(params=[gzip.open, bz2.open, lzma.open])
+def compressed_file(request):
+    temp_dir = tempfile.mkdtemp()
+    file = os.path.join(temp_dir, 'csv_testdata_10_rows.dat.compressed')
+    with open(os.path.join(TEST_DATA_DIR, 'csv_testdata_10_rows.dat'), 'rb') as f_in:
+        with request.param(file, 'wb') as f_out:
+            shutil.copyfileobj(f_in, f_out)
+
+    yield file
+
+    shutil.rmtree(temp_dir)
+
+
+def test_read_table_data_compressed(compressed_file):
+    file = os.path.join(TEST_DATA_DIR, 'csv_testdata_10_rows.dat')
+
+    assert tuple(cr.read_table_data(compressed_file, first_line_num=2, last_line_num=6)) == (
+        tuple(cr.read_table_data(file, first_line_num=2, last_line_num=6)))
+    assert tuple(cr.read_mixed_array_data(compressed_file, processes=2)) == (
+        tuple(cr.read_mixed_array_data(file)))
+
+
+def test_read_table_data_compressed_cursor(compressed_file):
+    file = os.path.join(TEST_DATA_DIR, 'csv_testdata_10_rows.dat')
+
+    first_data, cursor = cr.read_table_data(compressed_file, last_line_num=3, get_cursor=True)
+    data, cursor = cr.read_table_data(compressed_file, cursor=cursor, get_cursor=True)
+
+    with open(file, 'rb') as f:
+        last_line = f.readlines()[-1]
+    assert not last_line.endswith(b'\n')
+    assert cursor.byte_offset == os.path.getsize(file) - len(last_line)
+    assert tuple(first_data) + tuple(data) == tuple(cr.read_table_data(file))[:-1]
+
+
+def test_read_table_data_compressed_line_index(compressed_file):
+    file = os.path.join(TEST_DATA_DIR, 'csv_testdata_10_rows.dat')
+    cr.update_line_index(compressed_file, interval=3)
+
+    assert tuple(cr.read_table_data(compressed_file, first_line_num=7, use_line_index=True)) == (
+        tuple(cr.read_table_data(file, first_line_num=7)))
@@ -0,0 +1,107 @@
+#!/usr/bin/env
+# -*- coding: utf-8 -*-
+
+import os
+
+import pytest
+
+from campbellsciparser import cr
+from campbellsciparser.dataset import CompactRow
+
+TEST_DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data')
+
+
+def feed_in_chunks(parser, data, chunk_size):
+    rows = []
+    for i in range(0, len(data), chunk_size):
+        rows.extend(parser.feed(data[i:i + chunk_size]))
+    rows.extend(parser.close())
+
+    return rows
+
+
+def test_table_data_parser_equals_read_table_data():
+    file = os.path.join(TEST_DATA_DIR, 'csv_testdata_5_rows_time_and_values.dat')
+    read_info = dict(
+        header=['Id', 'Time', 'Value'], first_line_num=1, parse_time_columns=True,
+        time_zone='Etc/GMT-1', time_format_args_library=['%Y-%m-%d %H:%M:%S'],
+        time_columns=['Time'], to_utc=True)
+    with open(file, 'rb') as f:
+        data = f.read()
+
+    for chunk_size in (1, 7, len(data)):
+        assert tuple(feed_in_chunks(cr.TableDataParser(**read_info), data, chunk_size)) == (
+            tuple(cr.read_table_data(file, **read_info)))
+
+
+def test_table_data_parser_header_row_and_columns():
+    file = os.path.join(TEST_DATA_DIR, 'csv_testdata_3_rows_header.dat')
+    with open(file) as f:
+        data = f.read()
+
+    parser = cr.TableDataParser(header_row=0, columns=['Label_1'], compact_rows=True)
+    rows = feed_in_chunks(parser, data, 5)
+
+    assert all(isinstance(row, CompactRow) for row in rows)
+    assert tuple(rows) == tuple(
+        cr.read_table_data(file, header_row=0, columns=['Label_1'], compact_rows=True))
+
+
+def test_table_data_parser_partial_lines():
+    parser = cr.TableDataParser(header=['Name', 'Value'], encoding='utf-8')
+
+    assert parser.feed('å'.encode('utf-8')[:1]) == []
+    assert parser.feed('å'.encode('utf-8')[1:] + b',1\n') == [{'Name': 'å', 'Value': '1'}]
+    assert parser.feed(b'b,') == []
+    assert parser.close() == [{'Name': 'b', 'Value': ''}]
+    assert parser.close() == []
+
+
+def test_table_data_parser_quoted_newlines():
+    parser = cr.TableDataParser(header=['Id', 'Text'])
+
+    assert parser.feed('1,"x\n') == []
+    assert parser.feed('y"\n2,"a\n') == [{'Id': '1', 'Text': 'x\ny'}]
+    assert parser.feed('b\n') == []
+    assert parser.close() == [{'Id': '2', 'Text': 'a\nb\n'}]
+    assert parser.line_num == 4
+
+
+def test_table_data_parser_quoted_newlines_in_chunks():
+    data = b'Id,Text\n1,"x\n""y"""\n2,z\n3,"\n\n"\n'
+    expected = [{'Id': '1', 'Text': 'x\n"y"'}, {'Id': '2', 'Text': 'z'},
+                {'Id': '3', 'Text': '\n\n'}]
+
+    for chunk_size in range(1, len(data) + 1):
+        assert feed_in_chunks(cr.TableDataParser(header_row=0), data, chunk_size) == expected
+
+
+def test_table_data_parser_mixed_chunk_types():
+    parser = cr.TableDataParser()
+    parser.feed(b'1,2\n')
+
+    with pytest.raises(TypeError):
+        parser.feed('3,4\n')
+    with pytest.raises(TypeError):
+        parser.feed('3,')
+
+
+def test_push_parser_is_abstract():
+    with pytest.raises(TypeError):
+        cr._PushParser()
+
+
+def test_table_data_parser_no_time_columns():
+    with pytest.raises(cr.TimeColumnValueError):
+        cr.TableDataParser(parse_time_columns=True)
+
+
+def test_mixed_array_data_parser_equals_read_mixed_array_data():
+    file = os.path.join(TEST_DATA_DIR, 'csv_testdata_mixed_array_10_rows.dat')
+    with open(file, 'rb') as f:
+        data = f.read()
+
+    parser = cr.MixedArrayDataParser(first_line_num=2, filters={0: '204'})
+
+    assert tuple(feed_in_chunks(parser, data, 13)) == tuple(
+        cr.read_mixed_array_data(file, first_line_num=2, filters={0: '204'}))
@@ -3,8 +3,11 @@
 
 import pytest
 
+from campbellsciparser.dataset import ColumnarDataSet
+from campbellsciparser.dataset import CompactRow
 from campbellsciparser.dataset import DataSet
 from campbellsciparser.dataset import Row
+from campbellsciparser.dataset import RowHeader
 
 
 def test_dataset_init():
@@ -37,7 +40,190 @@ def test_dataset_validate_rows():
         DataSet._validate_rows([1])
 
 
+def test_dataset_time_index():
+    dataset = DataSet([Row([('t', t), ('v', i)]) for i, t in enumerate([1, 2, 2, 4])])
+
+    with pytest.raises(ValueError):
+        dataset.time_range(1, 2)
+
+    dataset.index_time('t')
+    assert dataset.time_index_column == 't'
+    assert dataset.time_range(2, 3) == [1, 2]
+    assert dataset.time_range(from_timestamp=3) == [3]
+    assert dataset.time_range(to_timestamp=1) == [0]
+
+    dataset.append(Row([('t', 5), ('v', 4)]))
+    assert dataset._time_index.stale is False
+    assert dataset.time_range(4, 5) == [3, 4]
+
+    dataset.append(Row([('t', 3), ('v', 5)]))
+    assert dataset._time_index.stale is True
+    assert dataset.time_range(3, 4) == [3, 5]
+    assert dataset.time_slice(3, 4).rows == [Row([('t', 4), ('v', 3)]), Row([('t', 3), ('v', 5)])]
+
+    dataset[0] = Row([('t', 6), ('v', 0)])
+    assert dataset.time_range(from_timestamp=5) == [0, 4]
+
+    dataset.append(Row([('v', 6)]))
+    with pytest.raises(KeyError):
+        dataset.time_range(1, 2)
+
+
+def test_columnar_dataset_time_index():
+    dataset = ColumnarDataSet([Row([('t', t)]) for t in [3, 1, 2]])
+    dataset.index_time('t')
+    dataset.append(Row([('t', 4)]))
+
+    assert dataset.time_range(2, 4) == [0, 2, 3]
+    assert isinstance(dataset.time_slice(2, 4), ColumnarDataSet)
+    assert list(dataset.time_slice(2, 4)) == [Row([('t', 3)]), Row([('t', 2)]), Row([('t', 4)])]
+
+
 def test_row_init():
 
     assert Row([]) == Row()
     assert Row([('a', 1), ('b', 2), ('c', 3)]) == Row([('a', 1), ('b', 2), ('c', 3)])
+
+
+def test_columnar_dataset_init():
+    dataset = ColumnarDataSet()
+    assert dataset.rows == []
+    assert len(dataset) == 0
+
+    test_list = [Row([('a', 1), ('b', 2.5), ('c', '3')]), Row([('a', 4), ('b', 5.5), ('c', '6')])]
+    dataset = ColumnarDataSet(test_list)
+
+    assert dataset.rows == test_list
+    assert isinstance(dataset, DataSet)
+
+
+def test_columnar_dataset_append():
+    dataset = ColumnarDataSet([])
+    dataset.append(Row([('a', 1)]))
+    assert dataset.rows == [Row([('a', 1)])]
+
+    with pytest.raises(TypeError):
+        dataset.append(1)
+
+
+def test_columnar_dataset_mixed_layouts():
+    test_list = [
+        Row([(0, '100'), (1, '2016'), (2, 1.5)]),
+        Row([(0, '101'), (1, '2016')]),
+        Row([(1, '2017'), (0, '102'), (3, 'x')]),
+    ]
+    dataset = ColumnarDataSet(iter(test_list))
+
+    assert list(dataset) == test_list
+    assert [list(row.keys()) for row in dataset] == [[0, 1, 2], [0, 1], [1, 0, 3]]
+    assert dataset[-1] == test_list[-1]
+    assert dataset[1:] == test_list[1:]
+    assert dataset.column_names == [0, 1, 2, 3]
+    assert dataset.column(2) == [1.5, None, None]
+
+
+def test_columnar_dataset_column_types():
+    dataset = ColumnarDataSet([Row([('a', 1), ('b', 1.5)]), Row([('a', 2), ('b', 2.5)])])
+    dataset.append(Row([('a', 3.0), ('b', True)]))
+    dataset.append(Row([('a', 2 ** 70), ('b', None)]))
+
+    assert dataset.column('a') == [1, 2, 3.0, 2 ** 70]
+    assert [type(value) for value in dataset.column('b')] == [float, float, bool, type(None)]
+
+
+def test_columnar_dataset_setitem():
+    dataset = ColumnarDataSet([Row([('a', 1)]), Row([('a', 2)])])
+    dataset[-1] = Row([('b', 'x')])
+
+    assert dataset.rows == [Row([('a', 1)]), Row([('b', 'x')])]
+
+    with pytest.raises(IndexError):
+        dataset[2] = Row([('a', 3)])
+
+
+def test_columnar_dataset_empty_rows():
+    dataset = ColumnarDataSet([Row(), Row()])
+
+    assert list(dataset) == [Row(), Row()]
+    assert dataset[0] == Row()
+
+
+def test_row_header_init():
+    header = RowHeader(['a', 'b'])
+
+    assert header.names == ('a', 'b')
+    assert header.indices == {'a': 0, 'b': 1}
+    assert header == RowHeader(('a', 'b'))
+
+    with pytest.raises(ValueError):
+        RowHeader(['a', 'a'])
+
+    with pytest.raises(AttributeError):
+        header.names = ('c', )
+
+
+def test_compact_row_mapping():
+    row = CompactRow(RowHeader(['a', 'b', 'c']), [1, 2, 3])
+
+    assert list(row.keys()) == ['a', 'b', 'c']
+    assert list(row.values()) == [1, 2, 3]
+    assert list(row.items()) == [('a', 1), ('b', 2), ('c', 3)]
+    assert row['b'] == 2
+    assert row.get('d') is None
+    assert 'c' in row and 'd' not in row
+    assert len(row) == 3
+
+    with pytest.raises(KeyError):
+        row['d']
+
+
+def test_compact_row_equals_row():
+    row = CompactRow(RowHeader(['a', 'b']), [1, 2])
+
+    assert row == Row([('a', 1), ('b', 2)])
+    assert Row([('a', 1), ('b', 2)]) == row
+    assert row != Row([('b', 2), ('a', 1)])
+    assert row == CompactRow(RowHeader(['a', 'b']), [1, 2])
+
+
+def test_compact_row_fewer_or_more_values_than_header():
+    header = RowHeader(['a', 'b', 'c'])
+
+    assert CompactRow(header, [1]) == Row([('a', 1)])
+    assert 'b' not in CompactRow(header, [1])
+    assert CompactRow(header, [1, 2, 3, 4]) == Row([('a', 1), ('b', 2), ('c', 3)])
+
+
+def test_compact_row_setitem_delitem():
+    header = RowHeader(['a', 'b'])
+    row = CompactRow(header, [1, 2])
+
+    row['a'] = 10
+    row['c'] = 3
+    del row['b']
+
+    assert row == Row([('a', 10), ('c', 3)])
+    assert header.names == ('a', 'b')
+
+
+def test_dataset_compact_rows():
+    dataset = DataSet([CompactRow(RowHeader(['a']), [1])])
+    dataset.append(CompactRow(RowHeader(['a']), [2]))
+
+    assert dataset.rows == [Row([('a', 1)]), Row([('a', 2)])]
+
+
+def test_row_raw_line():
+    row = Row([('a', '1'), ('b', '2')])
+    compact_row = CompactRow(RowHeader(['a', 'b']), ['1', '2'])
+
+    assert row.raw_line is None and compact_row.raw_line is None
+
+    for raw_row in (row, compact_row):
+        raw_row.set_raw_line('1,"2"\r\n', ['1', '2'])
+        assert raw_row.raw_line == '1,"2"\r\n'
+        raw_row['b'] = '3'
+        assert raw_row.raw_line is None
+        raw_row['b'] = '2'
+        raw_row['c'] = '4'
+        assert raw_row.raw_line is None
@@ -104,3 +104,81 @@ def test_export_array_ids_to_csv_headers():
 
         assert_two_lists_equal(data_exported_file_100_headers, data_100_column_names)
         assert_two_lists_equal(data_exported_file_101_headers, data_101_column_names)
+
+
+def test_export_array_ids_to_csv_streamed_rows():
+    file = os.path.join(TEST_DATA_DIR, 'csv_testdata_mixed_array_10_rows.dat')
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        array_ids_info = {
+            array_id: {'file_path': os.path.join(temp_dir, array_id, 'test.dat')}
+            for array_id in ('201', '203', '204')}
+
+        cr.export_array_ids_to_csv(
+            data=cr.iter_mixed_array_data(file, fix_floats=False), array_ids_info=array_ids_info,
+            mode='w', max_open_files=1)
+
+        data = cr.read_array_ids_data(file, fix_floats=False)
+        for array_id, export_info in array_ids_info.items():
+            assert_two_data_sets_equal(
+                data.get(array_id), cr.read_mixed_array_data(export_info['file_path'],
+                                                             fix_floats=False))
+
+
+def test_export_array_ids_to_csv_shared_file():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        output_file = os.path.join(temp_dir, 'test.dat')
+        data = DataSet([
+            Row([('ID', '100'), ('Data', '54.2')]),
+            Row([('ID', '101'), ('Data', '44.2')]),
+            Row([('ID', '102'), ('Data', '34.2')]),
+            Row([('ID', '100'), ('Data', '24.2')]),
+        ])
+        array_ids_info = {'100': {'file_path': output_file}, '101': {'file_path': output_file}}
+
+        cr.export_array_ids_to_csv(data=data, array_ids_info=array_ids_info, export_header=True)
+
+        with open(output_file) as f:
+            assert f.read() == 'ID,Data\n100,54.2\n101,44.2\n100,24.2\n'
+
+
+def test_export_array_ids_to_csv_raw_lines():
+    file = os.path.join(TEST_DATA_DIR, 'csv_testdata_mixed_array_10_rows.dat')
+    with open(file, 'rb') as f:
+        lines = f.readlines()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for fix_floats in (False, True):
+            array_ids_info = {
+                array_id: {'file_path': os.path.join(temp_dir, str(fix_floats), array_id)}
+                for array_id in ('203', '204')}
+
+            cr.export_array_ids_to_csv(
+                data=cr.iter_mixed_array_data(file, fix_floats=fix_floats, raw_lines=True),
+                array_ids_info=array_ids_info, raw_lines=True)
+
+            for array_id, export_info in array_ids_info.items():
+                with open(export_info['file_path'], 'rb') as f:
+                    exported_lines = f.readlines()
+                array_id_lines = [line for line in lines if line.startswith(array_id.encode())]
+                if fix_floats and array_id == '204':
+                    assert exported_lines == [line.replace(b',.', b',0.').replace(b'-.', b'-0.')
+                                              for line in array_id_lines]
+                else:
+                    assert exported_lines == array_id_lines
+
+
+def test_export_array_ids_to_csv_raw_lines_line_terminator():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        input_file = os.path.join(temp_dir, 'input.dat')
+        output_file = os.path.join(temp_dir, '100.dat')
+        with open(input_file, 'w', newline='') as f:
+            f.write('100,.5\r\n100,1\r\n100,2')
+
+        data = cr.read_mixed_array_data(input_file, fix_floats=False, raw_lines=True)
+        data[1][1] = '1.0'
+        cr.export_array_ids_to_csv(
+            data, {'100': {'file_path': output_file}}, export_header=True, raw_lines=True)
+
+        with open(output_file, newline='') as f:
+            assert f.read() == '0,1\r\n100,.5\r\n100,1.0\r\n100,2\r\n'
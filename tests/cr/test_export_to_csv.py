@@ -4,8 +4,9 @@
 import os
 import tempfile
 
-from datetime import datetime
+from datetime import datetime, timedelta
 
+import pytest
 import pytz
 
 from campbellsciparser import cr
@@ -117,3 +118,133 @@ def test_export_to_csv_file_include_time_zone():
             dt.strftime('%Y-%m-%d %H:%M:%S'), '%Y-%m-%d %H:%M:%S')
 
         assert exported_time_dt_no_tz == expected_dt_no_tz
+
+
+def test_export_to_csv_columnar_file_content():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        file = os.path.join(TEST_DATA_DIR, 'csv_testdata_10_rows.dat')
+        output_file = os.path.join(temp_dir, 'test.dat')
+
+        data_source_file = cr.read_table_data(infile_path=file, columnar=True)
+        cr.export_to_csv(data=data_source_file, outfile_path=output_file)
+        data_exported_file = cr.read_table_data(infile_path=output_file)
+
+        assert_two_data_sets_equal(data_source_file, data_exported_file)
+
+
+def test_export_to_csv_append_header_once():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        output_file = os.path.join(temp_dir, 'test.dat')
+        data = DataSet([Row([('Label_0', '1'), ('Label_1', '2')])])
+
+        for _ in range(3):
+            cr.export_to_csv(data=data, outfile_path=output_file, export_header=True,
+                             check_header=True)
+        cr.export_to_csv(data=data, outfile_path=output_file, export_header=True, mode='w')
+
+        with open(output_file) as f:
+            assert f.read() == 'Label_0,Label_1\n1,2\n'
+
+
+def test_export_to_csv_header_mismatch():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        output_file = os.path.join(temp_dir, 'test.dat')
+        cr.export_to_csv(data=DataSet([Row([('Label_0', '1'), ('Label_1', '2')])]),
+                         outfile_path=output_file, export_header=True)
+
+        with pytest.raises(cr.HeaderMismatchError):
+            cr.export_to_csv(data=DataSet([Row([('Label_0', '1'), ('Label_2', '2')])]),
+                             outfile_path=output_file, export_header=True, check_header=True)
+        with pytest.raises(cr.HeaderMismatchError):
+            cr.export_array_ids_to_csv(
+                data=DataSet([Row([('ID', '100'), ('Label_1', '2')])]),
+                array_ids_info={'100': {'file_path': output_file}}, check_header=True)
+
+        with open(output_file) as f:
+            assert f.read() == 'Label_0,Label_1\n1,2\n'
+
+
+def test_export_to_csv_quoting_and_dialect():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        output_file = os.path.join(temp_dir, 'test.dat')
+        dt = datetime(2016, 1, 1, 22, 15, 30, tzinfo=pytz.UTC)
+        row = Row([('Label_0', 'a,b'), ('Label_1', 'say "hi"'), ('Label_2', dt),
+                   ('Label_3', 1.5), ('Label_4', None)])
+        data = DataSet([row])
+
+        cr.export_to_csv(data=data, outfile_path=output_file, export_header=True)
+        cr.export_to_csv(data=data, outfile_path=output_file, dialect='excel-tab',
+                         include_time_zone=True)
+
+        assert row['Label_2'] == dt
+        with open(output_file, newline='') as f:
+            assert f.read() == (
+                'Label_0,Label_1,Label_2,Label_3,Label_4\n'
+                '"a,b","say ""hi""",2016-01-01 22:15:30,1.5,None\n'
+                'a,b\t"say ""hi"""\t2016-01-01 22:15:30+0000\t1.5\tNone\r\n')
+        assert tuple(cr.read_table_data(output_file, header_row=0))[0]['Label_0'] == 'a,b'
+
+
+def test_export_to_csv_time_formats():
+    pytz_time_zone = pytz.timezone('Europe/Stockholm')
+    data = DataSet([
+        Row([('TIMESTAMP', pytz_time_zone.localize(datetime(2016, 7, 1, 22, 15, 30)))]),
+        Row([('TIMESTAMP', pytz_time_zone.localize(datetime(2016, 12, 1, 22, 15, 30, 500)))]),
+    ])
+    expected_lines = {
+        ('default', False): ['2016-07-01 22:15:30', '2016-12-01 22:15:30'],
+        ('default', True): ['2016-07-01 22:15:30+0200', '2016-12-01 22:15:30+0100'],
+        ('iso', False): ['2016-07-01T22:15:30', '2016-12-01T22:15:30.000500'],
+        ('iso', True): ['2016-07-01T22:15:30+02:00', '2016-12-01T22:15:30.000500+01:00'],
+        ('epoch', True): ['1467404130', '1480626930.000500'],
+    }
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for (time_format, include_time_zone), lines in expected_lines.items():
+            output_file = os.path.join(temp_dir, time_format + str(include_time_zone))
+            cr.export_to_csv(data=data, outfile_path=output_file, time_format=time_format,
+                             include_time_zone=include_time_zone)
+
+            with open(output_file) as f:
+                assert f.read().splitlines() == lines
+
+        with pytest.raises(ValueError):
+            cr.export_to_csv(data=data, outfile_path=output_file, time_format='%Y')
+
+
+def test_datetime_formatter_equals_datetime_to_string():
+    format_datetime = cr._DatetimeFormatter(include_time_zone=True).format
+    for time_zone in ('UTC', 'Europe/Stockholm', 'America/St_Johns', 'Asia/Kolkata'):
+        pytz_time_zone = pytz.timezone(time_zone)
+        for day in range(0, 366, 7):
+            dt = pytz_time_zone.localize(datetime(2016, 1, 1, 1, 2, 3) + timedelta(days=day))
+            assert format_datetime(dt) == cr._datetime_to_string(dt, include_time_zone=True)
+
+
+def test_export_to_csv_raw_lines():
+    lines = ['"TIMESTAMP","RECORD","Value"\r\n', '"2016-01-01 00:00:00",0,.5\r\n',
+             '"2016-01-01 00:01:00",1,"multi\r\nline"\r\n', '"2016-01-01 00:02:00",2,-.25']
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        input_file = os.path.join(temp_dir, 'input.dat')
+        output_file = os.path.join(temp_dir, 'output.dat')
+        with open(input_file, 'w', newline='') as f:
+            f.write(''.join(lines))
+
+        data = cr.read_table_data(input_file, header_row=0, first_line_num=1, raw_lines=True)
+        cr.export_to_csv(data, output_file, raw_lines=True)
+        data[2]['Value'] = '-0.25'
+        cr.export_to_csv(data, output_file, raw_lines=True)
+
+        with open(output_file, newline='') as f:
+            assert f.read() == ''.join(lines[1:]) + '\r\n' + ''.join(lines[1:3]) + (
+                '2016-01-01 00:02:00,2,-0.25\r\n')
+
+        headed_output_file = os.path.join(temp_dir, 'headed_output.dat')
+        cr.export_to_csv(data, headed_output_file, export_header=True, raw_lines=True)
+        with open(headed_output_file, newline='') as f:
+            assert f.read() == 'TIMESTAMP,RECORD,Value\r\n' + ''.join(lines[1:3]) + (
+                '2016-01-01 00:02:00,2,-0.25\r\n')
+
+        with pytest.raises(ValueError):
+            cr.export_to_csv(data, output_file, raw_lines=True, dialect='excel-tab')
@@ -5,6 +5,7 @@ import os
 
 from datetime import datetime
 
+import pytest
 import pytz
 
 from campbellsciparser import cr
@@ -123,6 +124,64 @@ def test_extract_columns_data_generator_time_range():
     ) == (expected_row_3, expected_row_4)
 
 
+def test_extract_columns_data_generator_sorted_by_time():
+    minutes = [0, 1, 1, 2, 3, 3, 3, 5, 8]
+    data = DataSet([Row([('Timestamp', datetime(2016, 1, 1, 0, minute, tzinfo=pytz.UTC)),
+                         ('Value', str(i))])
+                    for i, minute in enumerate(minutes)])
+
+    for from_minute in range(-1, 10):
+        for to_minute in range(from_minute, 10):
+            time_range = {
+                'time_column': 'Timestamp',
+                'from_timestamp': datetime(2016, 1, 1, 0, max(from_minute, 0), tzinfo=pytz.UTC),
+                'to_timestamp': datetime(2016, 1, 1, 0, max(to_minute, 0), tzinfo=pytz.UTC)
+            }
+
+            assert tuple(cr._extract_columns_data_generator(
+                data, 'Value', sorted_by_time=True, **time_range)) == tuple(
+                cr._extract_columns_data_generator(data, 'Value', **time_range))
+
+    assert tuple(cr._extract_columns_data_generator(
+        DataSet(), time_column='Timestamp', sorted_by_time=True)) == ()
+
+    with pytest.raises(cr.TimeColumnValueError):
+        tuple(cr._extract_columns_data_generator(data, time_column='Foo', sorted_by_time=True))
+
+
+def test_extract_columns_data_sorted_by_time_only():
+    data = DataSet([Row([('Timestamp', datetime(2016, 1, 1, 0, minute, tzinfo=pytz.UTC)),
+                         ('Value', str(minute))])
+                    for minute in range(3)])
+
+    for sorted_by_time in (False, True):
+        assert tuple(cr.extract_columns_data(data, 'Value', sorted_by_time=sorted_by_time)) == (
+            tuple(cr.extract_columns_data(data, 'Value')))
+
+
+def test_extract_columns_data_generator_time_index():
+    minutes = [5, 0, 3, 1, 3, 8]
+    data = DataSet([Row([('Timestamp', datetime(2016, 1, 1, 0, minute, tzinfo=pytz.UTC)),
+                         ('Value', str(i))])
+                    for i, minute in enumerate(minutes)])
+    time_range = {
+        'time_column': 'Timestamp',
+        'from_timestamp': datetime(2016, 1, 1, 0, 1, tzinfo=pytz.UTC),
+        'to_timestamp': datetime(2016, 1, 1, 0, 5, tzinfo=pytz.UTC)
+    }
+    expected_rows = tuple(cr._extract_columns_data_generator(data, 'Value', **time_range))
+
+    data.index_time('Timestamp')
+
+    assert tuple(cr._extract_columns_data_generator(data, 'Value', **time_range)) == (
+        expected_rows)
+    assert [row['Value'] for row in expected_rows] == ['0', '2', '3', '4']
+
+    data.append(Row([('Value', '6')]))
+    with pytest.raises(cr.TimeColumnValueError):
+        tuple(cr._extract_columns_data_generator(data, 'Value', **time_range))
+
+
 def test_extract_columns_data():
     file = os.path.join(TEST_DATA_DIR, 'csv_testdata_5_rows_time_and_values.dat')
     time_zone = 'Etc/GMT-1'
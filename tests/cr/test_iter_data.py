@@ -0,0 +1,159 @@
+#!/usr/bin/env
+# -*- coding: utf-8 -*-
+
+import os
+import tempfile
+import types
+
+from datetime import datetime
+
+import pytest
+import pytz
+
+from campbellsciparser import cr
+
+TEST_DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data')
+
+
+def test_iter_table_data_is_generator():
+    file = os.path.join(TEST_DATA_DIR, 'csv_testdata_10_rows.dat')
+    assert isinstance(cr.iter_table_data(infile_path=file), types.GeneratorType)
+
+
+def test_iter_table_data_equals_read_table_data():
+    file = os.path.join(TEST_DATA_DIR, 'csv_testdata_10_rows.dat')
+
+    assert tuple(cr.iter_table_data(infile_path=file, first_line_num=2, last_line_num=6)) == (
+        tuple(cr.read_table_data(infile_path=file, first_line_num=2, last_line_num=6)))
+
+
+def test_iter_table_data_parse_time():
+    file = os.path.join(TEST_DATA_DIR, 'csv_testdata_5_rows_time_and_values.dat')
+    rows = cr.iter_table_data(
+        infile_path=file,
+        parse_time_columns=True,
+        time_format_args_library=['%Y-%m-%d %H:%M:%S'],
+        time_parsed_column='TIMESTAMP',
+        time_columns=[1],
+        to_utc=True
+    )
+
+    first_row = next(rows)
+    rows.close()
+
+    assert list(first_row.keys()) == [0, 'TIMESTAMP', 2]
+    assert first_row.get('TIMESTAMP') == datetime(2016, 1, 1, 19, 30, 15, tzinfo=pytz.UTC)
+
+
+def test_iter_table_data_parse_time_no_time_columns():
+    file = os.path.join(TEST_DATA_DIR, 'csv_testdata_empty.dat')
+    with pytest.raises(cr.TimeColumnValueError):
+        list(cr.iter_table_data(infile_path=file, parse_time_columns=True))
+
+
+def test_iter_mixed_array_data_equals_read_mixed_array_data():
+    file = os.path.join(TEST_DATA_DIR, 'csv_testdata_mixed_array_10_rows.dat')
+
+    assert tuple(cr.iter_mixed_array_data(infile_path=file)) == (
+        tuple(cr.read_mixed_array_data(infile_path=file)))
+
+
+def test_iter_array_ids_data():
+    file = os.path.join(TEST_DATA_DIR, 'csv_testdata_mixed_array_10_rows.dat')
+    array_id_names = {'203': 'label_1', '204': ''}
+
+    data_split = cr.read_array_ids_data(infile_path=file, array_id_names=array_id_names)
+    rows = list(cr.iter_array_ids_data(infile_path=file, array_id_names=array_id_names))
+
+    assert {array_name for array_name, row in rows} == {'label_1', '204'}
+    for array_name, array_name_data in data_split.items():
+        assert tuple(array_name_data) == tuple(
+            row for row_array_name, row in rows if row_array_name == array_name)
+
+
+def test_iter_array_ids_data_unfiltered():
+    file = os.path.join(TEST_DATA_DIR, 'csv_testdata_mixed_array_10_rows.dat')
+    rows = list(cr.iter_array_ids_data(infile_path=file))
+
+    assert len(rows) == 10
+    assert all(array_id == row[0] for array_id, row in rows)
+
+
+def test_iter_table_data_follow():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        file = os.path.join(temp_dir, 'test.dat')
+        with open(file, 'w') as f:
+            f.write('Id,Value\n1,1.0\n2,')
+
+        rows = cr.iter_table_data(
+            file, header_row=0, first_line_num=1, follow=True, poll_interval=0.01,
+            idle_timeout=0.1)
+
+        assert next(rows) == {'Id': '1', 'Value': '1.0'}
+        with open(file, 'a') as f:
+            f.write('2.0\n3,3.0\n')
+        assert list(rows) == [{'Id': '2', 'Value': '2.0'}, {'Id': '3', 'Value': '3.0'}]
+
+
+def test_iter_table_data_follow_truncated_and_rotated():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        file = os.path.join(temp_dir, 'test.dat')
+        rotated_file = os.path.join(temp_dir, 'rotated.dat')
+        with open(file, 'w') as f:
+            f.write('1,1.0\n2,2.0\n')
+
+        rows = cr.iter_table_data(file, follow=True, poll_interval=0.01, idle_timeout=0.1)
+
+        assert [next(rows)[0], next(rows)[0]] == ['1', '2']
+        with open(file, 'w') as f:
+            f.write('3,3.0\n')
+        assert next(rows)[0] == '3'
+        with open(file, 'a') as f:
+            f.write('4,4.0\n')
+        with open(rotated_file, 'w') as f:
+            f.write('5,5.0\n')
+        os.replace(rotated_file, file)
+        assert [row[0] for row in rows] == ['4', '5']
+
+
+def test_iter_table_data_follow_header_row_truncated_and_rotated():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        file = os.path.join(temp_dir, 'test.dat')
+        rotated_file = os.path.join(temp_dir, 'rotated.dat')
+        with open(file, 'w') as f:
+            f.write('Id,Value\n1,1.0\n')
+
+        rows = cr.iter_table_data(
+            file, header_row=0, follow=True, poll_interval=0.01, idle_timeout=0.1)
+
+        assert next(rows) == {'Id': '1', 'Value': '1.0'}
+        with open(file, 'w') as f:
+            f.write('Id,Value\n2,2\n')
+        assert next(rows) == {'Id': '2', 'Value': '2'}
+        with open(rotated_file, 'w') as f:
+            f.write('Id,Value\n3,3.0\n')
+        os.replace(rotated_file, file)
+        assert list(rows) == [{'Id': '3', 'Value': '3.0'}]
+
+
+def test_iter_table_data_follow_last_line_num():
+    file = os.path.join(TEST_DATA_DIR, 'csv_testdata_10_rows.dat')
+
+    assert tuple(cr.iter_table_data(file, last_line_num=4, follow=True)) == (
+        tuple(cr.read_table_data(file, last_line_num=4)))
+
+
+def test_iter_array_ids_data_follow():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        file = os.path.join(temp_dir, 'test.dat')
+        with open(file, 'w') as f:
+            f.write('100,1.0\n101,2.0\n100,3')
+
+        rows = cr.iter_array_ids_data(
+            file, array_id_names={'100': 'Hourly'}, follow=True, poll_interval=0.01,
+            idle_timeout=0.1)
+
+        assert next(rows) == ('Hourly', {0: '100', 1: '1.0'})
+        with open(file, 'a') as f:
+            f.write('.0\n')
+        assert list(rows) == [('Hourly', {0: '100', 1: '3.0'})]
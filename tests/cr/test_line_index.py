@@ -0,0 +1,109 @@
+#!/usr/bin/env
+# -*- coding: utf-8 -*-
+
+import os
+import tempfile
+
+from campbellsciparser import cr
+
+
+def write_lines(file, lines, mode='a'):
+    with open(file, mode) as f:
+        for line in lines:
+            f.write(line + '\n')
+
+
+def test_update_line_index_offsets():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        file = os.path.join(temp_dir, 'test.dat')
+        write_lines(file, ['1,2', '3,4', '5,6', '7,8', '9,10'])
+
+        line_index = cr.update_line_index(file, interval=2)
+
+        assert line_index['byte_offsets'] == [0, 8, 16]
+        assert line_index['end_line_num'] == 5
+        assert os.path.exists(file + cr.LINE_INDEX_SUFFIX)
+
+
+def test_update_line_index_temp_files():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        file = os.path.join(temp_dir, 'test.dat')
+        write_lines(file, ['1,2', '3,4'])
+        cr.update_line_index(file, interval=1)
+        write_lines(file, ['5,6'])
+
+        with open(file, 'rb') as f:
+            index_path = file + cr.LINE_INDEX_SUFFIX
+            line_indexes = [cr._update_line_index(f, index_path, interval=1) for i in range(2)]
+
+        assert line_indexes[0] == line_indexes[1] == cr.update_line_index(file, interval=1)
+        assert sorted(os.listdir(temp_dir)) == ['test.dat', 'test.dat' + cr.LINE_INDEX_SUFFIX]
+
+
+def test_update_line_index_partial_line():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        file = os.path.join(temp_dir, 'test.dat')
+        write_lines(file, ['1,2', '3,4'])
+        with open(file, 'a') as f:
+            f.write('5,')
+
+        line_index = cr.update_line_index(file, interval=1)
+
+        assert line_index['byte_offsets'] == [0, 4]
+        assert line_index['end_offset'] == 8
+
+
+def test_update_line_index_incremental():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        file = os.path.join(temp_dir, 'test.dat')
+        write_lines(file, [str(i) for i in range(5)])
+        cr.update_line_index(file, interval=2)
+
+        write_lines(file, [str(i) for i in range(5, 10)])
+        line_index = cr.update_line_index(file)
+
+        assert line_index['interval'] == 2
+        assert line_index['byte_offsets'] == [0, 4, 8, 12, 16]
+        assert line_index['end_line_num'] == 10
+
+
+def test_update_line_index_truncated():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        file = os.path.join(temp_dir, 'test.dat')
+        write_lines(file, [str(i) for i in range(10)])
+        cr.update_line_index(file, interval=2)
+
+        write_lines(file, ['10', '11'], mode='w')
+        line_index = cr.update_line_index(file)
+
+        assert line_index['byte_offsets'] == [0]
+        assert line_index['end_line_num'] == 2
+
+
+def test_read_table_data_use_line_index():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        file = os.path.join(temp_dir, 'test.dat')
+        write_lines(file, ['Label_0,Label_1'] + ['{0},{1}'.format(i, i * 2) for i in range(1, 50)])
+        cr.update_line_index(file, interval=7)
+
+        for first_line_num, last_line_num in [(0, None), (1, 5), (7, 7), (20, 35), (48, None)]:
+            expected_data = cr.read_table_data(
+                file, header_row=0, first_line_num=first_line_num, last_line_num=last_line_num)
+            data, cursor = cr.read_table_data(
+                file, header_row=0, first_line_num=first_line_num, last_line_num=last_line_num,
+                use_line_index=True, get_cursor=True)
+
+            assert tuple(data) == tuple(expected_data)
+            assert data[0]['Label_0'] == str(max(first_line_num, 1))
+
+
+def test_read_mixed_array_data_use_line_index():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        file = os.path.join(temp_dir, 'test.dat')
+        write_lines(file, ['{0},2016,.{1}'.format(100 + i % 2, i) for i in range(30)])
+
+        expected_data = cr.read_mixed_array_data(file, first_line_num=25)
+        data = cr.read_mixed_array_data(file, first_line_num=25, use_line_index=True)
+
+        assert tuple(data) == tuple(expected_data)
+        assert os.path.exists(file + cr.LINE_INDEX_SUFFIX)
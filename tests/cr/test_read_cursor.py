@@ -0,0 +1,138 @@
+#!/usr/bin/env
+# -*- coding: utf-8 -*-
+
+import os
+import tempfile
+
+from campbellsciparser import cr
+from campbellsciparser.dataset import Row
+
+
+def write_lines(file, lines, mode='a'):
+    with open(file, mode) as f:
+        for line in lines:
+            f.write(line + '\n')
+
+
+def test_read_table_data_cursor_resume():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        file = os.path.join(temp_dir, 'test.dat')
+        write_lines(file, ['Label_0,Label_1', '1,2', '3,4'])
+
+        data, cursor = cr.read_table_data(infile_path=file, header_row=0, get_cursor=True)
+        assert len(data) == 2
+        assert cursor.line_num == 3
+        assert cursor.byte_offset == os.path.getsize(file)
+
+        write_lines(file, ['5,6'])
+        data, cursor = cr.read_table_data(
+            infile_path=file, header_row=0, cursor=cursor, get_cursor=True)
+
+        assert tuple(data) == (Row([('Label_0', '5'), ('Label_1', '6')]), )
+        assert cursor.line_num == 4
+
+        data = cr.read_table_data(infile_path=file, header_row=0, cursor=cursor)
+        assert len(data) == 0
+
+
+def test_read_table_data_cursor_unterminated_last_line():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        file = os.path.join(temp_dir, 'test.dat')
+        with open(file, 'w') as f:
+            f.write('1,a\n2,b\n3,c')
+
+        data, cursor = cr.read_table_data(infile_path=file, get_cursor=True)
+        assert [row[1] for row in data] == ['a', 'b']
+        assert (cursor.byte_offset, cursor.line_num) == (8, 2)
+
+        with open(file, 'a') as f:
+            f.write('c\n4,d\n')
+        for read_data in (cr.read_table_data, cr.read_mixed_array_data):
+            data, next_cursor = read_data(infile_path=file, cursor=cursor, get_cursor=True)
+
+            assert [(row[0], row[1]) for row in data] == [('3', 'cc'), ('4', 'd')]
+            assert next_cursor.byte_offset == os.path.getsize(file)
+
+        data, cursor = cr.read_table_data(infile_path=file, get_cursor=True, processes=2)
+        assert len(data) == 4 and cursor == next_cursor
+
+
+def test_read_table_data_cursor_last_line_num():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        file = os.path.join(temp_dir, 'test.dat')
+        write_lines(file, [str(i) for i in range(10)])
+
+        data, cursor = cr.read_table_data(infile_path=file, last_line_num=3, get_cursor=True)
+        assert [row[0] for row in data] == ['0', '1', '2', '3']
+        assert cursor.line_num == 4
+
+        data = cr.read_table_data(infile_path=file, last_line_num=5, cursor=cursor)
+        assert [row[0] for row in data] == ['4', '5']
+
+
+def test_read_table_data_cursor_truncated():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        file = os.path.join(temp_dir, 'test.dat')
+        write_lines(file, ['1,2', '3,4', '5,6'])
+        data, cursor = cr.read_table_data(infile_path=file, get_cursor=True)
+
+        write_lines(file, ['7,8'], mode='w')
+        data = cr.read_table_data(infile_path=file, cursor=cursor)
+
+        assert tuple(data) == (Row([(0, '7'), (1, '8')]), )
+
+
+def test_read_table_data_cursor_rotated():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        file = os.path.join(temp_dir, 'test.dat')
+        rotated_file = os.path.join(temp_dir, 'test.dat.1')
+        write_lines(file, ['1,2', '3,4'])
+        data, cursor = cr.read_table_data(infile_path=file, get_cursor=True)
+
+        os.rename(file, rotated_file)
+        write_lines(file, ['5,6', '7,8', '9,10'])
+        data = cr.read_table_data(infile_path=file, cursor=cursor)
+
+        assert len(data) == 3
+
+
+def test_read_mixed_array_data_cursor_resume():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        file = os.path.join(temp_dir, 'test.dat')
+        write_lines(file, ['100,2016,.5', '101,2016,-.5'])
+        data, cursor = cr.read_mixed_array_data(infile_path=file, get_cursor=True)
+        assert len(data) == 2
+
+        write_lines(file, ['100,2017,.25'])
+        data, cursor = cr.read_mixed_array_data(
+            infile_path=file, cursor=cursor, get_cursor=True)
+
+        assert tuple(data) == (Row([(0, '100'), (1, '2017'), (2, '0.25')]), )
+        assert cursor.line_num == 3
+
+
+def test_read_array_ids_data_cursor_resume():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        file = os.path.join(temp_dir, 'test.dat')
+        write_lines(file, ['100,2016,1', '101,2016,2'])
+        data, cursor = cr.read_array_ids_data(
+            infile_path=file, array_id_names={'100': 'Daily'}, get_cursor=True)
+        assert len(data.get('Daily')) == 1
+
+        write_lines(file, ['100,2016,3', '101,2016,4'])
+        data = cr.read_array_ids_data(
+            infile_path=file, array_id_names={'100': 'Daily'}, cursor=cursor)
+
+        assert tuple(data.get('Daily')) == (Row([(0, '100'), (1, '2016'), (2, '3')]), )
+
+
+def test_cursor_restored_from_values():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        file = os.path.join(temp_dir, 'test.dat')
+        write_lines(file, ['1', '2'])
+        data, cursor = cr.read_table_data(infile_path=file, get_cursor=True)
+        write_lines(file, ['3'])
+
+        data = cr.read_table_data(infile_path=file, cursor=cr.ReadCursor(*list(cursor)))
+
+        assert tuple(data) == (Row([(0, '3')]), )
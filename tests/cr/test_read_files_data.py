@@ -0,0 +1,106 @@
+#!/usr/bin/env
+# -*- coding: utf-8 -*-
+
+import os
+import weakref
+
+from concurrent.futures import Future
+
+import pytest
+
+from campbellsciparser import cr
+
+TEST_DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data')
+
+
+def test_read_files_data():
+    files = [os.path.join(TEST_DATA_DIR, name)
+             for name in ('csv_testdata_3_rows_header.dat', 'csv_testdata_10_rows.dat')]
+
+    data, errors = cr.read_files_data(files, read_options={files[0]: {'header_row': 0}},
+                                      first_line_num=1)
+
+    assert list(data) == files
+    assert errors == {}
+    assert tuple(data[files[0]]) == tuple(
+        cr.read_table_data(files[0], header_row=0, first_line_num=1))
+    assert tuple(data[files[1]]) == tuple(cr.read_table_data(files[1], first_line_num=1))
+
+
+def test_read_files_data_glob_and_readers():
+    files = os.path.join(TEST_DATA_DIR, 'csv_testdata_mixed_array_*.dat')
+    array_ids_file = os.path.join(TEST_DATA_DIR, 'csv_testdata_mixed_array_10_rows.dat')
+    array_id_names = {'203': 'label_1'}
+
+    data, errors = cr.read_files_data(
+        files, reader='mixed_array',
+        read_options={array_ids_file: {'reader': 'array_ids', 'array_id_names': array_id_names}})
+
+    assert list(data) == [
+        array_ids_file, os.path.join(TEST_DATA_DIR, 'csv_testdata_mixed_array_filtered_rows.dat')]
+    array_ids_data = cr.read_array_ids_data(array_ids_file, array_id_names=array_id_names)
+    assert {array_name: tuple(array_name_data)
+            for array_name, array_name_data in data[array_ids_file].items()} == {
+        array_name: tuple(array_name_data)
+        for array_name, array_name_data in array_ids_data.items()}
+
+
+def test_read_files_data_errors():
+    files = [os.path.join(TEST_DATA_DIR, name)
+             for name in ('csv_testdata_missing.dat', 'csv_testdata_10_rows.dat')]
+
+    data, errors = cr.read_files_data(files, processes=2)
+
+    assert list(data) == files[1:]
+    assert list(errors) == files[:1]
+    assert isinstance(errors[files[0]], FileNotFoundError)
+
+
+def test_read_files_data_unknown_reader():
+    with pytest.raises(ValueError):
+        cr.read_files_data([os.path.join(TEST_DATA_DIR, 'csv_testdata_10_rows.dat')],
+                           reader='toa6')
+
+
+def test_iter_files_data_processes():
+    files = [os.path.join(TEST_DATA_DIR, name)
+             for name in ('csv_testdata_3_rows.dat', 'csv_testdata_10_rows.dat',
+                          'csv_testdata_missing.dat')]
+
+    results = list(cr.iter_files_data(files, processes=2, first_line_num=1))
+
+    assert sorted(result.infile_path for result in results) == sorted(files)
+    for result in results:
+        if result.infile_path == files[2]:
+            assert result.data is None and isinstance(result.error, FileNotFoundError)
+        else:
+            assert result.error is None
+            assert tuple(result.data) == tuple(
+                cr.read_table_data(result.infile_path, first_line_num=1))
+
+
+def test_iter_files_data_processes_releases_results(monkeypatch):
+    submitted = []
+
+    class SerialExecutor(object):
+        def __init__(self, max_workers):
+            pass
+
+        def submit(self, fn, *args):
+            future = Future()
+            future.set_result(fn(*args))
+            submitted.append(weakref.ref(future))
+            return future
+
+        def shutdown(self):
+            pass
+
+    monkeypatch.setattr(cr, 'ProcessPoolExecutor', SerialExecutor)
+    files = [os.path.join(TEST_DATA_DIR, 'csv_testdata_10_rows.dat')] * 5
+
+    for i, result in enumerate(cr.iter_files_data(files, processes=2)):
+        assert result.error is None
+        assert len(submitted) <= i + 2
+        assert all(future_ref() is None for future_ref in submitted[:i - i % 2])
+
+    assert len(submitted) == len(files)
@@ -2,9 +2,10 @@
 # -*- coding: utf-8 -*-
 
 import os
+import tempfile
 
 from campbellsciparser import cr
-from campbellsciparser.dataset import DataSet
+from campbellsciparser.dataset import DataSet, Row
 
 TEST_DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data')
 
@@ -100,3 +101,101 @@ def test_compare_data_ten_rows_lookup():
     ])
 
     assert len(data_mixed) == len(data_split_translated_merged)
+
+
+def test_compare_data_compact_rows():
+    file = os.path.join(TEST_DATA_DIR, 'csv_testdata_mixed_array_10_rows.dat')
+
+    data = cr.read_mixed_array_data(infile_path=file)
+    data_compact = cr.read_mixed_array_data(infile_path=file, compact_rows=True)
+
+    assert list(data_compact) == list(data)
+
+    data_split = cr.read_array_ids_data(infile_path=file)
+    data_split_compact = cr.read_array_ids_data(infile_path=file, compact_rows=True)
+
+    for array_id, array_id_data in data_split.items():
+        assert list(data_split_compact[array_id]) == list(array_id_data)
+
+
+def test_read_array_ids_data_equals_filtered_mixed_data():
+    file = os.path.join(TEST_DATA_DIR, 'csv_testdata_mixed_array_10_rows.dat')
+
+    data_mixed = cr.read_mixed_array_data(infile_path=file)
+    data_filtered = cr.filter_mixed_array_data(data_mixed, '203', '210')
+    data_split = cr.read_array_ids_data(
+        infile_path=file, array_id_names={'203': 'Hourly', '210': ''})
+
+    assert set(data_split.keys()) == {'Hourly', '210'}
+    assert tuple(data_split['Hourly']) == tuple(data_filtered['203'])
+    assert tuple(data_split['210']) == tuple(data_filtered['210'])
+
+
+def test_read_array_ids_data_rejected_lines():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        file = os.path.join(temp_dir, 'test.dat')
+        with open(file, 'w') as f:
+            f.write('100,2016,.5\n\n"101",2016,1\n1000,2016,2\n101\n100,2016,3\n102,2016,4\n')
+
+        data, cursor = cr.read_array_ids_data(
+            infile_path=file, last_line_num=5, array_id_names={'101': 'Hourly', '100': ''},
+            get_cursor=True)
+
+        assert tuple(data['100']) == (Row([(0, '100'), (1, '2016'), (2, '0.5')]),
+                                      Row([(0, '100'), (1, '2016'), (2, '3')]))
+        assert tuple(data['Hourly']) == (Row([(0, '101'), (1, '2016'), (2, '1')]),
+                                         Row([(0, '101')]))
+        assert cursor.line_num == 6
+
+
+def test_read_array_ids_data_multiline_records():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        file = os.path.join(temp_dir, 'test.dat')
+        with open(file, 'w') as f:
+            f.write('100,"a\n101,b",1\n101,2\n100,5"3\n"100","x""\ny"\n101,3\n')
+
+        data = cr.read_array_ids_data(infile_path=file, array_id_names={'100': '', '101': ''})
+        data_unfiltered = cr.read_array_ids_data(infile_path=file)
+
+        assert tuple(data['100']) == (
+            Row([(0, '100'), (1, 'a\n101,b'), (2, '1')]), Row([(0, '100'), (1, '5"3')]),
+            Row([(0, '100'), (1, 'x"\ny')]))
+        for array_id in ('100', '101'):
+            assert tuple(data[array_id]) == tuple(data_unfiltered[array_id])
+
+
+def test_read_mixed_array_data_columns():
+    file = os.path.join(TEST_DATA_DIR, 'csv_testdata_mixed_array_10_rows.dat')
+
+    data = cr.read_mixed_array_data(infile_path=file)
+    data_columns = cr.read_mixed_array_data(infile_path=file, columns=[0, 3, 12])
+    data_columns_compact = cr.read_mixed_array_data(
+        infile_path=file, columns=[0, 3, 12], compact_rows=True)
+
+    assert list(data_columns) == list(cr.extract_columns_data(data, 0, 3, 12))
+    assert list(data_columns_compact) == list(data_columns)
+    assert data_columns[1][12] == '0.22'
+
+
+def test_read_mixed_array_data_filters():
+    file = os.path.join(TEST_DATA_DIR, 'csv_testdata_mixed_array_10_rows.dat')
+
+    data = cr.read_mixed_array_data(infile_path=file)
+    data_filtered = cr.read_mixed_array_data(
+        infile_path=file, filters={0: '203', 3: lambda value: int(value) >= 2120})
+
+    assert list(data_filtered) == [
+        row for row in data if row[0] == '203' and int(row[3]) >= 2120]
+    assert len(data_filtered) > 0
+
+
+def test_read_mixed_array_data_processes(monkeypatch):
+    monkeypatch.setattr(cr, 'PARALLEL_READ_CHUNK_SIZE', 64)
+    file = os.path.join(TEST_DATA_DIR, 'csv_testdata_mixed_array_10_rows.dat')
+
+    data = cr.read_mixed_array_data(infile_path=file, first_line_num=2, get_cursor=True)
+    parallel_data = cr.read_mixed_array_data(
+        infile_path=file, first_line_num=2, get_cursor=True, processes=3)
+
+    assert list(parallel_data.data) == list(data.data)
+    assert parallel_data.cursor == data.cursor
@@ -2,13 +2,17 @@
 # -*- coding: utf-8 -*-
 
 import os
+import tempfile
 
+from concurrent.futures import Future
 from datetime import datetime
 
 import pytest
 import pytz
 
 from campbellsciparser import cr
+from campbellsciparser.dataset import ColumnarDataSet
+from campbellsciparser.dataset import CompactRow
 from campbellsciparser.dataset import Row
 
 TEST_DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data')
@@ -146,3 +150,184 @@ def test_read_table_data_time_parsed_column_name():
     time_parsed_column_name = list(data_first_row.keys())[0]
 
     assert time_parsed_column_name == expected_time_parsed_column_name
+
+
+def test_read_table_data_columnar():
+    file = os.path.join(TEST_DATA_DIR, 'csv_testdata_10_rows.dat')
+    data = cr.read_table_data(infile_path=file)
+    data_columnar = cr.read_table_data(infile_path=file, columnar=True)
+
+    assert isinstance(data_columnar, ColumnarDataSet)
+    assert list(data_columnar) == list(data)
+
+
+def test_read_table_data_compact_rows():
+    file = os.path.join(TEST_DATA_DIR, 'csv_testdata_3_rows_header.dat')
+    data = cr.read_table_data(infile_path=file, header_row=0)
+    data_compact = cr.read_table_data(infile_path=file, header_row=0, compact_rows=True)
+
+    assert all(isinstance(row, CompactRow) for row in data_compact)
+    assert list(data_compact) == list(data)
+    assert data_compact[0].header is data_compact[2].header
+
+
+def test_read_table_data_compact_rows_parse_time():
+    file = os.path.join(TEST_DATA_DIR, 'csv_testdata_5_rows_time_and_values.dat')
+    read_info = dict(
+        header=['Id', 'Time', 'Value'], parse_time_columns=True, time_parsed_column='TIMESTAMP',
+        time_format_args_library=['%Y-%m-%d %H:%M:%S'], time_columns=['Time'])
+    data = cr.read_table_data(infile_path=file, **read_info)
+    data_compact = cr.read_table_data(infile_path=file, compact_rows=True, **read_info)
+
+    assert all(isinstance(row, CompactRow) for row in data_compact)
+    assert list(data_compact) == list(data)
+    assert list(data_compact[0].keys()) == ['Id', 'TIMESTAMP', 'Value']
+    assert data_compact[0].header is data_compact[4].header
+
+    parser = cr.TableDataParser(compact_rows=True, **read_info)
+    with open(file) as f:
+        rows = parser.feed(f.read()) + parser.close()
+    assert all(isinstance(row, CompactRow) for row in rows)
+    assert rows == list(data)
+
+
+def test_read_table_data_columns():
+    file = os.path.join(TEST_DATA_DIR, 'csv_testdata_3_rows_header.dat')
+    expected_rows = [
+        Row([('Label_0', '1')]),
+        Row([('Label_0', '1')]),
+        Row([('Label_0', '1'), ('Label_2', '3')])
+    ]
+
+    for columns in (['Label_2', 'Label_0'], [0, 'Label_2'], [2, 0, 5]):
+        for compact_rows in (False, True):
+            data = cr.read_table_data(
+                infile_path=file, header_row=0, columns=columns, compact_rows=compact_rows)
+
+            assert list(data) == expected_rows
+
+    file = os.path.join(TEST_DATA_DIR, 'csv_testdata_10_rows.dat')
+    data = cr.read_table_data(infile_path=file)
+
+    assert list(cr.read_table_data(infile_path=file, columns=[1, 3])) == list(
+        cr.extract_columns_data(data, 1, 3))
+
+
+def test_read_table_data_columns_names_before_indices():
+    file = os.path.join(TEST_DATA_DIR, 'csv_testdata_3_rows.dat')
+    expected = [{}, {0: '2'}, {0: '2', 'Label': '3'}]
+
+    for compact_rows in (False, True):
+        data_columns = cr.read_table_data(
+            infile_path=file, header=[1, 0, 'Label'], columns=[0, 2], compact_rows=compact_rows)
+
+        assert [dict(row) for row in data_columns] == expected
+
+    assert cr._select_columns([1, 0], 3, [0, 'Label']) == ((0, ), [1], cr.RowHeader([0]))
+
+
+def test_read_table_data_columns_parse_time():
+    file = os.path.join(TEST_DATA_DIR, 'csv_testdata_5_rows_time_and_values.dat')
+    data = cr.read_table_data(
+        infile_path=file, parse_time_columns=True, time_zone='Etc/GMT-1',
+        time_format_args_library=['%Y-%m-%d %H:%M:%S'], time_parsed_column='TIMESTAMP',
+        time_columns=[1], columns=[2])
+
+    assert data[0] == Row([
+        ('TIMESTAMP', datetime(2016, 1, 1, 19, 30, 15, tzinfo=pytz.timezone('Etc/GMT-1'))),
+        (2, '200')])
+
+
+def test_read_table_data_filters():
+    file = os.path.join(TEST_DATA_DIR, 'csv_testdata_5_rows_time_and_values.dat')
+    data = cr.read_table_data(infile_path=file)
+
+    assert list(cr.read_table_data(infile_path=file, filters={2: '220'})) == [data[2]]
+    assert list(cr.read_table_data(infile_path=file, filters={2: {'200', '240'}})) == [
+        data[0], data[4]]
+    assert list(cr.read_table_data(infile_path=file, filters={
+        0: '100',
+        1: lambda value: '2016-02' <= value < '2016-04',
+        2: lambda value: float(value) > 210
+    })) == [data[2]]
+    assert list(cr.read_table_data(infile_path=file, filters={3: '200'})) == []
+
+    data = cr.read_table_data(
+        infile_path=file, header=['Id', 'Time', 'Value'], filters={'Value': '230'},
+        columns=['Value'])
+
+    assert list(data) == [Row([('Value', '230')])]
+
+
+def test_read_table_data_processes(monkeypatch):
+    monkeypatch.setattr(cr, 'PARALLEL_READ_CHUNK_SIZE', 16)
+    file = os.path.join(TEST_DATA_DIR, 'csv_testdata_5_rows_time_and_values.dat')
+    read_info = dict(
+        header=['Id', 'Time', 'Value'], parse_time_columns=True, time_zone='Etc/GMT-1',
+        time_format_args_library=['%Y-%m-%d %H:%M:%S'], time_columns=['Time'],
+        get_cursor=True)
+
+    for first_line_num, last_line_num in ((0, None), (1, 3), (4, 2), (7, None)):
+        data = cr.read_table_data(
+            infile_path=file, first_line_num=first_line_num, last_line_num=last_line_num,
+            **read_info)
+        parallel_data = cr.read_table_data(
+            infile_path=file, first_line_num=first_line_num, last_line_num=last_line_num,
+            processes=2, **read_info)
+
+        assert list(parallel_data.data) == list(data.data)
+        assert parallel_data.cursor == data.cursor
+
+    file = os.path.join(TEST_DATA_DIR, 'csv_testdata_3_rows_header.dat')
+
+    assert list(cr.read_table_data(infile_path=file, header_row=0, processes=2)) == list(
+        cr.read_table_data(infile_path=file, header_row=0))
+
+
+def test_read_table_data_processes_multiline_records(monkeypatch):
+    monkeypatch.setattr(cr, 'PARALLEL_READ_CHUNK_SIZE', 8)
+    lines = ['Id,Text\n', '1,"a\n', 'b"\n', '2,c\n', '3,"d\n', '\n', 'e\n', '"\n', '4,f\n',
+             '5,"g""\n', 'h"']
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        file = os.path.join(temp_dir, 'multiline.dat')
+        with open(file, 'w') as f:
+            f.write(''.join(lines))
+
+        for first_line_num, last_line_num in ((0, None), (1, None), (3, 7), (6, None)):
+            read_info = dict(header_row=0, first_line_num=first_line_num,
+                             last_line_num=last_line_num, get_cursor=True)
+            data = cr.read_table_data(infile_path=file, **read_info)
+            parallel_data = cr.read_table_data(infile_path=file, processes=2, **read_info)
+
+            assert list(parallel_data.data) == list(data.data)
+            assert parallel_data.cursor == data.cursor
+
+
+def test_read_table_data_processes_bounded(monkeypatch):
+    submitted = []
+
+    class SerialExecutor(object):
+        def __init__(self, max_workers):
+            pass
+
+        def submit(self, fn, *args):
+            future = Future()
+            future.set_result(fn(*args))
+            submitted.append(future)
+            return future
+
+        def shutdown(self):
+            pass
+
+    monkeypatch.setattr(cr, 'PARALLEL_READ_CHUNK_SIZE', 16)
+    monkeypatch.setattr(cr, 'ProcessPoolExecutor', SerialExecutor)
+    file = os.path.join(TEST_DATA_DIR, 'csv_testdata_10_rows.dat')
+
+    data = cr.read_table_data(infile_path=file)
+    parallel_rows = cr._read_in_processes(cr._read_table_data, file, 2)
+
+    assert next(parallel_rows) == data[0]
+    assert len(submitted) == 2
+    assert list(parallel_rows) == list(data)[1:]
+    assert len(submitted) > 2
@@ -0,0 +1,162 @@
+#!/usr/bin/env
+# -*- coding: utf-8 -*-
+
+import math
+import os
+import struct
+import tempfile
+
+from datetime import datetime
+
+import pytest
+import pytz
+
+from campbellsciparser import cr
+from campbellsciparser.dataset import ColumnarDataSet, CompactRow, Row
+
+TOB1_NAMES = ['SECONDS', 'NANOSECONDS', 'RECORD', 'Batt_Volt', 'Temp']
+TOB1_UNITS = ['SECONDS', 'NANOSECONDS', 'RN', 'V', 'Deg C']
+TOB1_PROCESSING = ['', '', '', 'Smp', 'Avg']
+TOB1_DATA_TYPES = ['ULONG', 'ULONG', 'ULONG', 'FP2', 'IEEE4']
+TOB1_RECORD_FORMAT = '<IIIHf'
+
+# Seconds since 1990-01-01 of 2016-01-01 00:00:00
+SECONDS_2016 = 820454400
+
+
+def write_tob1_file(file, records, names=TOB1_NAMES, data_types=TOB1_DATA_TYPES,
+                    record_format=TOB1_RECORD_FORMAT, file_info=None):
+    if file_info is None:
+        file_info = ['TOB1', '123', 'CR1000', '1234', 'CR1000.Std.22', 'CPU:test.CR1', '1234',
+                     'Table1']
+
+    header_lines = [file_info, names, TOB1_UNITS[:len(names)], TOB1_PROCESSING[:len(names)],
+                    data_types]
+    with open(file, 'wb') as f:
+        for line in header_lines:
+            f.write((','.join('"{0}"'.format(value) for value in line) + '\r\n').encode())
+        for record in records:
+            f.write(struct.pack(record_format, *record))
+
+
+def fp2(sign, exponent, mantissa):
+    return struct.unpack('<H', struct.pack('>H', sign << 15 | exponent << 13 | mantissa))[0]
+
+
+def test_read_tob1_data():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        file = os.path.join(temp_dir, 'test.dat')
+        write_tob1_file(file, [
+            (SECONDS_2016, 500000000, 0, fp2(0, 2, 1254), 21.5),
+            (SECONDS_2016 + 60, 0, 1, fp2(1, 1, 12), -3.25),
+        ])
+
+        data = cr.read_tob1_data(file)
+
+        assert tuple(data) == (
+            Row([('TIMESTAMP', datetime(2016, 1, 1, 0, 0, 0, 500000, tzinfo=pytz.UTC)),
+                 ('RECORD', 0), ('Batt_Volt', 12.54), ('Temp', 21.5)]),
+            Row([('TIMESTAMP', datetime(2016, 1, 1, 0, 1, 0, tzinfo=pytz.UTC)),
+                 ('RECORD', 1), ('Batt_Volt', -1.2), ('Temp', -3.25)]),
+        )
+
+
+def test_read_tob1_data_fp2_special_values():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        file = os.path.join(temp_dir, 'test.dat')
+        write_tob1_file(
+            file, [(fp2(0, 0, 0x1FFF), ), (fp2(1, 0, 0x1FFF), ), (fp2(1, 0, 0x1FFE), )],
+            names=['Value'], data_types=['FP2'], record_format='<H')
+
+        values = [row['Value'] for row in cr.read_tob1_data(file)]
+
+        assert values[:2] == [float('inf'), float('-inf')]
+        assert math.isnan(values[2])
+
+
+def test_read_tob1_data_time_zone():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        file = os.path.join(temp_dir, 'test.dat')
+        write_tob1_file(file, [(SECONDS_2016, 0, 0, 0, 0.0)])
+
+        row = cr.read_tob1_data(file, time_zone='Europe/Stockholm', to_utc=True)[0]
+
+        assert row['TIMESTAMP'] == datetime(2015, 12, 31, 23, 0, 0, tzinfo=pytz.UTC)
+
+
+def test_read_tob1_data_line_nums():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        file = os.path.join(temp_dir, 'test.dat')
+        write_tob1_file(file, [(SECONDS_2016 + i, 0, i, 0, 0.0) for i in range(10)])
+
+        data = cr.read_tob1_data(file, first_line_num=cr.TOB1_HEADER_LINES + 3,
+                                 last_line_num=cr.TOB1_HEADER_LINES + 5)
+
+        assert [row['RECORD'] for row in data] == [3, 4, 5]
+
+
+def test_read_tob1_data_partial_record():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        file = os.path.join(temp_dir, 'test.dat')
+        write_tob1_file(file, [(SECONDS_2016 + i, 0, i, 0, 0.0) for i in range(3)])
+        with open(file, 'ab') as f:
+            f.write(b'\x01\x02\x03')
+
+        assert len(cr.read_tob1_data(file)) == 3
+
+
+def test_read_tob1_data_ascii_and_bool():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        file = os.path.join(temp_dir, 'test.dat')
+        write_tob1_file(
+            file, [(b'abc', 1, -5), (b'abcdef', 0, 7)], names=['Name', 'Flag', 'Count'],
+            data_types=['ASCII(6)', 'BOOL4', 'LONG'], record_format='<6sIi')
+
+        data = cr.read_tob1_data(file)
+
+        assert tuple(data) == (
+            Row([('Name', 'abc'), ('Flag', True), ('Count', -5)]),
+            Row([('Name', 'abcdef'), ('Flag', False), ('Count', 7)]),
+        )
+
+
+def test_read_tob1_data_compact_rows_and_columnar():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        file = os.path.join(temp_dir, 'test.dat')
+        write_tob1_file(file, [(SECONDS_2016 + i, 0, i, 0, float(i)) for i in range(5)])
+
+        data = cr.read_tob1_data(file)
+        compact_data = cr.read_tob1_data(file, compact_rows=True)
+        columnar_data = cr.read_tob1_data(file, columnar=True)
+
+        assert all(isinstance(row, CompactRow) for row in compact_data)
+        assert isinstance(columnar_data, ColumnarDataSet)
+        assert tuple(compact_data) == tuple(data)
+        assert tuple(columnar_data) == tuple(data)
+
+
+def test_read_tob1_data_not_tob1():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        file = os.path.join(temp_dir, 'test.dat')
+        write_tob1_file(file, [], file_info=['TOA5', 'Station'])
+
+        with pytest.raises(cr.FileFormatError):
+            cr.read_tob1_data(file)
+
+
+def test_read_tob1_data_unsupported_data_type():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        file = os.path.join(temp_dir, 'test.dat')
+        write_tob1_file(file, [], names=['Value'], data_types=['FP4'], record_format='<')
+
+        with pytest.raises(cr.FileFormatError):
+            cr.read_tob1_data(file)
+
+
+def test_read_tob1_data_unknown_time_zone():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        file = os.path.join(temp_dir, 'test.dat')
+        write_tob1_file(file, [])
+
+        with pytest.raises(cr.UnknownPytzTimeZoneError):
+            cr.read_tob1_data(file, time_zone='Not/A_Zone')
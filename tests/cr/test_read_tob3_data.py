@@ -0,0 +1,192 @@
+#!/usr/bin/env
+# -*- coding: utf-8 -*-
+
+import os
+import struct
+import tempfile
+
+from datetime import datetime
+
+import pytest
+import pytz
+
+from campbellsciparser import cr
+from campbellsciparser.dataset import ColumnarDataSet, CompactRow, Row
+
+TOB3_NAMES = ['Batt_Volt', 'Temp']
+TOB3_DATA_TYPES = ['FP2', 'IEEE4']
+TOB3_RECORD_FORMAT = '<Hf'
+TOB3_RECORD_SIZE = struct.calcsize(TOB3_RECORD_FORMAT)
+TOB3_RECORDS_PER_FRAME = 3
+TOB3_FRAME_SIZE = (
+    cr.TOB3_FRAME_HEADER_SIZE + TOB3_RECORDS_PER_FRAME * TOB3_RECORD_SIZE +
+    cr.TOB3_FRAME_FOOTER_SIZE)
+VALIDATION_STAMP = 0x1234
+MINOR_FRAME = 0x4000
+EMPTY_FRAME = 0x2000
+
+# Seconds since 1990-01-01 of 2016-01-01 00:00:00
+SECONDS_2016 = 820454400
+
+
+def tob3_header(file_info=None):
+    if file_info is None:
+        file_info = ['TOB3', 'Station', 'CR1000X', '1234', 'CR1000X.Std.03', 'CPU:test.CR1X',
+                     '1234', '2016-01-01 00:00:00']
+    header_lines = [
+        file_info,
+        ['Table1', '1 MIN', str(TOB3_FRAME_SIZE), '1000', str(VALIDATION_STAMP), 'Sec100Usec',
+         '0', '0', '0'],
+        TOB3_NAMES, ['V', 'Deg C'], ['Smp', 'Avg'], TOB3_DATA_TYPES
+    ]
+
+    return b''.join(
+        (','.join('"{0}"'.format(value) for value in line) + '\r\n').encode()
+        for line in header_lines)
+
+
+def tob3_frame(minutes, record_num, temps, validation_stamp=VALIDATION_STAMP, flags=0):
+    frame = struct.pack('<III', SECONDS_2016 + minutes * 60, 0, record_num)
+    for temp in temps:
+        frame += struct.pack(TOB3_RECORD_FORMAT, 0, temp)
+    frame += b'\0' * (TOB3_RECORDS_PER_FRAME - len(temps)) * TOB3_RECORD_SIZE
+
+    return frame + struct.pack('<I', validation_stamp << 16 | flags)
+
+
+def tob3_minor_frame(minutes, record_num, temps):
+    minor_frame_size = (
+        cr.TOB3_FRAME_HEADER_SIZE + len(temps) * TOB3_RECORD_SIZE + cr.TOB3_FRAME_FOOTER_SIZE)
+    minor_frame = struct.pack('<III', SECONDS_2016 + minutes * 60, 0, record_num)
+    for temp in temps:
+        minor_frame += struct.pack(TOB3_RECORD_FORMAT, 0, temp)
+    minor_frame += struct.pack('<I', VALIDATION_STAMP << 16 | MINOR_FRAME | minor_frame_size)
+
+    return b'\0' * (TOB3_FRAME_SIZE - minor_frame_size) + minor_frame
+
+
+def write_tob3_file(file, frames, header=None):
+    with open(file, 'wb') as f:
+        f.write(tob3_header() if header is None else header)
+        for frame in frames:
+            f.write(frame)
+
+
+def test_read_tob3_data():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        file = os.path.join(temp_dir, 'test.dat')
+        write_tob3_file(file, [tob3_frame(0, 10, [1.0, 2.0, 3.0])])
+
+        data = cr.read_tob3_data(file)
+
+        assert tuple(data) == tuple(
+            Row([('TIMESTAMP', datetime(2016, 1, 1, 0, i, tzinfo=pytz.UTC)), ('RECORD', 10 + i),
+                 ('Batt_Volt', 0.0), ('Temp', float(i + 1))])
+            for i in range(3))
+
+
+def test_read_tob3_data_ring_order():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        file = os.path.join(temp_dir, 'test.dat')
+        write_tob3_file(file, [
+            tob3_frame(6, 6, [6.0, 7.0, 8.0], validation_stamp=0xFFFF ^ VALIDATION_STAMP),
+            tob3_frame(0, 0, [0.0, 1.0, 2.0]),
+            tob3_frame(3, 3, [3.0, 4.0, 5.0]),
+        ])
+
+        data = cr.read_tob3_data(file)
+
+        assert [row['RECORD'] for row in data] == list(range(9))
+        assert [row['Temp'] for row in data] == [float(i) for i in range(9)]
+
+
+def test_read_tob3_data_invalid_frames():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        file = os.path.join(temp_dir, 'test.dat')
+        write_tob3_file(file, [
+            tob3_frame(0, 0, [0.0, 1.0, 2.0]),
+            tob3_frame(3, 3, [3.0, 4.0, 5.0], validation_stamp=0x4321),
+            tob3_frame(6, 6, [6.0, 7.0, 8.0], flags=EMPTY_FRAME),
+            tob3_minor_frame(9, 9, [9.0]),
+        ])
+        with open(file, 'ab') as f:
+            f.write(b'\0' * 5)
+
+        data = cr.read_tob3_data(file)
+
+        assert [row['RECORD'] for row in data] == [0, 1, 2, 9]
+
+
+def test_read_tob3_data_time_range():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        file = os.path.join(temp_dir, 'test.dat')
+        write_tob3_file(file, [tob3_frame(i, i, [float(i), i + 1.0, i + 2.0])
+                               for i in range(0, 30, 3)])
+
+        data = cr.read_tob3_data(
+            file, from_timestamp=datetime(2016, 1, 1, 0, 4, tzinfo=pytz.UTC),
+            to_timestamp=datetime(2016, 1, 1, 0, 10, tzinfo=pytz.UTC))
+
+        assert [row['RECORD'] for row in data] == list(range(4, 11))
+
+
+def test_read_tob3_data_time_zone():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        file = os.path.join(temp_dir, 'test.dat')
+        write_tob3_file(file, [tob3_frame(0, 0, [0.0, 1.0, 2.0])])
+
+        data = cr.read_tob3_data(file, time_zone='Europe/Stockholm', to_utc=True)
+
+        assert data[2]['TIMESTAMP'] == datetime(2015, 12, 31, 23, 2, tzinfo=pytz.UTC)
+
+
+def test_read_tob3_data_processes():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        file = os.path.join(temp_dir, 'test.dat')
+        write_tob3_file(file, [tob3_frame(i, i, [float(i), i + 1.0, i + 2.0])
+                               for i in range(0, 3000, 3)])
+
+        data = cr.read_tob3_data(file)
+        parallel_data = cr.read_tob3_data(file, processes=2)
+
+        assert len(data) == 3000
+        assert tuple(parallel_data) == tuple(data)
+
+
+def test_read_tob3_data_compact_rows_and_columnar():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        file = os.path.join(temp_dir, 'test.dat')
+        write_tob3_file(file, [tob3_frame(0, 0, [0.0, 1.0, 2.0]), tob3_minor_frame(3, 3, [3.0])])
+
+        data = cr.read_tob3_data(file)
+        compact_data = cr.read_tob3_data(file, compact_rows=True)
+        columnar_data = cr.read_tob3_data(file, columnar=True)
+
+        assert all(isinstance(row, CompactRow) for row in compact_data)
+        assert isinstance(columnar_data, ColumnarDataSet)
+        assert tuple(compact_data) == tuple(data)
+        assert tuple(columnar_data) == tuple(data)
+
+
+def test_read_tob3_frames():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        file = os.path.join(temp_dir, 'test.dat')
+        write_tob3_file(file, [tob3_frame(3, 3, [3.0, 4.0]), tob3_frame(0, 0, [0.0, 1.0, 2.0])])
+        data_offset = len(tob3_header())
+
+        frames = cr.read_tob3_frames(file)
+
+        assert frames == [
+            cr.TOB3Frame(
+                data_offset + TOB3_FRAME_SIZE, datetime(2016, 1, 1, tzinfo=pytz.UTC), 0, 3),
+            cr.TOB3Frame(data_offset, datetime(2016, 1, 1, 0, 3, tzinfo=pytz.UTC), 3, 3),
+        ]
+
+
+def test_read_tob3_data_not_tob3():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        file = os.path.join(temp_dir, 'test.dat')
+        write_tob3_file(file, [], header=tob3_header(file_info=['TOB1', 'Station']))
+
+        with pytest.raises(cr.FileFormatError):
+            cr.read_tob3_data(file)
@@ -3,7 +3,7 @@
 
 import os
 
-from datetime import datetime
+from datetime import datetime, timedelta
 
 import pytest
 import pytz
@@ -15,6 +15,99 @@ from campbellsciparser.dataset import Row
 TEST_DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data')
 
 
+def test_compile_time_format_equals_strptime():
+    time_formats_values = [
+        (['%Y', '%j', '%H%M'], ['2016', '60', '5']),
+        (['%Y', '%j', '%H%M'], ['2015', '366', '2359']),
+        (['%y', '%j', '%H%M'], ['69', '001', '945']),
+        (['%Y', '%m', '%d', '%H', '%M', '%S'], ['2016', '2', '29', '22', '15', '30']),
+        (['%Y-%m-%d %H:%M:%S'], ['2016-01-01 22:15:30']),
+        (['%Y-%m-%d %H:%M:%S.%f'], ['2016-01-01 22:15:30.25']),
+        (['%Y-%m-%d %H:%M:%S'], ['2016-1-1 22:15:30']),
+        (['%Y', '%j'], ['2016', '60', '1200']),
+        (['%d/%m/%Y'], ['01/02/2016']),
+    ]
+
+    for time_format_args_library, time_values in time_formats_values:
+        parsed_time_format, parsed_time = cr._parse_custom_time_formats(
+            time_format_args_library, *time_values)
+        time_format = cr._compile_time_format(time_format_args_library)
+
+        assert time_format(*time_values) == datetime.strptime(parsed_time, parsed_time_format)
+
+
+def test_compile_time_format_raise_value_error():
+    time_formats_values = [
+        (['%Y', '%j', '%H%M'], ['2016', '0', '5']),
+        (['%Y', '%j', '%H%M'], ['2016', '60', '960']),
+        (['%Y', '%m', '%d'], ['2016', '2', '30']),
+        (['%Y-%m-%d %H:%M:%S'], ['2016-01-01 24:00:00']),
+    ]
+
+    for time_format_args_library, time_values in time_formats_values:
+        with pytest.raises(ValueError):
+            cr._compile_time_format(time_format_args_library)(*time_values)
+
+
+def test_time_zone_localizer_equals_pytz():
+    pytz_time_zone = pytz.timezone('Europe/Stockholm')
+    localizer = cr._time_zone_localizer(pytz_time_zone)
+    naive_datetimes = [
+        datetime(2016, 1, 1, 12, 0, 0),
+        datetime(2016, 3, 27, 2, 30, 0),  # Non-existent
+        datetime(2016, 7, 1, 12, 0, 0),
+        datetime(2016, 10, 30, 2, 30, 0),  # Ambiguous
+        datetime(1850, 1, 1, 0, 0, 0),
+        datetime(2100, 7, 1, 0, 0, 0),
+    ]
+
+    for dt in naive_datetimes:
+        local_dt = localizer.localize(dt)
+        expected_dt = pytz_time_zone.localize(dt)
+
+        assert local_dt == expected_dt
+        assert local_dt.tzinfo is expected_dt.tzinfo
+        assert localizer.localize(dt, to_utc=True) == expected_dt.astimezone(pytz.utc)
+
+
+def test_time_zone_localizer_from_datetime():
+    pytz_time_zone = pytz.timezone('America/New_York')
+    localizer = cr._time_zone_localizer(pytz_time_zone)
+    utc_dt = datetime(2016, 11, 6, 4, 0, 0, tzinfo=pytz.utc)
+
+    for minutes in range(0, 240, 30):
+        dt = utc_dt + timedelta(minutes=minutes)
+        converted_dt = localizer.from_datetime(dt)
+        expected_dt = dt.astimezone(pytz_time_zone)
+
+        assert converted_dt == expected_dt
+        assert converted_dt.tzinfo is expected_dt.tzinfo
+
+
+def test_time_zone_localizer_static_time_zones():
+    dt = datetime(2016, 7, 1, 12, 0, 0)
+
+    for pytz_time_zone in (pytz.UTC, pytz.FixedOffset(90), pytz.timezone('Etc/GMT-1')):
+        localizer = cr._TimeZoneLocalizer(pytz_time_zone)
+        expected_dt = pytz_time_zone.localize(dt)
+
+        assert not localizer.arithmetic
+        assert localizer.localize(dt) == expected_dt
+        assert localizer.localize(dt).tzinfo is expected_dt.tzinfo
+        assert localizer.localize(dt, to_utc=True) == expected_dt.astimezone(pytz.utc)
+        assert localizer.localize(dt, to_utc=True).tzinfo is pytz.utc
+        assert localizer.from_datetime(dt.replace(tzinfo=pytz.utc)) == (
+            dt.replace(tzinfo=pytz.utc).astimezone(pytz_time_zone))
+        with pytest.raises(ValueError):
+            localizer.localize(expected_dt)
+
+
+def test_time_zone_localizer_raise_value_error():
+    localizer = cr._time_zone_localizer(pytz.timezone('Europe/Stockholm'))
+    with pytest.raises(ValueError):
+        localizer.localize(datetime(2016, 1, 1, tzinfo=pytz.utc))
+
+
 def test_datetime_to_string_no_time_zone():
     time_zone = 'Europe/Stockholm'
     pytz_time_zone = pytz.timezone(time_zone)
@@ -194,6 +287,69 @@ def test_parse_time_from_data_row_replace_column():
     assert expected_datetime == data_time_converted_first_row_dt
 
 
+def test_parse_time_row_by_row_by_default(monkeypatch):
+    def parse_time_columns(*args, **kwargs):
+        raise AssertionError("Parsed in batches")
+
+    monkeypatch.setattr(cr, '_parse_time_columns', parse_time_columns)
+    data = DataSet([Row([('Label_1', '2016-05-02 12:34:15')]),
+                    Row([('Label_1', '2016-05-02 12:35:15')])])
+
+    parsed_data = cr.parse_time(
+        data, time_zone='UTC', time_format_args_library=['%Y-%m-%d %H:%M:%S'],
+        time_columns=['Label_1'])
+
+    assert [row['Label_1'] for row in parsed_data] == [
+        datetime(2016, 5, 2, 12, 34, 15, tzinfo=pytz.UTC),
+        datetime(2016, 5, 2, 12, 35, 15, tzinfo=pytz.UTC)]
+
+
+def test_parse_time_batches_equal_row_by_row():
+    time_values = [
+        '2016-10-30 01:59:00', '2016-10-30 02:30:00', '2016-10-30 02:30:00',
+        '2016-10-30 03:00:00', '2016-03-27 02:30:00', '2016-03-27  2:30:00'
+    ]
+
+    for time_format_args_library, fraction in (
+            (['%Y-%m-%d %H:%M:%S'], ''), (['%Y-%m-%d %H:%M:%S.%f'], '.5')):
+        data = DataSet([Row([('Label_1', i), ('Label_2', value + fraction)])
+                        for i, value in enumerate(time_values)])
+
+        for to_utc in (False, True):
+            parsed_data = cr.parse_time(
+                data, time_zone='Europe/Stockholm',
+                time_format_args_library=time_format_args_library,
+                time_columns=['Label_2'], to_utc=to_utc, batch_size=None)
+            batch_parsed_data = cr.parse_time(
+                data, time_zone='Europe/Stockholm',
+                time_format_args_library=time_format_args_library,
+                time_columns=['Label_2'], to_utc=to_utc, batch_size=4)
+
+            assert tuple(batch_parsed_data) == tuple(parsed_data)
+            assert [row['Label_2'].tzinfo for row in batch_parsed_data] == (
+                [row['Label_2'].tzinfo for row in parsed_data])
+
+
+def test_parse_time_columns():
+    pytz_time_zone = pytz.timezone('Europe/Stockholm')
+    time_format_args_library = ['%Y', '%j', '%H%M', '%S']
+    time_columns = [
+        ['2016', '2016', '2016', '2016', '2016', '2016'],
+        ['87', '87', '87', '88', '366', '367'],
+        ['145', '230', '0', '230', '2359', '0'],
+        ['0', '15', '0', '15', '59', '0'],
+    ]
+
+    parsed = cr._parse_time_columns(
+        pytz_time_zone, time_format_args_library, *time_columns, ignore_parsing_error=True)
+
+    assert parsed == [
+        cr._parse_time_values(pytz_time_zone, time_format_args_library, *time_values,
+                              ignore_parsing_error=True)
+        for time_values in zip(*time_columns)]
+    assert parsed[-1] == datetime(1970, 1, 1, tzinfo=pytz.UTC)
+
+
 def test_parse_time_no_time_columns_error():
     data = list(Row())
     with pytest.raises(cr.TimeColumnValueError):